@@ -181,24 +181,16 @@ class EntrepreneurshipContentGenerator:
         ))
         
         # Trend 2: Open source
-        open_source_count = sum(
-            1
+        open_source_investments = [
+            inv
             for inv in investments
             if (
                 'open' in (inv.investee.description or '').lower()
                 or (inv.details is not None and 'open' in inv.details.lower())
             )
-        )
+        ]
         
-        if open_source_count > 0:
-            open_source_investments = [
-                inv
-                for inv in investments
-                if (
-                    'open' in (inv.investee.description or '').lower()
-                    or (inv.details is not None and 'open' in inv.details.lower())
-                )
-            ]
+        if open_source_investments:
             trends.append(MarketTrend(
                 trend_name="Open Source AI Models Rising",
                 description="Open-source AI is attracting significant capital as companies seek alternatives "
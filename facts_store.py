@@ -15,12 +15,14 @@ This is intentionally minimal; we can evolve it into a richer ETL later.
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import asdict
 from datetime import datetime
 from hashlib import sha1
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from models import Company, FactSource, Investment
 from newsletter_factory import InvestmentStage
@@ -72,19 +74,134 @@ def event_fact_id(event: Any) -> str:
     return "evt:" + sha1(fp.encode("utf-8")).hexdigest()[:20]
 
 
+def _source_rows(parent_id: str, fact: Any) -> List[Tuple[Any, ...]]:
+    """`sources` rows (minus parent_type) for a fact's FactSources."""
+    rows = []
+    for s in list(getattr(fact, "sources", []) or []):
+        retrieved_at = getattr(s, "retrieved_at", None)
+        rows.append(
+            (
+                parent_id,
+                getattr(s, "source_name", "") or "",
+                getattr(s, "url", None),
+                retrieved_at.isoformat() if retrieved_at else None,
+                getattr(s, "evidence_quote", None),
+            )
+        )
+    return rows
+
+
 class FactsStore:
-    def __init__(self, db_path: str | Path = "cache/facts.sqlite"):
+    MEMORY = ":memory:"
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Args:
+            db_path: SQLite file, or ":memory:" for a throwaway store (tests,
+                build-then-`backup_to` runs). Defaults to $NEWSLETTER_FACTORY_DB,
+                else cache/facts.sqlite.
+        """
+        if db_path is None:
+            db_path = os.environ.get("NEWSLETTER_FACTORY_DB") or "cache/facts.sqlite"
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # An in-memory database lives only as long as its connection: keep one open.
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        if str(db_path) == self.MEMORY:
+            self._memory_conn = self._open(self.MEMORY)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Committed investment ids / source keys, loaded on first upsert. Rows are
+        # never deleted, so anything in these sets can skip its INSERT entirely.
+        self._known_investment_ids: Optional[Set[str]] = None
+        self._known_investment_sources: Optional[Set[Tuple[str, str, str, str]]] = None
+        # Keys written in an open transaction (by connection); merged on commit.
+        self._pending_keys: Dict[int, List[Tuple[Set[Any], List[Any]]]] = {}
         self._init_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return self._open(str(self.db_path))
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if conn is not self._memory_conn:
+            conn.close()
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(target)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
+        # WAL makes NORMAL crash-safe (a power loss can only drop the last commits).
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
         return conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """One write transaction; pass the connection to several upserts to commit them together."""
+        conn = self._connect()
+        pending = self._pending_keys[id(conn)] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+            for known, keys in pending:
+                known.update(keys)
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._pending_keys.pop(id(conn), None)
+            self._release(conn)
+
+    def backup_to(self, db_path: str | Path) -> None:
+        """Copy the whole database to `db_path` (e.g. to persist an in-memory store)."""
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        src = self._connect()
+        dest = sqlite3.connect(str(db_path))
+        try:
+            src.backup(dest)
+        finally:
+            dest.close()
+            self._release(src)
+
+    def _remember_on_commit(self, conn: sqlite3.Connection, known: Set[Any], keys: List[Any]) -> None:
+        pending = self._pending_keys.get(id(conn))
+        if pending is not None:  # a connection from transaction(); others aren't tracked
+            pending.append((known, keys))
+
+    def _investment_keys(self) -> Tuple[Set[str], Set[Tuple[str, str, str, str]]]:
+        if self._known_investment_ids is None or self._known_investment_sources is None:
+            conn = self._connect()
+            try:
+                ids = {r[0] for r in conn.execute("SELECT id FROM investments")}
+                # Same identity as idx_sources_dedupe.
+                sources = {
+                    tuple(r)
+                    for r in conn.execute(
+                        "SELECT parent_id, source_name, IFNULL(url, ''), IFNULL(evidence_quote, '') "
+                        "FROM sources WHERE parent_type = 'investment'"
+                    )
+                }
+            finally:
+                self._release(conn)
+            self._known_investment_ids = ids
+            self._known_investment_sources = sources
+        return self._known_investment_ids, self._known_investment_sources
+
+    @contextmanager
+    def _writer(self, conn: Optional[sqlite3.Connection]) -> Iterator[sqlite3.Connection]:
+        # Join the caller's transaction, or run in our own.
+        if conn is not None:
+            yield conn
+        else:
+            with self.transaction() as own:
+                yield own
+
     def _init_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(
@@ -128,8 +245,7 @@ class FactsStore:
                   source_name TEXT NOT NULL,
                   url TEXT,
                   retrieved_at TEXT,
-                  evidence_quote TEXT,
-                  UNIQUE(parent_type, parent_id, source_name, url, evidence_quote)
+                  evidence_quote TEXT
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_sources_parent ON sources(parent_type, parent_id);
@@ -137,29 +253,72 @@ class FactsStore:
                 CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
                 """
             )
-
-    def upsert_investments(self, investments: Iterable[Investment]) -> Dict[str, int]:
-        inserted = 0
-        sources_inserted = 0
-
-        with self._connect() as conn:
-            for inv in investments:
-                inv_id = investment_fact_id(inv)
-
-                investor = getattr(inv, "investor", None)
-                investee = getattr(inv, "investee", None)
-
-                stage = getattr(getattr(inv, "stage", None), "value", None)
-                date = getattr(inv, "date", None)
-                date_iso = date.isoformat() if isinstance(date, datetime) else None
-
-                try:
-                    amount = float(inv.amount)
-                except Exception:
-                    # Skip unparseable amounts (should already be filtered by validation).
-                    continue
-
-                row = (
+            self._ensure_sources_dedupe_index(conn)
+
+    @staticmethod
+    def _ensure_sources_dedupe_index(conn: sqlite3.Connection) -> None:
+        # A plain UNIQUE(..., url, evidence_quote) never fires when either is NULL
+        # (NULLs compare distinct), so sources without a URL were re-inserted on
+        # every run. Dedupe on IFNULL'd columns instead; drop existing duplicates
+        # first so the index can be built on older databases.
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_sources_dedupe'"
+        ).fetchone():
+            return
+        conn.executescript(
+            """
+            DELETE FROM sources WHERE id NOT IN (
+              SELECT MIN(id) FROM sources
+              GROUP BY parent_type, parent_id, source_name, IFNULL(url, ''), IFNULL(evidence_quote, '')
+            );
+            CREATE UNIQUE INDEX idx_sources_dedupe ON sources(
+              parent_type, parent_id, source_name, IFNULL(url, ''), IFNULL(evidence_quote, '')
+            );
+            """
+        )
+
+    def upsert_investments(
+        self, investments: Iterable[Investment], *, conn: Optional[sqlite3.Connection] = None
+    ) -> Dict[str, int]:
+        rows: List[Tuple[Any, ...]] = []
+        source_rows: List[Tuple[Any, ...]] = []
+        new_ids: List[str] = []
+        new_source_keys: List[Tuple[str, str, str, str]] = []
+        ingested_at = _utc_now_iso()
+        known_ids, known_sources = self._investment_keys()
+        batch_ids: Set[str] = set()
+        batch_sources: Set[Tuple[str, str, str, str]] = set()
+
+        for inv in investments:
+            try:
+                amount = float(inv.amount)
+            except Exception:
+                # Skip unparseable amounts (should already be filtered by validation).
+                continue
+
+            inv_id = investment_fact_id(inv)
+
+            # Re-ingested facts only need their new sources (if any).
+            for row in _source_rows(inv_id, inv):
+                key = (row[0], row[1], row[2] or "", row[4] or "")
+                if key not in known_sources and key not in batch_sources:
+                    batch_sources.add(key)
+                    new_source_keys.append(key)
+                    source_rows.append(row)
+            if inv_id in known_ids or inv_id in batch_ids:
+                continue
+            batch_ids.add(inv_id)
+            new_ids.append(inv_id)
+
+            investor = getattr(inv, "investor", None)
+            investee = getattr(inv, "investee", None)
+
+            stage = getattr(getattr(inv, "stage", None), "value", None)
+            date = getattr(inv, "date", None)
+            date_iso = date.isoformat() if isinstance(date, datetime) else None
+
+            rows.append(
+                (
                     inv_id,
                     getattr(investor, "name", "") or "",
                     getattr(investee, "name", "") or "",
@@ -171,59 +330,52 @@ class FactsStore:
                     getattr(investor, "sector", None),
                     getattr(inv, "details", None),
                     getattr(inv, "confidence", None),
-                    _utc_now_iso(),
-                )
-
-                # Insert if new, otherwise keep the existing row (don’t overwrite history).
-                cur = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO investments(
-                      id, investor_name, investee_name, amount_m_usd, stage, date,
-                      investee_sector, investee_description, investor_sector, details,
-                      confidence, ingested_at
-                    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-                    """,
-                    row,
+                    ingested_at,
                 )
-                if cur.rowcount:
-                    inserted += 1
-
-                # Insert sources (deduped by UNIQUE constraint)
-                for s in list(getattr(inv, "sources", []) or []):
-                    cur2 = conn.execute(
-                        """
-                        INSERT OR IGNORE INTO sources(parent_type, parent_id, source_name, url, retrieved_at, evidence_quote)
-                        VALUES ('investment',?,?,?,?,?)
-                        """,
-                        (
-                            inv_id,
-                            getattr(s, "source_name", "") or "",
-                            getattr(s, "url", None),
-                            getattr(s, "retrieved_at", None).isoformat() if getattr(s, "retrieved_at", None) else None,
-                            getattr(s, "evidence_quote", None),
-                        ),
-                    )
-                    if cur2.rowcount:
-                        sources_inserted += 1
+            )
 
-            conn.commit()
+        with self._writer(conn) as c:
+            # Insert if new, otherwise keep the existing row (don’t overwrite history).
+            inserted = c.executemany(
+                """
+                INSERT OR IGNORE INTO investments(
+                  id, investor_name, investee_name, amount_m_usd, stage, date,
+                  investee_sector, investee_description, investor_sector, details,
+                  confidence, ingested_at
+                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+                """,
+                rows,
+            ).rowcount
+            # Sources are deduped by idx_sources_dedupe.
+            sources_inserted = c.executemany(
+                """
+                INSERT OR IGNORE INTO sources(parent_type, parent_id, source_name, url, retrieved_at, evidence_quote)
+                VALUES ('investment',?,?,?,?,?)
+                """,
+                source_rows,
+            ).rowcount
+            self._remember_on_commit(c, known_ids, new_ids)
+            self._remember_on_commit(c, known_sources, new_source_keys)
 
         return {"investments_inserted": inserted, "sources_inserted": sources_inserted}
 
-    def upsert_events(self, events: Iterable[Any]) -> Dict[str, int]:
-        inserted = 0
-        sources_inserted = 0
+    def upsert_events(
+        self, events: Iterable[Any], *, conn: Optional[sqlite3.Connection] = None
+    ) -> Dict[str, int]:
+        rows: List[Tuple[Any, ...]] = []
+        source_rows: List[Tuple[Any, ...]] = []
+        ingested_at = _utc_now_iso()
 
-        with self._connect() as conn:
-            for ev in events:
-                ev_id = event_fact_id(ev)
+        for ev in events:
+            ev_id = event_fact_id(ev)
 
-                date = getattr(ev, "date", None)
-                date_iso = date.isoformat() if isinstance(date, datetime) else None
+            date = getattr(ev, "date", None)
+            date_iso = date.isoformat() if isinstance(date, datetime) else None
 
-                topics = list(getattr(ev, "topics", []) or [])
+            topics = list(getattr(ev, "topics", []) or [])
 
-                row = (
+            rows.append(
+                (
                     ev_id,
                     getattr(ev, "name", "") or "",
                     getattr(ev, "event_type", None),
@@ -237,39 +389,28 @@ class FactsStore:
                     getattr(ev, "cost", None),
                     getattr(ev, "registration_url", None),
                     getattr(ev, "confidence", None),
-                    _utc_now_iso(),
+                    ingested_at,
                 )
+            )
+            source_rows.extend(_source_rows(ev_id, ev))
 
-                cur = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO events(
-                      id, name, event_type, date, location, description, url, organizer,
-                      topics_json, target_audience, cost, registration_url, confidence, ingested_at
-                    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    """,
-                    row,
-                )
-                if cur.rowcount:
-                    inserted += 1
-
-                for s in list(getattr(ev, "sources", []) or []):
-                    cur2 = conn.execute(
-                        """
-                        INSERT OR IGNORE INTO sources(parent_type, parent_id, source_name, url, retrieved_at, evidence_quote)
-                        VALUES ('event',?,?,?,?,?)
-                        """,
-                        (
-                            ev_id,
-                            getattr(s, "source_name", "") or "",
-                            getattr(s, "url", None),
-                            getattr(s, "retrieved_at", None).isoformat() if getattr(s, "retrieved_at", None) else None,
-                            getattr(s, "evidence_quote", None),
-                        ),
-                    )
-                    if cur2.rowcount:
-                        sources_inserted += 1
-
-            conn.commit()
+        with self._writer(conn) as c:
+            inserted = c.executemany(
+                """
+                INSERT OR IGNORE INTO events(
+                  id, name, event_type, date, location, description, url, organizer,
+                  topics_json, target_audience, cost, registration_url, confidence, ingested_at
+                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                """,
+                rows,
+            ).rowcount
+            sources_inserted = c.executemany(
+                """
+                INSERT OR IGNORE INTO sources(parent_type, parent_id, source_name, url, retrieved_at, evidence_quote)
+                VALUES ('event',?,?,?,?,?)
+                """,
+                source_rows,
+            ).rowcount
 
         return {"events_inserted": inserted, "sources_inserted": sources_inserted}
 
@@ -294,81 +435,90 @@ class FactsStore:
             else:
                 rows = conn.execute("SELECT * FROM investments ORDER BY date DESC").fetchall()
 
-            investments: List[Investment] = []
-            for r in rows:
-                inv_id = r["id"]
+            return [self._investment_from_row(conn, r) for r in rows]
 
-                # Load sources
-                srows = conn.execute(
-                    """
-                    SELECT source_name, url, retrieved_at, evidence_quote
-                    FROM sources
-                    WHERE parent_type='investment' AND parent_id=?
-                    """,
-                    (inv_id,),
-                ).fetchall()
+    def fetch_recent_investments(self, limit: int) -> List[Investment]:
+        """The `limit` most recent investments, newest first.
 
-                sources: List[FactSource] = []
-                for sr in srows:
-                    ra = sr["retrieved_at"]
+        Ordered and limited in SQL: the date index is walked backwards, so only
+        `limit` rows (and their sources) are read.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM investments ORDER BY date DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [self._investment_from_row(conn, r) for r in rows]
+
+    def _investment_from_row(self, conn: sqlite3.Connection, r: sqlite3.Row) -> Investment:
+        inv_id = r["id"]
+
+        # Load sources
+        srows = conn.execute(
+            """
+            SELECT source_name, url, retrieved_at, evidence_quote
+            FROM sources
+            WHERE parent_type='investment' AND parent_id=?
+            """,
+            (inv_id,),
+        ).fetchall()
+
+        sources: List[FactSource] = []
+        for sr in srows:
+            ra = sr["retrieved_at"]
+            dt = None
+            if ra:
+                try:
+                    dt = datetime.fromisoformat(ra.replace("Z", ""))
+                except Exception:
                     dt = None
-                    if ra:
-                        try:
-                            dt = datetime.fromisoformat(ra.replace("Z", ""))
-                        except Exception:
-                            dt = None
-                    sources.append(
-                        FactSource(
-                            source_name=sr["source_name"],
-                            url=sr["url"],
-                            retrieved_at=dt,
-                            evidence_quote=sr["evidence_quote"],
-                        )
-                    )
+            sources.append(
+                FactSource(
+                    source_name=sr["source_name"],
+                    url=sr["url"],
+                    retrieved_at=dt,
+                    evidence_quote=sr["evidence_quote"],
+                )
+            )
 
-                # Parse stage
-                stage_val = r["stage"]
+        # Parse stage
+        stage_val = r["stage"]
+        stage = InvestmentStage.SERIES_A
+        if stage_val:
+            try:
+                stage = InvestmentStage(stage_val)
+            except Exception:
                 stage = InvestmentStage.SERIES_A
-                if stage_val:
-                    try:
-                        stage = InvestmentStage(stage_val)
-                    except Exception:
-                        stage = InvestmentStage.SERIES_A
 
-                # Parse date
-                date_iso = r["date"]
+        # Parse date
+        date_iso = r["date"]
+        dt_date = datetime.utcnow()
+        if date_iso:
+            try:
+                dt_date = datetime.fromisoformat(str(date_iso).replace("Z", ""))
+            except Exception:
                 dt_date = datetime.utcnow()
-                if date_iso:
-                    try:
-                        dt_date = datetime.fromisoformat(str(date_iso).replace("Z", ""))
-                    except Exception:
-                        dt_date = datetime.utcnow()
-
-                investor = Company(
-                    name=r["investor_name"],
-                    description=f"Investor in {r['investee_name']}",
-                    sector=r["investor_sector"] or "VC Firm",
-                )
-                investee = Company(
-                    name=r["investee_name"],
-                    description=r["investee_description"] or "",
-                    sector=r["investee_sector"] or "AI",
-                )
-
-                investments.append(
-                    Investment(
-                        investor=investor,
-                        investee=investee,
-                        amount=float(r["amount_m_usd"]),
-                        stage=stage,
-                        date=dt_date,
-                        details=r["details"],
-                        sources=sources,
-                        confidence=float(r["confidence"]) if r["confidence"] is not None else 0.5,
-                    )
-                )
 
-            return investments
+        investor = Company(
+            name=r["investor_name"],
+            description=f"Investor in {r['investee_name']}",
+            sector=r["investor_sector"] or "VC Firm",
+        )
+        investee = Company(
+            name=r["investee_name"],
+            description=r["investee_description"] or "",
+            sector=r["investee_sector"] or "AI",
+        )
+
+        return Investment(
+            investor=investor,
+            investee=investee,
+            amount=float(r["amount_m_usd"]),
+            stage=stage,
+            date=dt_date,
+            details=r["details"],
+            sources=sources,
+            confidence=float(r["confidence"]) if r["confidence"] is not None else 0.5,
+        )
 
     def load_events(self, *, days_ahead: int = 90) -> List[Any]:
         """Load events from DB for a date window (best-effort)."""
@@ -9,11 +9,13 @@ The graph is intentionally lightweight (no external deps).
 
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from hashlib import sha1
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from models import Company, FactSource, Investment
 
@@ -29,6 +31,9 @@ class EdgeKind(str, Enum):
     # always carry derivation info + underlying sources.
 
 
+_INVESTED_IN = EdgeKind.INVESTED_IN.value
+
+
 def _norm_name(name: str) -> str:
     return " ".join((name or "").strip().lower().split())
 
@@ -52,6 +57,88 @@ class KGEdge:
     derived_from: List[str] = field(default_factory=list)
 
 
+# (edge_id, src, dst, shared_investee_name, sources, derived_from)
+_PairTuple = Tuple[str, str, str, str, List[FactSource], List[str]]
+
+
+def _safe_int(value: Any) -> int:
+    try:
+        return int(value)
+    except Exception:
+        return 0
+
+
+def _pair_score(t: Tuple[str, str, KGEdge]) -> int:
+    return _safe_int(t[2].attrs.get("shared_count", 0))
+
+
+# Single-pass escaping for DOT labels (quotes would terminate the label).
+_DOT_TRANS = str.maketrans({'"': "'", "\n": " ", "\\": "/"})
+
+
+def _format_amount(amt: Any) -> str:
+    if isinstance(amt, (int, float)):
+        return f" (${float(amt):.1f}M)"
+    return ""
+
+
+def _co_invest_edge_id(a: str, b: str) -> str:
+    lo, hi = (a, b) if a < b else (b, a)
+    fp = "|".join([EdgeKind.CO_INVESTED_WITH.value, lo, hi])
+    return f"edge:{sha1(fp.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _pairs_for_investee(
+    investee_id: str,
+    investee_name: str,
+    edges: List[KGEdge],
+    max_sources_per_edge: int,
+) -> List[_PairTuple]:
+    """Co-investor pairs for a single investee.
+
+    Pure function (no graph access); the graph merges the results.
+    """
+    # Distinct investors for this investee.
+    investors = sorted({e.src for e in edges})
+    if len(investors) < 2:
+        return []
+
+    # Build lookup to fetch underlying edges for (investor -> investee)
+    underlying_by_investor: Dict[str, List[KGEdge]] = {}
+    for e in edges:
+        underlying_by_investor.setdefault(e.src, []).append(e)
+
+    out: List[_PairTuple] = []
+    for i in range(len(investors)):
+        for j in range(i + 1, len(investors)):
+            a = investors[i]
+            b = investors[j]
+
+            # Underlying evidence: all investment edges for these investors into this investee.
+            underlying_edges = (underlying_by_investor.get(a, []) or []) + (underlying_by_investor.get(b, []) or [])
+            derived_from = [ue.id for ue in underlying_edges]
+
+            # Dedupe sources.
+            seen = set()
+            deduped: List[FactSource] = []
+            for ue in underlying_edges:
+                for s in ue.sources or []:
+                    key = (s.source_name, s.url, s.evidence_quote)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    deduped.append(s)
+                    if len(deduped) >= max_sources_per_edge:
+                        break
+                if len(deduped) >= max_sources_per_edge:
+                    break
+
+            # Canonical (undirected) orientation: src=lo, dst=hi; a < b already.
+            out.append((_co_invest_edge_id(a, b), a, b, investee_name, deduped, derived_from))
+
+    return out
+
+
 class KnowledgeGraph:
     """A small in-memory property graph with provenance."""
 
@@ -59,8 +146,20 @@ class KnowledgeGraph:
         self.nodes: Dict[str, KGNode] = {}
         self.edges: Dict[str, KGEdge] = {}
         self._company_key_to_node_id: Dict[str, str] = {}
+        # Raw `Company.name` -> node id, so repeat names skip normalization.
+        self._company_name_to_node_id: Dict[str, str] = {}
+        # INVESTED_IN edges by investor / investee node id, in insertion order.
+        self._by_investor: Dict[str, List[KGEdge]] = defaultdict(list)
+        self._by_investee: Dict[str, List[KGEdge]] = defaultdict(list)
+        # `max_sources_per_edge` of the last derive_co_investments run, reset when
+        # INVESTED_IN edges change; re-deriving an unchanged graph is a no-op.
+        self._co_investments_derived_with: Optional[int] = None
 
     def upsert_company(self, company: Company) -> str:
+        node_id = self._company_name_to_node_id.get(company.name)
+        if node_id is not None:
+            return node_id
+
         name = (company.name or "").strip()
         if not name:
             raise ValueError("company name required")
@@ -68,6 +167,7 @@ class KnowledgeGraph:
         key = _norm_name(name)
         existing = self._company_key_to_node_id.get(key)
         if existing:
+            self._company_name_to_node_id[company.name] = existing
             return existing
 
         node_id = f"company:{sha1(key.encode('utf-8')).hexdigest()[:12]}"
@@ -81,6 +181,7 @@ class KnowledgeGraph:
         node = KGNode(id=node_id, kind=NodeKind.COMPANY, name=name, attrs=attrs)
         self.nodes[node_id] = node
         self._company_key_to_node_id[key] = node_id
+        self._company_name_to_node_id[company.name] = node_id
         return node_id
 
     def add_investment(self, inv: Investment) -> str:
@@ -95,15 +196,17 @@ class KnowledgeGraph:
 
         date = getattr(inv, "date", None)
         date_iso = date.isoformat() if isinstance(date, datetime) else None
+        # Enum `.value` is a property lookup: read it once.
+        stage = getattr(getattr(inv, "stage", None), "value", None)
 
         # Edge ID: stable-ish across runs for same relationship.
         fingerprint = "|".join(
             [
-                EdgeKind.INVESTED_IN.value,
+                _INVESTED_IN,
                 investor_id,
                 investee_id,
                 str(getattr(inv, "amount", "")),
-                str(getattr(getattr(inv, "stage", None), "value", "")),
+                "" if stage is None else str(stage),
                 date_iso or "",
             ]
         )
@@ -111,7 +214,7 @@ class KnowledgeGraph:
 
         attrs: Dict[str, Any] = {
             "amount_m_usd": float(inv.amount),
-            "stage": getattr(getattr(inv, "stage", None), "value", None),
+            "stage": stage,
             "date": date_iso,
         }
 
@@ -126,9 +229,10 @@ class KnowledgeGraph:
                 if key not in seen:
                     existing.sources.append(s)
                     seen.add(key)
+                    self._co_investments_derived_with = None
             return edge_id
 
-        self.edges[edge_id] = KGEdge(
+        edge = KGEdge(
             id=edge_id,
             kind=EdgeKind.INVESTED_IN,
             src=investor_id,
@@ -136,6 +240,10 @@ class KnowledgeGraph:
             attrs=attrs,
             sources=sources,
         )
+        self.edges[edge_id] = edge
+        self._by_investor[investor_id].append(edge)
+        self._by_investee[investee_id].append(edge)
+        self._co_investments_derived_with = None
         return edge_id
 
     def build_from_investments(self, investments: Iterable[Investment]) -> "KnowledgeGraph":
@@ -143,6 +251,10 @@ class KnowledgeGraph:
             self.add_investment(inv)
         return self
 
+    def _node_name(self, node_id: str) -> str:
+        node = self.nodes.get(node_id)
+        return node.name if node else node_id
+
     def derive_co_investments(self, *, max_sources_per_edge: int = 4) -> int:
         """Derive CO_INVESTED_WITH edges from INVESTED_IN edges.
 
@@ -157,117 +269,80 @@ class KnowledgeGraph:
         Returns:
           Number of derived edges created (newly added).
         """
-
-        # Group underlying edges by investee.
-        by_investee: Dict[str, List[KGEdge]] = {}
-        for e in self.edges.values():
-            if e.kind != EdgeKind.INVESTED_IN:
-                continue
-            by_investee.setdefault(e.dst, []).append(e)
+        if self._co_investments_derived_with == max_sources_per_edge:
+            return 0
 
         created = 0
 
-        def _edge_id_for_pair(a: str, b: str) -> str:
-            lo, hi = (a, b) if a < b else (b, a)
-            fp = "|".join([EdgeKind.CO_INVESTED_WITH.value, lo, hi])
-            return f"edge:{sha1(fp.encode('utf-8')).hexdigest()[:16]}"
-
-        for investee_id, edges in by_investee.items():
-            # Distinct investors for this investee.
-            investors = sorted({e.src for e in edges})
-            if len(investors) < 2:
-                continue
-
-            # Build lookup to fetch underlying edges for (investor -> investee)
-            underlying_by_investor: Dict[str, List[KGEdge]] = {}
-            for e in edges:
-                underlying_by_investor.setdefault(e.src, []).append(e)
-
-            investee_node = self.nodes.get(investee_id)
-            investee_name = investee_node.name if investee_node else investee_id
-
-            for i in range(len(investors)):
-                for j in range(i + 1, len(investors)):
-                    a = investors[i]
-                    b = investors[j]
-                    edge_id = _edge_id_for_pair(a, b)
-
-                    # Underlying evidence: all investment edges for these investors into this investee.
-                    underlying_edges = (underlying_by_investor.get(a, []) or []) + (underlying_by_investor.get(b, []) or [])
-                    derived_from = [ue.id for ue in underlying_edges]
-
-                    sources: List[FactSource] = []
-                    for ue in underlying_edges:
-                        sources.extend(list(ue.sources or []))
+        # Underlying edges grouped by investee (maintained by add_investment).
+        for investee_id, edges in self._by_investee.items():
+            pairs = _pairs_for_investee(investee_id, self._node_name(investee_id), edges, max_sources_per_edge)
+            for edge_id, lo, hi, investee_name, deduped, derived_from in pairs:
+                if edge_id in self.edges:
+                    # Merge: increment count if this investee wasn't already counted.
+                    existing = self.edges[edge_id]
+                    if existing.kind != EdgeKind.CO_INVESTED_WITH:
+                        continue
 
-                    # Dedupe sources.
-                    seen = set()
-                    deduped: List[FactSource] = []
-                    for s in sources:
+                    # Track multiple shared investees (set mirrors the list for O(1) membership).
+                    shared = existing.attrs.get("shared_investees")
+                    if not isinstance(shared, list):
+                        shared = []
+                    shared_set = existing.attrs.get("_shared_investees_set")
+                    if not isinstance(shared_set, set):
+                        shared_set = set(shared)
+                        existing.attrs["_shared_investees_set"] = shared_set
+                    if investee_name not in shared_set:
+                        shared.append(investee_name)
+                        shared_set.add(investee_name)
+                        existing.attrs["shared_investees"] = shared
+                        try:
+                            existing.attrs["shared_count"] = int(existing.attrs.get("shared_count", 0)) + 1
+                        except Exception:
+                            existing.attrs["shared_count"] = 1
+
+                    # Merge provenance. Like the investee set, the seen sets persist on
+                    # the edge; rebuilding them per investee made the merge O(n^2).
+                    existing_df = existing.attrs.get("_derived_from_set")
+                    if not isinstance(existing_df, set):
+                        existing_df = set(existing.derived_from)
+                        existing.attrs["_derived_from_set"] = existing_df
+                    for did in derived_from:
+                        if did not in existing_df:
+                            existing.derived_from.append(did)
+                            existing_df.add(did)
+
+                    existing_seen = existing.attrs.get("_source_keys")
+                    if not isinstance(existing_seen, set):
+                        existing_seen = {(s.source_name, s.url, s.evidence_quote) for s in existing.sources}
+                        existing.attrs["_source_keys"] = existing_seen
+                    for s in deduped:
                         key = (s.source_name, s.url, s.evidence_quote)
-                        if key in seen:
-                            continue
-                        seen.add(key)
-                        deduped.append(s)
-                        if len(deduped) >= max_sources_per_edge:
-                            break
-
-                    attrs = {
-                        "shared_investee": investee_name,
-                        "shared_investee_node": investee_id,
+                        if key not in existing_seen:
+                            existing.sources.append(s)
+                            existing_seen.add(key)
+
+                    continue
+
+                # Store as a canonical (undirected) edge: src=lo, dst=hi
+                self.edges[edge_id] = KGEdge(
+                    id=edge_id,
+                    kind=EdgeKind.CO_INVESTED_WITH,
+                    src=lo,
+                    dst=hi,
+                    attrs={
+                        "shared_investees": [investee_name],
+                        "_shared_investees_set": {investee_name},
+                        "_derived_from_set": set(derived_from),
+                        "_source_keys": {(s.source_name, s.url, s.evidence_quote) for s in deduped},
                         "shared_count": 1,
-                    }
-
-                    if edge_id in self.edges:
-                        # Merge: increment count if this investee wasn't already counted.
-                        existing = self.edges[edge_id]
-                        if existing.kind != EdgeKind.CO_INVESTED_WITH:
-                            continue
-
-                        # Track multiple shared investees.
-                        shared = existing.attrs.get("shared_investees")
-                        if not isinstance(shared, list):
-                            shared = []
-                        if investee_name not in shared:
-                            shared.append(investee_name)
-                            existing.attrs["shared_investees"] = shared
-                            try:
-                                existing.attrs["shared_count"] = int(existing.attrs.get("shared_count", 0)) + 1
-                            except Exception:
-                                existing.attrs["shared_count"] = 1
-
-                        # Merge provenance.
-                        existing_df = set(existing.derived_from or [])
-                        for did in derived_from:
-                            if did not in existing_df:
-                                existing.derived_from.append(did)
-                                existing_df.add(did)
-
-                        existing_seen = {(s.source_name, s.url, s.evidence_quote) for s in (existing.sources or [])}
-                        for s in deduped:
-                            key = (s.source_name, s.url, s.evidence_quote)
-                            if key not in existing_seen:
-                                existing.sources.append(s)
-                                existing_seen.add(key)
-
-                        continue
-
-                    # Store as a canonical (undirected) edge: src=lo, dst=hi
-                    lo, hi = (a, b) if a < b else (b, a)
-                    self.edges[edge_id] = KGEdge(
-                        id=edge_id,
-                        kind=EdgeKind.CO_INVESTED_WITH,
-                        src=lo,
-                        dst=hi,
-                        attrs={
-                            "shared_investees": [investee_name],
-                            "shared_count": 1,
-                        },
-                        sources=deduped,
-                        derived_from=derived_from,
-                    )
-                    created += 1
+                    },
+                    sources=deduped,
+                    derived_from=derived_from,
+                )
+                created += 1
 
+        self._co_investments_derived_with = max_sources_per_edge
         return created
 
     def top_co_investor_pairs(self, *, limit: int = 10) -> List[Tuple[str, str, KGEdge]]:
@@ -282,24 +357,20 @@ class KnowledgeGraph:
                 continue
             pairs.append((a.name, b.name, e))
 
-        def score(t: Tuple[str, str, KGEdge]) -> int:
-            try:
-                return int(t[2].attrs.get("shared_count", 0))
-            except Exception:
-                return 0
-
-        pairs.sort(key=score, reverse=True)
-        return pairs[:limit]
+        # Only `limit` items are needed: O(E log limit) instead of a full sort.
+        return heapq.nlargest(limit, pairs, key=_pair_score)
 
     def investments_for_company(self, company_name: str) -> List[KGEdge]:
         node_id = self._company_key_to_node_id.get(_norm_name(company_name))
         if not node_id:
             return []
-        return [
-            e
-            for e in self.edges.values()
-            if e.kind == EdgeKind.INVESTED_IN and (e.src == node_id or e.dst == node_id)
-        ]
+        as_investor = self._by_investor.get(node_id, ())
+        as_investee = self._by_investee.get(node_id, ())
+        if not as_investor or not as_investee:
+            return list(as_investor or as_investee)
+        # A company on both sides: keep the edges' insertion order, as a full scan would.
+        wanted = {e.id for e in as_investor} | {e.id for e in as_investee}
+        return [e for edge_id, e in self.edges.items() if edge_id in wanted]
 
     def investors_of(self, company_name: str) -> List[Tuple[str, KGEdge]]:
         """Return list of (investor_company_name, edge)."""
@@ -307,11 +378,7 @@ class KnowledgeGraph:
         if not node_id:
             return []
         out: List[Tuple[str, KGEdge]] = []
-        for e in self.edges.values():
-            if e.kind != EdgeKind.INVESTED_IN:
-                continue
-            if e.dst != node_id:
-                continue
+        for e in self._by_investee.get(node_id, ()):
             investor_node = self.nodes.get(e.src)
             if investor_node:
                 out.append((investor_node.name, e))
@@ -323,24 +390,27 @@ class KnowledgeGraph:
         if not node_id:
             return []
         out: List[Tuple[str, KGEdge]] = []
-        for e in self.edges.values():
-            if e.kind != EdgeKind.INVESTED_IN:
-                continue
-            if e.src != node_id:
-                continue
+        for e in self._by_investor.get(node_id, ()):
             investee_node = self.nodes.get(e.dst)
             if investee_node:
                 out.append((investee_node.name, e))
         return out
 
     def to_json_dict(self) -> Dict[str, Any]:
+        # Co-invest edges reuse their investments' FactSource objects, so the same
+        # source shows up on many edges: serialize each one once per call.
+        src_dicts: Dict[int, Dict[str, Any]] = {}
+
         def src_to_dict(s: FactSource) -> Dict[str, Any]:
-            return {
-                "source_name": s.source_name,
-                "url": s.url,
-                "retrieved_at": s.retrieved_at.isoformat() if getattr(s, "retrieved_at", None) else None,
-                "evidence_quote": s.evidence_quote,
-            }
+            d = src_dicts.get(id(s))
+            if d is None:
+                d = src_dicts[id(s)] = {
+                    "source_name": s.source_name,
+                    "url": s.url,
+                    "retrieved_at": s.retrieved_at.isoformat() if getattr(s, "retrieved_at", None) else None,
+                    "evidence_quote": s.evidence_quote,
+                }
+            return dict(d)
 
         return {
             "nodes": [
@@ -353,7 +423,8 @@ class KnowledgeGraph:
                     "kind": e.kind.value,
                     "src": e.src,
                     "dst": e.dst,
-                    "attrs": dict(e.attrs),
+                    # Underscore-prefixed attrs are in-memory indexes, not data.
+                    "attrs": {k: v for k, v in e.attrs.items() if not k.startswith("_")},
                     "sources": [src_to_dict(s) for s in (e.sources or [])],
                     "derived_from": list(e.derived_from or []),
                 }
@@ -361,23 +432,20 @@ class KnowledgeGraph:
             ],
         }
 
-    def to_dot(self) -> str:
-        """Graphviz DOT output (simple, for quick visualization)."""
-        lines = ["digraph newsletter_kg {", "  rankdir=LR;", "  node [shape=box];"]
+    def iter_dot(self) -> Iterator[str]:
+        """Graphviz DOT output as chunks (one per line) - stream it to a file."""
+        yield "digraph newsletter_kg {\n  rankdir=LR;\n  node [shape=box];\n"
 
         for n in self.nodes.values():
-            safe_name = n.name.replace('"', "'")
-            lines.append(f'  "{n.id}" [label="{safe_name}"];')
+            safe_name = n.name.translate(_DOT_TRANS)
+            yield f'  "{n.id}" [label="{safe_name}"];\n'
 
         for e in self.edges.values():
-            label = e.kind.value
-            amt = e.attrs.get("amount_m_usd")
-            if amt is not None:
-                try:
-                    label = f"{label} (${float(amt):.1f}M)"
-                except Exception:
-                    pass
-            lines.append(f'  "{e.src}" -> "{e.dst}" [label="{label}"];')
-
-        lines.append("}")
-        return "\n".join(lines)
+            label = e.kind.value + _format_amount(e.attrs.get("amount_m_usd"))
+            yield f'  "{e.src}" -> "{e.dst}" [label="{label}"];\n'
+
+        yield "}"
+
+    def to_dot(self) -> str:
+        """Graphviz DOT output (simple, for quick visualization)."""
+        return "".join(self.iter_dot())
@@ -2,13 +2,19 @@
 Data models for investment tracking and newsletter content
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from newsletter_factory import InvestmentStage
 
 
-@dataclass
+# `@dataclass(**SLOTS)`: slotted instances (no per-object __dict__) on Python 3.10+,
+# plain dataclasses on older interpreters.
+SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**SLOTS)
 class FactSource:
     """Grounding/evidence for a extracted fact."""
 
@@ -18,7 +24,7 @@ class FactSource:
     evidence_quote: Optional[str] = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Company:
     """Represents a company in the AI ecosystem"""
     name: str
@@ -26,12 +32,17 @@ class Company:
     sector: str  # e.g., "LLM", "Computer Vision", "Robotics", etc.
     website: Optional[str] = None
     founded_year: Optional[int] = None
+
+    def __post_init__(self):
+        # The same investors recur across thousands of scraped rows: share one string.
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
     
     def __str__(self) -> str:
         return f"{self.name} ({self.sector})"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Investment:
     """Represents an investment event"""
     investor: Company
@@ -55,7 +66,7 @@ class Investment:
                 f"{self.format_amount()} ({self.stage.value})")
 
 
-@dataclass
+@dataclass(**SLOTS)
 class EntrepreneurTip:
     """Actionable advice for aspiring AI entrepreneurs"""
     title: str
@@ -67,7 +78,7 @@ class EntrepreneurTip:
     sources: List[FactSource] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class MarketTrend:
     """Market trend analysis for the AI sector"""
     trend_name: str
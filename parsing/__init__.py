@@ -1,13 +1,18 @@
 from .extractors import (
     parse_money_usd_millions,
+    parse_money_usd_millions_many,
     infer_stage,
     extract_company_name_from_title,
     extract_investor_names,
 )
+from .rss import iter_rss_entries, parse_rss_entries
 
 __all__ = [
     "parse_money_usd_millions",
+    "parse_money_usd_millions_many",
     "infer_stage",
     "extract_company_name_from_title",
     "extract_investor_names",
+    "iter_rss_entries",
+    "parse_rss_entries",
 ]
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
 import re
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
 from newsletter_factory import InvestmentStage
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
 
 _MONEY_RE = re.compile(
     r"\$(?P<num>\d{1,3}(?:,\d{3})*(?:\.\d+)?|\d+(?:\.\d+)?)\s*(?P<unit>billion|million|bn|m|b)\b",
     re.IGNORECASE,
 )
 
+_SERIES_STAGES = (
+    ("series a", InvestmentStage.SERIES_A),
+    ("series b", InvestmentStage.SERIES_B),
+    ("series c", InvestmentStage.SERIES_C),
+    ("series d", InvestmentStage.SERIES_D_PLUS),
+    ("series e", InvestmentStage.SERIES_D_PLUS),
+    ("series f", InvestmentStage.SERIES_D_PLUS),
+    ("series g", InvestmentStage.SERIES_D_PLUS),
+)
+
+_EDITORIAL_PREFIX_RE = re.compile(r"^\s*(?:Exclusive|Report|Analysis|Opinion)\s*[:\-—]\s+")
+
+_TITLE_COMPANY_RES = (
+    re.compile(r"^([A-Z][A-Za-z0-9\.\-\s]+?)\s+(?:raises|secures|closes|gets|lands|scores)\b"),
+    re.compile(r"^([A-Z][A-Za-z0-9\.\-\s]+?)\s+(?:announces|launches|unveils)\b"),
+)
+
+# Tried in order; names keep first-seen order across patterns.
+_INVESTOR_RES = (
+    re.compile(r"led by\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)"),
+    re.compile(r"backed by\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)"),
+    re.compile(r"participation from\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)"),
+)
+
 
 def parse_money_usd_millions(text: str) -> Optional[float]:
     """Parse a USD amount and return value in USD millions.
@@ -43,6 +70,27 @@ def parse_money_usd_millions(text: str) -> Optional[float]:
     return value
 
 
+def parse_money_usd_millions_many(texts: List[Optional[str]]) -> "np.ndarray":
+    """Bulk variant of `parse_money_usd_millions` for batch ingestion.
+
+    Runs the same regex over all texts via pandas' vectorized string ops and
+    returns a float array (USD millions) aligned with `texts`; NaN where no
+    amount was found.
+    """
+    # Imported lazily: pandas is heavy and only needed for batch work.
+    import numpy as np
+    import pandas as pd
+
+    if not texts:
+        return np.empty(0, dtype=float)
+
+    ext = pd.Series(texts, dtype=object).str.extract(_MONEY_RE.pattern, flags=re.IGNORECASE)
+    values = pd.to_numeric(ext["num"].str.replace(",", "", regex=False), errors="coerce").to_numpy(dtype=float)
+    unit = ext["unit"].str.lower()
+    multiplier = np.where(unit.isin(["billion", "b", "bn"]).to_numpy(), 1000.0, 1.0)
+    return values * multiplier
+
+
 def infer_stage(text: str) -> InvestmentStage:
     """Infer an InvestmentStage from free text.
 
@@ -55,16 +103,7 @@ def infer_stage(text: str) -> InvestmentStage:
     if "seed" in t:
         return InvestmentStage.SEED
 
-    series_map = {
-        "series a": InvestmentStage.SERIES_A,
-        "series b": InvestmentStage.SERIES_B,
-        "series c": InvestmentStage.SERIES_C,
-        "series d": InvestmentStage.SERIES_D_PLUS,
-        "series e": InvestmentStage.SERIES_D_PLUS,
-        "series f": InvestmentStage.SERIES_D_PLUS,
-        "series g": InvestmentStage.SERIES_D_PLUS,
-    }
-    for key, stage in series_map.items():
+    for key, stage in _SERIES_STAGES:
         if key in t:
             return stage
 
@@ -87,17 +126,12 @@ def extract_company_name_from_title(title: str) -> Optional[str]:
 
     # Strip common editorial prefixes that would otherwise be mistaken as a company name.
     # Keep this list short and deterministic.
-    cleaned = re.sub(r"^\s*(?:Exclusive|Report|Analysis|Opinion)\s*[:\-—]\s+", "", title).strip()
+    cleaned = _EDITORIAL_PREFIX_RE.sub("", title).strip()
     if not cleaned:
         return None
 
-    patterns = [
-        r"^([A-Z][A-Za-z0-9\.\-\s]+?)\s+(?:raises|secures|closes|gets|lands|scores)\b",
-        r"^([A-Z][A-Za-z0-9\.\-\s]+?)\s+(?:announces|launches|unveils)\b",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, cleaned)
+    for pattern in _TITLE_COMPANY_RES:
+        match = pattern.search(cleaned)
         if match:
             candidate = match.group(1).strip()
             if 2 <= len(candidate) <= 60:
@@ -120,15 +154,9 @@ def extract_investor_names(text: str, max_names: int = 5) -> List[str]:
     if not text:
         return []
 
-    patterns = [
-        r"led by\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)",
-        r"backed by\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)",
-        r"participation from\s+([A-Z][A-Za-z0-9&\.\s]+?)(?:,|\.|;|\n)",
-    ]
-
     names: List[str] = []
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in _INVESTOR_RES:
+        for match in pattern.finditer(text):
             candidate = " ".join(match.group(1).split()).strip()
             if candidate and candidate not in names:
                 names.append(candidate)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Iterator, List, Optional, Union
+
+from lxml import etree
+
+
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+
+def _published_parsed(text: Optional[str]) -> Optional[time.struct_time]:
+    """RFC 822 date -> UTC struct_time (same shape as feedparser's `published_parsed`)."""
+    if not text:
+        return None
+    try:
+        return parsedate_to_datetime(text.strip()).utctimetuple()
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_bytes(xml: Union[str, bytes]) -> bytes:
+    if isinstance(xml, bytes):
+        return xml
+    # Already-decoded text: drop the declaration so lxml doesn't re-decode it
+    # with whatever encoding it names.
+    text = xml.lstrip()
+    if text.startswith("<?xml"):
+        end = text.find("?>")
+        if end != -1:
+            text = text[end + 2:]
+    return text.encode("utf-8")
+
+
+def iter_rss_entries(xml: Union[str, bytes]) -> Iterator[SimpleNamespace]:
+    """Stream RSS 2.0 ``<item>`` elements as feedparser-like entries.
+
+    Each entry has ``title``, ``link``, ``summary``, ``published_parsed`` and
+    ``content`` (``[{"value": ...}]`` from ``content:encoded``, else ``[]``).
+    Items are cleared as they are consumed, so memory stays bounded.
+    """
+    context = etree.iterparse(
+        BytesIO(_as_bytes(xml)),
+        events=("end",),
+        tag="item",
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, item in context:
+        encoded = item.findtext(_CONTENT_ENCODED)
+        entry = SimpleNamespace(
+            title=(item.findtext("title") or "").strip(),
+            link=(item.findtext("link") or "").strip(),
+            summary=item.findtext("description") or "",
+            published_parsed=_published_parsed(item.findtext("pubDate")),
+            content=[{"value": encoded}] if encoded else [],
+        )
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+        yield entry
+
+
+def parse_rss_entries(xml: Union[str, bytes]) -> List[SimpleNamespace]:
+    """Entries of an RSS feed.
+
+    Uses `iter_rss_entries`; anything it can't handle (malformed XML, Atom or
+    other non-RSS feeds) falls back to feedparser.
+    """
+    try:
+        entries = list(iter_rss_entries(xml))
+        if entries:
+            return entries
+    except etree.XMLSyntaxError:
+        pass
+
+    import feedparser
+
+    return list(feedparser.parse(xml).entries)
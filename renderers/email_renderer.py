@@ -13,12 +13,16 @@ No external network calls are made here.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
+from email.generator import BytesGenerator
 from email.message import EmailMessage
 from email.utils import formatdate
+from functools import lru_cache
 from html import escape
-from typing import Optional
+from io import BytesIO
+from typing import Any, BinaryIO, Optional
 
 
 @dataclass(frozen=True)
@@ -31,18 +35,13 @@ class EmailRenderOptions:
     footer_text: str = "You’re receiving this because you subscribed to AI Investment Weekly."
 
 
-def _markdown_to_html(markdown_text: str) -> str:
-    """Convert Markdown to HTML.
-
-    Uses `markdown` (Python-Markdown) if installed; otherwise falls back to `<pre>`.
-    """
-    markdown_text = markdown_text or ""
-
+@lru_cache(maxsize=1)
+def _markdown_converter() -> Optional[Any]:
+    """Shared Python-Markdown instance (extension setup is the costly part), or None."""
     try:
         import markdown as md  # type: ignore
 
-        return md.markdown(
-            markdown_text,
+        return md.Markdown(
             extensions=[
                 "extra",
                 "sane_lists",
@@ -51,8 +50,39 @@ def _markdown_to_html(markdown_text: str) -> str:
             output_format="html5",
         )
     except Exception:
-        # Safe fallback: preserve content without trying to be clever.
-        return "<pre style=\"white-space:pre-wrap;font-family:ui-monospace,Menlo,Consolas,monospace\">" + escape(markdown_text) + "</pre>"
+        return None
+
+
+# A Markdown instance keeps per-document state until reset(): one render at a time.
+_MARKDOWN_LOCK = threading.Lock()
+
+
+def _pre_html(text: str) -> str:
+    # Safe fallback: preserve content without trying to be clever.
+    return "<pre style=\"white-space:pre-wrap;font-family:ui-monospace,Menlo,Consolas,monospace\">" + escape(text) + "</pre>"
+
+
+@lru_cache(maxsize=64)
+def _markdown_to_html(markdown_text: str) -> str:
+    """Convert Markdown to HTML.
+
+    Uses `markdown` (Python-Markdown) if installed; otherwise falls back to `<pre>`.
+    Memoized on the text: the HTML preview and the `.eml` export of a newsletter
+    convert the same Markdown.
+    """
+    markdown_text = markdown_text or ""
+
+    converter = _markdown_converter()
+    if converter is None:
+        return _pre_html(markdown_text)
+
+    with _MARKDOWN_LOCK:
+        try:
+            return converter.convert(markdown_text)
+        except Exception:
+            return _pre_html(markdown_text)
+        finally:
+            converter.reset()
 
 
 def render_newsletter_email_html(
@@ -131,11 +161,23 @@ def build_eml_message(*, html_body: str, text_body: str, options: EmailRenderOpt
     return msg
 
 
-def export_eml_bytes(*, newsletter_markdown: str, options: EmailRenderOptions) -> bytes:
-    """Convenience: render HTML + build `.eml` bytes."""
+def write_eml(fp: BinaryIO, *, newsletter_markdown: str, options: EmailRenderOptions) -> None:
+    """Render HTML + write the `.eml` straight to a binary file object.
+
+    Same bytes as `export_eml_bytes`, without holding the whole message in memory.
+    """
 
     html_body = render_newsletter_email_html(newsletter_markdown=newsletter_markdown, options=options)
     # Plain-text: keep the original Markdown (readable enough and preserves links).
     text_body = newsletter_markdown
     msg = build_eml_message(html_body=html_body, text_body=text_body, options=options)
-    return msg.as_bytes()
+    # What msg.as_bytes() does, minus its BytesIO.
+    BytesGenerator(fp, mangle_from_=False, policy=msg.policy).flatten(msg)
+
+
+def export_eml_bytes(*, newsletter_markdown: str, options: EmailRenderOptions) -> bytes:
+    """Convenience: render HTML + build `.eml` bytes."""
+
+    buf = BytesIO()
+    write_eml(buf, newsletter_markdown=newsletter_markdown, options=options)
+    return buf.getvalue()
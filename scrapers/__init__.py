@@ -1,27 +1,37 @@
 """
 Scraper initialization
+
+Submodules load on first attribute access, so importing one scraper module
+(e.g. `scrapers.event_scrapers`) doesn't pull in all the others.
 """
 
-from .base_scraper import BaseScraper, CacheManager, RateLimiter, ScraperConfig
-from .investment_scrapers import (
-    TechCrunchScraper,
-    VentureBeatScraper,
-    CrunchbaseNewsScraper,
-    InvestmentDataAggregator
-)
-from .event_scrapers import (
-    AIEvent,
-    EventbriteScraper,
-    EventAggregator,
-    AIConferenceTracker
-)
-from .real_data_source import RealTimeDataSource
+from importlib import import_module
+
+_EXPORTS = {
+    'BaseScraper': '.base_scraper',
+    'CacheManager': '.base_scraper',
+    'RateLimiter': '.base_scraper',
+    'ScraperConfig': '.base_scraper',
+    'TokenBucket': '.base_scraper',
+    'get_shared_session': '.base_scraper',
+    'TechCrunchScraper': '.investment_scrapers',
+    'VentureBeatScraper': '.investment_scrapers',
+    'CrunchbaseNewsScraper': '.investment_scrapers',
+    'InvestmentDataAggregator': '.investment_scrapers',
+    'AIEvent': '.event_scrapers',
+    'EventbriteScraper': '.event_scrapers',
+    'EventAggregator': '.event_scrapers',
+    'AIConferenceTracker': '.event_scrapers',
+    'RealTimeDataSource': '.real_data_source',
+}
 
 __all__ = [
     'BaseScraper',
     'CacheManager',
     'RateLimiter',
+    'TokenBucket',
     'ScraperConfig',
+    'get_shared_session',
     'TechCrunchScraper',
     'VentureBeatScraper',
     'CrunchbaseNewsScraper',
@@ -32,3 +42,16 @@ __all__ = [
     'AIConferenceTracker',
     'RealTimeDataSource'
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,20 +2,37 @@
 Base scraper infrastructure with rate limiting, caching, and error handling
 """
 
+import os
 import time
 import hashlib
+import itertools
 import json
 import logging
 import re
+import sqlite3
+import threading
+import zlib
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections import deque
+from functools import lru_cache
+from statistics import median
+from typing import Optional, Deque, Dict, Any, Iterable, List, Tuple
+from urllib.parse import urlparse
 from datetime import datetime, timedelta
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
+from dateutil.parser import parse as parse_datetime
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -29,11 +46,14 @@ class ScraperConfig:
     
     # Rate limiting
     REQUESTS_PER_MINUTE = 30
-    DELAY_BETWEEN_REQUESTS = 2.0  # seconds
+    LATENCY_WINDOW = 20  # responses used for the rolling median (adaptive rate)
+    BURST_CAPACITY = 3  # requests allowed back-to-back per host (1 = strict pacing)
     
     # Caching
     CACHE_DIR = Path("cache")
     CACHE_EXPIRY_HOURS = 6  # How long cached data is valid
+    # Use requests-cache (HTTP cache w/ ETag/Last-Modified revalidation) when installed
+    HTTP_CACHE = True
     
     # Retry policy
     MAX_RETRIES = 3
@@ -43,143 +63,519 @@ class ScraperConfig:
     # Request settings
     TIMEOUT = 30  # seconds
     VERIFY_SSL = True
+    UA_ROTATE_EVERY = 50  # requests per scraper before picking a new user agent
+    # Used when fake-useragent is unavailable or fails to load its data
+    DEFAULT_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )
+    POOL_CONNECTIONS = 16  # distinct hosts kept alive
+    POOL_MAXSIZE = 64  # connections per host
+    MAX_WORKERS = 8  # concurrent article fetches per scraper (still paced per host)
+
+
+_WS_RE = re.compile(r"\s+")
+_TEXT_ARTIFACTS = str.maketrans({"\xa0": " ", "\u200b": None})
+
+# Tried in order before falling back to dateutil.
+_KNOWN_DATE_FORMATS = (
+    "%B %d, %Y",  # March 3, 2026
+    "%b %d, %Y",  # Mar 3, 2026
+    "%A, %B %d, %Y",  # Tuesday, March 3, 2026
+    "%a, %b %d, %Y",  # Tue, Mar 3, 2026
+    "%a, %b %d, %Y %I:%M %p",  # Tue, Mar 3, 2026 7:00 PM
+    "%a, %d %b %Y %H:%M:%S %z",  # RFC 822 (RSS)
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_text(text: str) -> datetime:
+    """Parse a stripped date string (memoized: listing pages repeat the same dates).
+
+    Raises on unparseable input; `BaseScraper.parse_date` turns that into None.
+    """
+    # Fast paths: ISO 8601 (C-implemented) and the handful of formats listing
+    # pages actually use; dateutil's general grammar is the slow fallback.
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in _KNOWN_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    return parse_datetime(text)
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    if "" in node:
+        # A keyword ends here; for "does any keyword occur" longer ones are redundant.
+        return ""
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def keyword_re(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """Case-insensitive "any keyword occurs as a substring" regex.
+
+    Keywords are folded into a prefix trie (``(?:a(?:gent|i)|gen(?:ai|erative ai))``)
+    so the engine tries each shared prefix once per position instead of once per
+    keyword, which gives Aho-Corasick-style scanning without a C extension.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(_trie_pattern(trie) if trie else r"(?!)", re.IGNORECASE)
+
+
+_UA_SOURCE: Any = None
+_UA_SOURCE_LOCK = threading.Lock()
+
+
+def _random_user_agent() -> str:
+    """Random browser user agent; fake-useragent is loaded lazily, once per process"""
+    global _UA_SOURCE
+    if _UA_SOURCE is None:
+        with _UA_SOURCE_LOCK:
+            if _UA_SOURCE is None:
+                try:
+                    from fake_useragent import UserAgent
+                    _UA_SOURCE = UserAgent()
+                except Exception as e:
+                    logging.warning(f"fake-useragent unavailable, using default UA: {e}")
+                    _UA_SOURCE = False
+    if _UA_SOURCE is False:
+        return ScraperConfig.DEFAULT_USER_AGENT
+    try:
+        return _UA_SOURCE.random
+    except Exception:
+        return ScraperConfig.DEFAULT_USER_AGENT
+
+
+def _cache_dir() -> Path:
+    """Cache root; tests/deployments can redirect it via NEWSLETTER_FACTORY_CACHE_DIR."""
+    return Path(os.environ.get("NEWSLETTER_FACTORY_CACHE_DIR") or ScraperConfig.CACHE_DIR)
+
+
+def _new_session(use_cache: bool) -> requests.Session:
+    """Create the HTTP session for a scraper.
+
+    If `requests-cache` is installed, returns a `CachedSession` that handles
+    expiry and conditional GETs itself; otherwise a plain `requests.Session`
+    (callers then fall back to `CacheManager`).
+    """
+    if use_cache and ScraperConfig.HTTP_CACHE:
+        try:
+            import requests_cache  # type: ignore
+        except ImportError:
+            pass
+        else:
+            cache_dir = _cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            return requests_cache.CachedSession(
+                str(cache_dir / "http"),
+                backend="sqlite",
+                expire_after=timedelta(hours=ScraperConfig.CACHE_EXPIRY_HOURS),
+                stale_if_error=True,
+                cache_control=True,
+            )
+    return requests.Session()
+
+
+# One pooled session per cache mode (and cache directory), shared by every
+# scraper so TCP/TLS connections to the same host are reused across scrapers.
+_SHARED_SESSIONS: Dict[Tuple[bool, Optional[Path]], requests.Session] = {}
+
+
+def get_shared_session(use_cache: bool = True) -> requests.Session:
+    """Return the process-wide scraper session (created on first use).
+
+    Caching sessions are keyed on the current cache directory too, so a new
+    NEWSLETTER_FACTORY_CACHE_DIR gets its own HTTP cache file.
+    """
+    key = (use_cache, _cache_dir() if use_cache else None)
+    session = _SHARED_SESSIONS.get(key)
+    if session is None:
+        session = _new_session(use_cache)
+        # Retries are handled by tenacity in `_fetch_url`, not by urllib3.
+        adapter = HTTPAdapter(
+            pool_connections=ScraperConfig.POOL_CONNECTIONS,
+            pool_maxsize=ScraperConfig.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SHARED_SESSIONS[key] = session
+    return session
+
+
+_ORJSON_CACHE_OPTS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+    if orjson is not None
+    else 0
+)
 
 
 class CacheManager:
-    """Manages cached scraper data"""
+    """Manages cached scraper data (single SQLite file per cache directory)"""
 
     _GOOGLE_API_KEY_RE = re.compile(r"AIza[0-9A-Za-z_\-]{20,}")
     _SENSITIVE_KEY_RE = re.compile(r"(api[_-]?key|token|secret|bearer)", re.IGNORECASE)
-    
-    def __init__(self, cache_dir: Path = ScraperConfig.CACHE_DIR):
-        self.cache_dir = cache_dir
-        self.cache_dir.mkdir(exist_ok=True)
-    
-    def _get_cache_key(self, url: str, params: Optional[Dict] = None) -> str:
-        """Generate cache key from URL and parameters"""
+
+    DB_NAME = "cache.sqlite"
+    # Scraped HTML compresses ~5-10x; tiny payloads aren't worth the CPU.
+    COMPRESS_MIN_BYTES = 1024
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = _cache_dir()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit: every statement is its own (WAL-journaled) transaction.
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / self.DB_NAME),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+              key BLOB PRIMARY KEY,
+              url TEXT,
+              params TEXT,
+              ts REAL NOT NULL,
+              data BLOB,
+              etag TEXT,
+              last_modified TEXT,
+              ttl_hours REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        for column, sql_type in (("etag", "TEXT"), ("last_modified", "TEXT"), ("ttl_hours", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE cache ADD COLUMN {column} {sql_type}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_ts ON cache(ts)")
+        # One connection shared by a scraper's worker threads: serialize use of it.
+        # Separate CacheManagers on the same file are coordinated by WAL.
+        self._lock = threading.Lock()
+
+    def _get_cache_key(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """Generate cache key from URL and parameters (raw 16-byte BLAKE2b digest)"""
         cache_input = url
         if params:
             cache_input += json.dumps(params, sort_keys=True)
-        return hashlib.md5(cache_input.encode()).hexdigest()
-    
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get path for cache file"""
-        return self.cache_dir / f"{cache_key}.json"
+        return hashlib.blake2b(cache_input.encode(), digest_size=16).digest()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_sensitive_key(key: str) -> bool:
+        # Payload dicts repeat the same few key names: match each name once.
+        return CacheManager._SENSITIVE_KEY_RE.search(key) is not None
 
     def _redact_secrets(self, value: Any) -> Any:
-        """Best-effort redaction for secrets that can appear in scraped pages."""
+        """Best-effort redaction for secrets that can appear in scraped pages.
+
+        Containers are only copied when something inside them was redacted, so
+        the common (secret-free) payload is returned as-is without allocation.
+        """
         if isinstance(value, str):
+            if "AIza" not in value:
+                return value
             return self._GOOGLE_API_KEY_RE.sub("[REDACTED]", value)
 
         if isinstance(value, list):
-            return [self._redact_secrets(v) for v in value]
+            redacted_list: Optional[List[Any]] = None
+            for i, v in enumerate(value):
+                new = self._redact_secrets(v)
+                if new is not v and redacted_list is None:
+                    redacted_list = value[:i]
+                if redacted_list is not None:
+                    redacted_list.append(new)
+            return value if redacted_list is None else redacted_list
 
         if isinstance(value, dict):
-            redacted: Dict[Any, Any] = {}
-            for k, v in value.items():
-                if isinstance(k, str) and self._SENSITIVE_KEY_RE.search(k):
-                    redacted[k] = "[REDACTED]"
+            redacted: Optional[Dict[Any, Any]] = None
+            for i, (k, v) in enumerate(value.items()):
+                if isinstance(k, str) and self._is_sensitive_key(k):
+                    new = "[REDACTED]"
                 else:
-                    redacted[k] = self._redact_secrets(v)
-            return redacted
+                    new = self._redact_secrets(v)
+                if new is not v and redacted is None:
+                    redacted = dict(itertools.islice(value.items(), i))
+                if redacted is not None:
+                    redacted[k] = new
+            return value if redacted is None else redacted
 
         return value
     
+    @staticmethod
+    def _dumps(data: Any) -> bytes:
+        if orjson is not None:
+            try:
+                # Passthrough keeps datetimes/dataclasses on `default=str`, as with json.
+                return orjson.dumps(data, default=str, option=_ORJSON_CACHE_OPTS)
+            except TypeError:
+                pass  # e.g. ints beyond 64 bits: the stdlib encoder copes
+        return json.dumps(data, default=str).encode("utf-8")
+
+    @staticmethod
+    def _loads(raw: bytes) -> Any:
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except ValueError:
+                pass  # NaN/Infinity written by the stdlib encoder
+        return json.loads(raw)
+
+    def _encode(self, data: Any) -> bytes:
+        """Compact JSON, zlib-compressed when large"""
+        raw = self._dumps(data)
+        if len(raw) >= self.COMPRESS_MIN_BYTES:
+            return zlib.compress(raw, 1)
+        return raw
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        # zlib streams start with 0x78; JSON text never does.
+        if blob[:1] == b"\x78":
+            blob = zlib.decompress(blob)
+        return CacheManager._loads(blob)
+    
     def get(self, url: str, params: Optional[Dict] = None, 
             max_age_hours: int = ScraperConfig.CACHE_EXPIRY_HOURS) -> Optional[Dict]:
-        """Retrieve cached data if valid"""
+        """Retrieve cached data if valid
+
+        An entry stored with its own `ttl_hours` expires by that; `max_age_hours`
+        only applies to entries written without one.
+        """
         cache_key = self._get_cache_key(url, params)
-        cache_path = self._get_cache_path(cache_key)
-        
-        if not cache_path.exists():
-            return None
-        
+        now = time.time()
+
         try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-            
-            # Check if cache is expired
-            cached_time = datetime.fromisoformat(cached['timestamp'])
-            age = datetime.now() - cached_time
-            
-            if age > timedelta(hours=max_age_hours):
-                logging.info(f"Cache expired for {url}")
+            # Freshness is checked in the query: an expired entry costs one key
+            # probe and its payload is never read.
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT ts, data FROM cache "
+                    "WHERE key = ? AND ts + COALESCE(ttl_hours, ?) * 3600 > ?",
+                    (cache_key, max_age_hours, now),
+                ).fetchone()
+            if row is None:
+                logging.info(f"Cache miss for {url}")
                 return None
-            
-            logging.info(f"Cache hit for {url} (age: {age})")
-            return cached['data']
-        
+
+            ts, data = row
+            age = now - ts
+            logging.info(f"Cache hit for {url} (age: {timedelta(seconds=age)})")
+            return self._decode(data)
+
         except Exception as e:
             logging.warning(f"Cache read error: {e}")
             return None
     
-    def set(self, url: str, data: Any, params: Optional[Dict] = None):
-        """Store data in cache"""
+    def revalidation_headers(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, str]]:
+        """Conditional-request headers for a cached entry, regardless of age.
+
+        Returns None unless the entry carries an ETag or Last-Modified validator.
+        The payload isn't read: `touch` returns it if the server answers 304.
+        """
         cache_key = self._get_cache_key(url, params)
-        cache_path = self._get_cache_path(cache_key)
-        
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified FROM cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+            if row is None:
+                return None
+
+            etag, last_modified = row
+            headers: Dict[str, str] = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            return headers or None
+
+        except Exception as e:
+            logging.warning(f"Cache read error: {e}")
+            return None
+
+    def set(self, url: str, data: Any, params: Optional[Dict] = None,
+            etag: Optional[str] = None, last_modified: Optional[str] = None,
+            ttl_hours: Optional[float] = None):
+        """Store data in cache (with optional HTTP validators for revalidation)
+
+        `ttl_hours` is kept with the entry so volatile and stable sources can
+        share one cache; None means "use the reader's max_age_hours".
+        """
+        cache_key = self._get_cache_key(url, params)
+
         try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'url': url,
-                'params': params,
-                'data': self._redact_secrets(data)
-            }
-            
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=str)
-            
+            payload = self._encode(self._redact_secrets(data))
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache"
+                    "(key, url, params, ts, data, etag, last_modified, ttl_hours) "
+                    "VALUES (?,?,?,?,?,?,?,?)",
+                    (
+                        cache_key,
+                        url,
+                        json.dumps(params, sort_keys=True) if params else None,
+                        time.time(),
+                        payload,
+                        etag,
+                        last_modified,
+                        ttl_hours,
+                    ),
+                )
+
             logging.info(f"Cached data for {url}")
-        
+
+        except Exception as e:
+            logging.warning(f"Cache write error: {e}")
+
+    def touch(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Mark an entry fresh again (e.g. after a 304 Not Modified) and return its data
+
+        Returns None if the entry is gone.
+        """
+        cache_key = self._get_cache_key(url, params)
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE cache SET ts = ? WHERE key = ?", (time.time(), cache_key)
+                )
+                row = self._conn.execute(
+                    "SELECT data FROM cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+            return None if row is None else self._decode(row[0])
         except Exception as e:
             logging.warning(f"Cache write error: {e}")
+            return None
     
-    def clear_expired(self, max_age_hours: int = ScraperConfig.CACHE_EXPIRY_HOURS):
-        """Remove expired cache files"""
+    def clear_expired(self, max_age_hours: Optional[float] = None):
+        """Remove expired cache entries
+
+        By default each entry expires by its own TTL (CACHE_EXPIRY_HOURS if it
+        has none); an explicit `max_age_hours` is a hard cutoff for every entry.
+        """
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r') as f:
-                    cached = json.load(f)
-                
-                cached_time = datetime.fromisoformat(cached['timestamp'])
-                age = datetime.now() - cached_time
-                
-                if age > timedelta(hours=max_age_hours):
-                    cache_file.unlink()
-                    count += 1
-            
-            except Exception as e:
-                logging.warning(f"Error clearing cache {cache_file}: {e}")
-        
-        logging.info(f"Cleared {count} expired cache files")
+        now = time.time()
+        try:
+            with self._lock:
+                if max_age_hours is None:
+                    cur = self._conn.execute(
+                        "DELETE FROM cache WHERE ts + COALESCE(ttl_hours, ?) * 3600 <= ?",
+                        (ScraperConfig.CACHE_EXPIRY_HOURS, now),
+                    )
+                else:
+                    cur = self._conn.execute(
+                        "DELETE FROM cache WHERE ts <= ?", (now - max_age_hours * 3600,)
+                    )
+                count = cur.rowcount
+        except Exception as e:
+            logging.warning(f"Error clearing cache: {e}")
+
+        logging.info(f"Cleared {count} expired cache entries")
         return count
 
 
+class TokenBucket:
+    """Token bucket for a single host, with AIMD rate adaptation.
+
+    Refills at `rate` tokens per second up to `capacity`. Throttling responses
+    (429/503) halve the rate; responses faster than the rolling median latency
+    nudge it back up, never beyond `max_rate`.
+    """
+
+    def __init__(self, requests_per_minute: int, capacity: Optional[float] = None,
+                 max_requests_per_minute: Optional[int] = None):
+        self.base_rate = requests_per_minute / 60.0  # tokens per second
+        self.rate = self.base_rate
+        self.min_rate = self.base_rate / 8
+        self.max_rate = (max_requests_per_minute or 2 * requests_per_minute) / 60.0
+        self.capacity = float(capacity if capacity is not None else ScraperConfig.BURST_CAPACITY)
+        self.tokens = self.capacity
+        # monotonic: immune to wall-clock jumps
+        self.last = time.monotonic()
+        self._latencies: Deque[float] = deque(maxlen=ScraperConfig.LATENCY_WINDOW)
+
+    def reserve(self) -> float:
+        """Take one token; return how long the caller must wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        # Negative balance is paid back by the refill during the wait.
+        return -self.tokens / self.rate
+
+    def record(self, status_code: int, latency: Optional[float] = None):
+        """Adapt the rate to how the host is coping."""
+        if status_code in (429, 503):
+            self.rate = max(self.min_rate, self.rate / 2)
+            return
+
+        if status_code < 400 and latency is not None:
+            fast = not self._latencies or latency <= median(self._latencies)
+            self._latencies.append(latency)
+            if fast:
+                self.rate = min(self.max_rate, self.rate + self.base_rate * 0.1)
+
+
 class RateLimiter:
-    """Rate limiter for polite scraping"""
+    """Per-host rate limiter for polite scraping (one `TokenBucket` per netloc)"""
     
-    def __init__(self, requests_per_minute: int = ScraperConfig.REQUESTS_PER_MINUTE):
+    def __init__(self, requests_per_minute: int = ScraperConfig.REQUESTS_PER_MINUTE,
+                 capacity: Optional[float] = None):
         self.requests_per_minute = requests_per_minute
-        self.request_times: List[float] = []
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Scrapers run concurrently; bucket state must not be double-charged.
+        self._lock = threading.Lock()
+
+    def bucket(self, url: Optional[str] = None) -> TokenBucket:
+        host = urlparse(url).netloc if url else ""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_minute, self.capacity)
+                self._buckets[host] = bucket
+            return bucket
     
-    def wait_if_needed(self):
-        """Wait if rate limit would be exceeded"""
-        now = time.time()
-        
-        # Remove requests older than 1 minute
-        self.request_times = [t for t in self.request_times if now - t < 60]
-        
-        # Check if we need to wait
-        if len(self.request_times) >= self.requests_per_minute:
-            oldest = self.request_times[0]
-            wait_time = 60 - (now - oldest)
-            
-            if wait_time > 0:
-                logging.info(f"Rate limit: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
-        
-        self.request_times.append(now)
+    def wait_if_needed(self, url: Optional[str] = None):
+        """Wait if the host's rate limit would be exceeded"""
+        bucket = self.bucket(url)
+        with self._lock:
+            wait_time = bucket.reserve()
+        # Sleep outside the lock so other hosts aren't blocked.
+        if wait_time > 0:
+            logging.info(f"Rate limit: waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
+
+    def record_response(self, url: Optional[str], status_code: int,
+                        latency: Optional[float] = None):
+        """Feed a response back so the host's rate can adapt"""
+        bucket = self.bucket(url)
+        with self._lock:
+            bucket.record(status_code, latency)
+
+
+# Shared across scrapers so politeness is enforced per host, not per scraper.
+SHARED_RATE_LIMITER = RateLimiter()
 
 
 class BaseScraper(ABC):
@@ -191,19 +587,22 @@ class BaseScraper(ABC):
     - Retry logic
     - User agent rotation
     """
+
+    # Hours a fetched page stays fresh; volatile sources override this.
+    CACHE_TTL: float = ScraperConfig.CACHE_EXPIRY_HOURS
     
-    def __init__(self, use_cache: bool = True):
+    def __init__(self, use_cache: bool = True, session: Optional[requests.Session] = None):
         self.use_cache = use_cache
         self.cache = CacheManager() if use_cache else None
-        self.rate_limiter = RateLimiter()
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        self.rate_limiter = SHARED_RATE_LIMITER
+        self.session = session if session is not None else get_shared_session(use_cache)
+        # requests-cache sessions expose `.cache`; they replace CacheManager for raw HTTP.
+        self.http_cached = hasattr(self.session, "cache")
         self.logger = logging.getLogger(self.__class__.__name__)
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Generate headers with random user agent"""
-        return {
-            'User-Agent': self.ua.random,
+        # One user agent per scraper; headers are passed per request so the
+        # shared session isn't mutated by other scrapers.
+        self._headers = {
+            'User-Agent': _random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
@@ -211,6 +610,15 @@ class BaseScraper(ABC):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
+        self._requests_since_ua = 0
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Headers for this scraper (user agent rotated every UA_ROTATE_EVERY requests)"""
+        self._requests_since_ua += 1
+        if self._requests_since_ua > ScraperConfig.UA_ROTATE_EVERY:
+            self._headers = {**self._headers, 'User-Agent': _random_user_agent()}
+            self._requests_since_ua = 1
+        return self._headers
     
     @retry(
         stop=stop_after_attempt(ScraperConfig.MAX_RETRIES),
@@ -232,39 +640,113 @@ class BaseScraper(ABC):
         Returns:
             HTML content
         """
-        # Check cache first
-        if use_cache and self.cache:
-            cached_data = self.cache.get(url, params)
+        # Check cache first (HTTP-caching sessions do this inside `session.get`)
+        cache_manager = self.cache if (use_cache and not self.http_cached) else None
+        validators = None
+        if cache_manager:
+            cached_data = cache_manager.get(url, params, max_age_hours=self.CACHE_TTL)
             if cached_data is not None:
                 return cached_data
+            # Expired but revalidatable: let the server answer 304 instead of resending
+            validators = cache_manager.revalidation_headers(url, params)
+        elif self.http_cached and use_cache:
+            # A fresh HTTP-cache hit sends nothing, so it must not spend a rate-limit token.
+            cached = self.session.get(
+                url, params=params, expire_after=timedelta(hours=self.CACHE_TTL), only_if_cached=True
+            )
+            # Misses come back as a synthetic 504 (also flagged from_cache).
+            if cached.status_code != 504 and getattr(cached, "from_cache", False):
+                self.logger.info(f"HTTP cache hit for {url}")
+                return cached.text
+
+        headers = self._get_headers()
+        if validators is not None:
+            headers = {**headers, **validators}
+        response = self._send(url, params, headers, use_cache)
+
+        if validators is not None and response.status_code == 304:
+            self.logger.info(f"Not modified: {url}")
+            cached_data = cache_manager.touch(url, params)
+            if cached_data is not None:
+                return cached_data
+            # Entry vanished since the validators were read: fetch it outright.
+            response = self._send(url, params, self._get_headers(), use_cache)
+
+        response.raise_for_status()
+        content = response.text
         
+        # Cache the response
+        if cache_manager:
+            cache_manager.set(
+                url, content, params,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                ttl_hours=self.CACHE_TTL,
+            )
+        
+        return content
+    
+    def _send(self, url: str, params: Optional[Dict], headers: Dict[str, str],
+              use_cache: bool) -> requests.Response:
+        """One paced GET: waits on the rate limiter and reports the response back to it"""
         # Rate limiting
-        self.rate_limiter.wait_if_needed()
+        self.rate_limiter.wait_if_needed(url)
         
-        # Make request
+        # Make request (pacing is entirely the rate limiter's job)
         self.logger.info(f"Fetching {url}")
-        time.sleep(ScraperConfig.DELAY_BETWEEN_REQUESTS)
         
-        response = self.session.get(
-            url,
+        request_kwargs = dict(
             params=params,
-            headers=self._get_headers(),
+            headers=headers,
             timeout=ScraperConfig.TIMEOUT,
             verify=ScraperConfig.VERIFY_SSL
         )
+        if self.http_cached and not use_cache:
+            with self.session.cache_disabled():
+                response = self.session.get(url, **request_kwargs)
+        elif self.http_cached:
+            response = self.session.get(
+                url, expire_after=timedelta(hours=self.CACHE_TTL), **request_kwargs
+            )
+        else:
+            response = self.session.get(url, **request_kwargs)
         
-        response.raise_for_status()
-        content = response.text
-        
-        # Cache the response
-        if use_cache and self.cache:
-            self.cache.set(url, content, params)
-        
-        return content
+        if getattr(response, "from_cache", False):
+            self.logger.info(f"HTTP cache hit for {url}")
+        else:
+            elapsed = getattr(response, "elapsed", None)
+            self.rate_limiter.record_response(
+                url, response.status_code, elapsed.total_seconds() if elapsed else None
+            )
+        return response
     
-    def _parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content"""
-        return BeautifulSoup(html, 'lxml')
+    def _parse_html(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML content (optionally only the subtrees matching `parse_only`)"""
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+    def _parse_tree(self, html: str) -> "lxml.html.HtmlElement":
+        """Parse a full page into an lxml tree (no soup) - for pages read with XPath"""
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # str input carrying an <?xml encoding=...?> declaration
+            root = lxml.html.document_fromstring(html.encode("utf-8"))
+        # get_text() never returns script/style bodies; keep itertext() consistent.
+        lxml.etree.strip_elements(root, "script", "style", "template", with_tail=False)
+        return root
+
+    @staticmethod
+    def _element_text(element: Any, separator: str = "\n") -> str:
+        """Equivalent of soup `get_text(separator)` for an lxml element"""
+        return separator.join(element.itertext())
+
+    def _fragment_text(self, markup: str, separator: str = "\n") -> str:
+        """Text of a small HTML fragment (RSS summaries etc.) without building a soup"""
+        if not markup:
+            return ""
+        root = lxml.html.fragment_fromstring(markup, create_parent="div")
+        lxml.etree.strip_elements(root, "script", "style", "template", with_tail=False)
+        return self._element_text(root, separator)
     
     @abstractmethod
     def scrape(self) -> List[Dict[str, Any]]:
@@ -293,21 +775,13 @@ class BaseScraper(ABC):
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Remove common artifacts
-        text = text.replace('\xa0', ' ')
-        text = text.replace('\u200b', '')
-        
-        return text.strip()
+        # Drop artifacts first so a removed zero-width space can't leave a double space
+        return _WS_RE.sub(' ', text.translate(_TEXT_ARTIFACTS)).strip()
     
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime - override for specific formats"""
-        from dateutil.parser import parse
-        
         try:
-            return parse(date_str)
+            return _parse_date_text((date_str or "").strip())
         except Exception as e:
             self.logger.warning(f"Failed to parse date '{date_str}': {e}")
             return None
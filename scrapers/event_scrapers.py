@@ -2,17 +2,38 @@
 Scrapers for AI events, conferences, meetups, and workshops
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass, field
-from scrapers.base_scraper import BaseScraper
-import feedparser
+from scrapers.base_scraper import BaseScraper, keyword_re
+from lxml import etree
+import lxml.html
 import re
+import requests
 
-from models import FactSource
+from models import SLOTS, FactSource
 
 
-@dataclass
+_EVENT_CARDS = etree.XPath("//div[contains(@class, 'discover-search-desktop-card')]")
+_CARD_DATE_P = etree.XPath("(.//p[contains(@class, 'date')])[1]")
+_CARD_DESCRIPTION_P = etree.XPath("(.//p[contains(@class, 'description')])[1]")
+# Sources return events in this order, so callers can heapq.merge them.
+_BY_DATE = attrgetter('date')
+
+
+def parse_card_fragment(html: str) -> "lxml.html.HtmlElement":
+    """Parse an event card's markup into an lxml element (wrapped in a <div>)"""
+    return lxml.html.fragment_fromstring(html, create_parent="div")
+
+
+def _first(matches: list) -> Optional[Any]:
+    return matches[0] if matches else None
+
+
+@dataclass(**SLOTS)
 class AIEvent:
     """Represents an AI event"""
     name: str
@@ -28,6 +49,12 @@ class AIEvent:
     registration_url: Optional[str] = None
     sources: List[FactSource] = field(default_factory=list)
     confidence: float = 0.5
+    # Dedup identity, computed once at construction.
+    _key: Tuple[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        day = self.date.date() if isinstance(self.date, datetime) else self.date
+        self._key = (self.name.lower(), day)
     
     def is_upcoming(self) -> bool:
         """Check if event is in the future"""
@@ -41,6 +68,7 @@ class AIEvent:
 class EventbriteScraper(BaseScraper):
     """Scrape AI events from Eventbrite"""
     
+    CACHE_TTL = 6  # Listings change through the day
     BASE_URL = "https://www.eventbrite.com"
     SEARCH_URL = "https://www.eventbrite.com/d/online/artificial-intelligence/"
 
@@ -59,9 +87,32 @@ class EventbriteScraper(BaseScraper):
         "agentic",
     ]
 
+    # Same substring semantics as `any(k in text ...)`, in one C-level scan.
+    _AI_RE = keyword_re(AI_KEYWORDS)
+
+    TOPIC_KEYWORDS = {
+        'Machine Learning': ['machine learning', 'ml'],
+        'Deep Learning': ['deep learning', 'neural network'],
+        'NLP': ['nlp', 'natural language', 'language model'],
+        'Computer Vision': ['computer vision', 'image recognition'],
+        'GenAI': ['generative ai', 'genai', 'gpt', 'llm'],
+        'AI Safety': ['ai safety', 'alignment', 'ethics'],
+        'Robotics': ['robotics', 'autonomous'],
+        'Entrepreneurship': ['startup', 'entrepreneur', 'business'],
+    }
+    _TOPIC_LABELS = list(TOPIC_KEYWORDS)
+    # One named group per topic inside a lookahead, so overlapping keywords
+    # (e.g. "generative ai safety") still report every topic.
+    _TOPIC_RE = re.compile(
+        "(?=" + "|".join(
+            f"(?P<t{i}>{'|'.join(map(re.escape, kws))})"
+            for i, kws in enumerate(TOPIC_KEYWORDS.values())
+        ) + ")",
+        re.IGNORECASE,
+    )
+
     def _looks_ai_related(self, name: str, description: str) -> bool:
-        text = f"{name} {description}".lower()
-        return any(k in text for k in self.AI_KEYWORDS)
+        return self._AI_RE.search(f"{name} {description}") is not None
     
     def scrape(self, days_ahead: int = 90) -> List[AIEvent]:
         """
@@ -71,17 +122,17 @@ class EventbriteScraper(BaseScraper):
             days_ahead: How many days ahead to look for events
         
         Returns:
-            List of AIEvent objects
+            List of AIEvent objects, soonest first
         """
         self.logger.info("Scraping Eventbrite for AI events...")
         events = []
         
         try:
             html = self._fetch_url(self.SEARCH_URL)
-            soup = self._parse_html(html)
+            root = self._parse_tree(html)
             
             # Find event cards (structure may vary - this is an example)
-            event_cards = soup.find_all('div', class_=re.compile('discover-search-desktop-card'))
+            event_cards = _EVENT_CARDS(root)
             
             for card in event_cards[:20]:  # Limit to first 20
                 try:
@@ -96,24 +147,32 @@ class EventbriteScraper(BaseScraper):
             self.logger.error(f"Error scraping Eventbrite: {e}")
         
         self.logger.info(f"Found {len(events)} events from Eventbrite")
+        events.sort(key=_BY_DATE)
         return events
     
     def _parse_event_card(self, card) -> Optional[AIEvent]:
-        """Parse individual event card"""
+        """Parse individual event card (an lxml element, or a bs4 Tag)"""
         try:
-            # Extract event name
-            name_elem = card.find('h3') or card.find('h2')
-            if not name_elem:
+            if not isinstance(card, etree._Element):
+                card = parse_card_fragment(str(card))
+
+            # Extract event name (lxml elements without children are falsy: test `is None`)
+            name_elem = card.find('.//h3')
+            if name_elem is None:
+                name_elem = card.find('.//h2')
+            if name_elem is None:
                 return None
-            name = self.clean_text(name_elem.get_text())
+            name = self.clean_text(self._element_text(name_elem, ""))
             
             # Extract URL
-            link_elem = card.find('a', href=True)
-            url = link_elem['href'] if link_elem else None
+            link_elem = card.find('.//a[@href]')
+            url = link_elem.get('href') if link_elem is not None else None
             
             # Extract date (this is simplified - actual parsing depends on HTML structure)
-            date_elem = card.find('time') or card.find('p', class_=re.compile('date'))
-            date_str = date_elem.get_text() if date_elem else None
+            date_elem = card.find('.//time')
+            if date_elem is None:
+                date_elem = _first(_CARD_DATE_P(card))
+            date_str = self._element_text(date_elem, "") if date_elem is not None else None
             if not date_str:
                 # Don't invent dates; if we can't parse a date reliably, drop the event.
                 return None
@@ -123,8 +182,8 @@ class EventbriteScraper(BaseScraper):
                 return None
             
             # Extract description
-            desc_elem = card.find('p', class_=re.compile('description'))
-            description = self.clean_text(desc_elem.get_text()) if desc_elem else ""
+            desc_elem = _first(_CARD_DESCRIPTION_P(card))
+            description = self.clean_text(self._element_text(desc_elem, "")) if desc_elem is not None else ""
 
             # Hard filter: Eventbrite search pages can include unrelated results.
             if not self._looks_ai_related(name, description):
@@ -183,23 +242,8 @@ class EventbriteScraper(BaseScraper):
     
     def _extract_topics(self, name: str, description: str) -> List[str]:
         """Extract topics from event name and description"""
-        text = f"{name} {description}".lower()
-        topics = []
-        
-        topic_keywords = {
-            'Machine Learning': ['machine learning', 'ml'],
-            'Deep Learning': ['deep learning', 'neural network'],
-            'NLP': ['nlp', 'natural language', 'language model'],
-            'Computer Vision': ['computer vision', 'image recognition'],
-            'GenAI': ['generative ai', 'genai', 'gpt', 'llm'],
-            'AI Safety': ['ai safety', 'alignment', 'ethics'],
-            'Robotics': ['robotics', 'autonomous'],
-            'Entrepreneurship': ['startup', 'entrepreneur', 'business'],
-        }
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                topics.append(topic)
+        found = {m.lastgroup for m in self._TOPIC_RE.finditer(f"{name} {description}")}
+        topics = [label for i, label in enumerate(self._TOPIC_LABELS) if f"t{i}" in found]
         
         # Do not default to ['AI']; that would falsely label unrelated events.
         return topics
@@ -242,11 +286,11 @@ class LumaScraper(BaseScraper):
             # This is a simplified version
             
             search_url = f"{self.DISCOVER_URL}?q=artificial+intelligence"
-            html = self._fetch_url(search_url)
-            soup = self._parse_html(html)
+            self._fetch_url(search_url)
             
             # Parse event listings
-            # Note: Actual structure depends on Lu.ma's current HTML
+            # Note: Actual structure depends on Lu.ma's current HTML; the page is
+            # not parsed until there is a card extractor to consume the tree.
             
             self.logger.info(f"Found {len(events)} events from Lu.ma")
         
@@ -308,37 +352,59 @@ class AIConferenceTracker:
     
     @classmethod
     def get_major_conferences(cls, days_ahead: int = 365) -> List[AIEvent]:
-        """Get list of major AI conferences"""
-        cutoff_date = datetime.now() + timedelta(days=days_ahead)
-        
-        events = []
-        for conf_data in cls.MAJOR_CONFERENCES:
-            if conf_data['date'] <= cutoff_date:
-                sources = [
-                    FactSource(
-                        source_name="Curated (official site)",
-                        url=conf_data.get("url"),
-                        retrieved_at=datetime.now(),
-                        evidence_quote=conf_data.get("description"),
-                    )
-                ]
-                events.append(
-                    AIEvent(
-                        **conf_data,
-                        sources=sources,
-                        confidence=0.6,
-                    )
+        """Get list of major AI conferences (those on or before the cutoff day), soonest first"""
+        return list(_conferences_until(date.today() + timedelta(days=days_ahead)))
+
+
+def _build_curated_events(conferences: List[Dict[str, Any]]) -> List[AIEvent]:
+    """Turn curated conference dicts into grounded AIEvents (done once, at import)."""
+    # Curated entries aren't scraped; "retrieved" is when this list was loaded.
+    retrieved_at = datetime.now()
+    return [
+        AIEvent(
+            **conf_data,
+            sources=[
+                FactSource(
+                    source_name="Curated (official site)",
+                    url=conf_data.get("url"),
+                    retrieved_at=retrieved_at,
+                    evidence_quote=conf_data.get("description"),
                 )
-        
-        return events
+            ],
+            confidence=0.6,
+        )
+        for conf_data in conferences
+    ]
+
+
+# Static data: build once. Callers share these instances and must not mutate them.
+_BUILT_CONFERENCES: List[AIEvent] = _build_curated_events(AIConferenceTracker.MAJOR_CONFERENCES)
+
+
+@lru_cache(maxsize=8)
+def _conferences_until(last_day: date) -> Tuple[AIEvent, ...]:
+    # Keyed on the cutoff *day*, so a long-lived process still rolls the window daily.
+    return tuple(sorted((e for e in _BUILT_CONFERENCES if e.date.date() <= last_day), key=_BY_DATE))
+
+
+def invalidate_curated_cache() -> None:
+    """Rebuild curated conferences from MAJOR_CONFERENCES and drop memoized windows."""
+    global _BUILT_CONFERENCES
+    _BUILT_CONFERENCES = _build_curated_events(AIConferenceTracker.MAJOR_CONFERENCES)
+    _conferences_until.cache_clear()
 
 
 class EventAggregator:
     """Aggregate events from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: HTTP session shared by all scrapers (defaults to the
+                process-wide pooled session from `get_shared_session`)
+        """
         self.scrapers = [
-            EventbriteScraper(),
+            EventbriteScraper(session=session),
             # MeetupScraper(),  # Requires API key
             # LumaScraper(),  # Might need Selenium
         ]
@@ -354,30 +420,38 @@ class EventAggregator:
             List of AIEvent objects
         """
         all_events = []
+        # Deduplicate as events arrive (first occurrence wins)
+        seen = set()
         
-        # Scrape from dynamic sources
-        for scraper in self.scrapers:
-            try:
-                events = scraper.scrape(days_ahead=days_ahead)
-                all_events.extend(events)
-            except Exception as e:
-                print(f"Scraper failed: {e}")
-                continue
+        # Scrape from dynamic sources concurrently (independent hosts, I/O-bound).
+        # Results are collected in scraper order so dedup stays deterministic.
+        with ThreadPoolExecutor(max_workers=max(1, len(self.scrapers))) as ex:
+            futures = [ex.submit(s.scrape, days_ahead=days_ahead) for s in self.scrapers]
+            for future in futures:
+                try:
+                    events = future.result()
+                except Exception as e:
+                    print(f"Scraper failed: {e}")
+                    continue
+                for ev in events:
+                    if ev._key not in seen:
+                        seen.add(ev._key)
+                        all_events.append(ev)
         
         # Add major conferences
-        major_events = AIConferenceTracker.get_major_conferences(days_ahead)
-        all_events.extend(major_events)
-        
-        # Deduplicate
-        all_events = self._deduplicate(all_events)
+        for ev in AIConferenceTracker.get_major_conferences(days_ahead):
+            if ev._key not in seen:
+                seen.add(ev._key)
+                all_events.append(ev)
 
         # Validate grounding + sanity (drop invalid)
         from validation import validate_event
 
         valid_events: List[AIEvent] = []
         invalid_count = 0
+        now = datetime.now()
         for ev in all_events:
-            res = validate_event(ev)
+            res = validate_event(ev, now=now)
             if res.ok:
                 valid_events.append(ev)
             else:
@@ -396,13 +470,13 @@ class EventAggregator:
         
         return all_events
     
-    def _deduplicate(self, events: List[AIEvent]) -> List[AIEvent]:
-        """Remove duplicate events"""
+    def _deduplicate(self, events: Iterable[AIEvent]) -> List[AIEvent]:
+        """Remove duplicate events (first occurrence wins, order kept)"""
         seen = set()
         unique = []
         
         for event in events:
-            key = (event.name.lower(), event.date.date())
+            key = event._key
             if key not in seen:
                 seen.add(key)
                 unique.append(event)
@@ -2,11 +2,15 @@
 Real data scrapers for AI investment news from multiple sources
 """
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import re
-import feedparser
-from scrapers.base_scraper import BaseScraper
+import requests
+from bs4 import SoupStrainer
+from lxml import etree
+from scrapers.base_scraper import BaseScraper, ScraperConfig, keyword_re
 from models import Investment, Company, FactSource
 from newsletter_factory import InvestmentStage
 
@@ -16,13 +20,101 @@ from parsing.extractors import (
     extract_company_name_from_title,
     extract_investor_names,
 )
+from parsing.rss import parse_rss_entries
 
 from validation import validate_investment
 
 
+_ARTICLE_STRAINER = SoupStrainer('article')
+
+_ROUND_RE = re.compile(r"(seed|series [a-f]|series [a-f]\+|acquisition|ipo)", re.IGNORECASE)
+# Unit letter (million/billion/M/B) on an evidence line.
+_EVIDENCE_UNIT_RE = re.compile(r"[mb]", re.IGNORECASE)
+_LISTING_FUNDING_RE = keyword_re(['raises', 'funding', 'investment', 'series'])
+_CRUNCHBASE_FUNDING_RE = keyword_re(['funding', 'raises', 'investment', 'venture'])
+
+
+def _class_xpath(tag: str, css_class: str) -> "etree.XPath":
+    # Whole-token class match, like soup.find(tag, class_=css_class)
+    return etree.XPath(
+        f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+    )
+
+
+# Same priority order as the former soup.find() chain.
+_TC_CONTAINER_XPATHS = (
+    _class_xpath("div", "article-content"),
+    _class_xpath("div", "entry-content"),
+    etree.XPath("//div[contains(@class, 'content')]"),  # any class token containing "content"
+    etree.XPath("//article"),
+)
+_ARTICLE_XPATH = etree.XPath("//article")
+_H1_XPATH = etree.XPath("//h1")
+_TIME_XPATH = etree.XPath("//time")
+
+
+def _first(elements: List[Any]) -> Optional[Any]:
+    return elements[0] if elements else None
+
+
+@lru_cache(maxsize=16)
+def _feed_entries(xml: str) -> Tuple[Any, ...]:
+    """Parsed entries of a feed body, memoized on the body itself.
+
+    A 304 (or a cache hit) hands back the same body as last time, so an
+    unchanged feed costs a hash lookup instead of another XML parse.
+    Entries are shared between calls and must be treated as read-only.
+    """
+    return tuple(parse_rss_entries(xml))
+
+
+# Shared by every investment without a named lead investor; treat as read-only.
+_UNDISCLOSED_INVESTORS = Company(
+    name="Undisclosed Investors",
+    description="Undisclosed investor",
+    sector="VC Firm",
+)
+
+
+_NAME_PUNCT_RE = re.compile(r"[^\w\s]+")
+_LEGAL_SUFFIX_RE = re.compile(r"(?:\s+(?:inc|incorporated|corp|corporation|co|ltd|llc|gmbh|plc|sa))+$")
+
+
+@lru_cache(maxsize=4096)
+def _canonical_company(name: str) -> str:
+    """Dedup form of a company name: "Acme AI, Inc." and "acme ai" agree.
+
+    Casefolds, drops punctuation and trailing legal suffixes, collapses spaces.
+    """
+    name = " ".join(_NAME_PUNCT_RE.sub(" ", name.casefold()).split())
+    return _LEGAL_SUFFIX_RE.sub("", name) or name
+
+
+def _evidence_line(text: str) -> Optional[str]:
+    """First line that mentions "$" alongside a unit letter (million/billion/M/B).
+
+    Jumps between "$" occurrences with str.find rather than splitting the text
+    into lines, so it never materializes the line list and stops at the first hit.
+    """
+    pos = text.find("$")
+    while pos != -1:
+        start = max(text.rfind("\n", 0, pos), text.rfind("\r", 0, pos)) + 1
+        end = len(text)
+        for sep in ("\n", "\r"):
+            i = text.find(sep, pos)
+            if i != -1 and i < end:
+                end = i
+        line = text[start:end]
+        if _EVIDENCE_UNIT_RE.search(line):
+            return line
+        pos = text.find("$", end)
+    return None
+
+
 class TechCrunchScraper(BaseScraper):
     """Scrape AI investment news from TechCrunch"""
     
+    CACHE_TTL = 1  # Funding news moves fast
     BASE_URL = "https://techcrunch.com"
     RSS_FEEDS = [
         # The AI tag feed is the most on-topic but can be quiet.
@@ -58,13 +150,36 @@ class TechCrunchScraper(BaseScraper):
         "agentic",
     ]
 
+    _FUNDING_RE = keyword_re(FUNDING_KEYWORDS)
+    _AI_RE = keyword_re(AI_KEYWORDS)
+    # Both gates in one pass; lookahead so overlapping hits ("ai" in "raised") count.
+    _GATE_RE = re.compile(
+        f"(?=(?P<funding>{_FUNDING_RE.pattern})|(?P<ai>{_AI_RE.pattern}))", re.IGNORECASE
+    )
+
     def _looks_funding_related(self, text: str) -> bool:
-        t = (text or "").lower()
-        return any(k in t for k in self.FUNDING_KEYWORDS)
+        return bool(text) and self._FUNDING_RE.search(text) is not None
+
+    def _gate(self, text: str, need_ai: bool) -> bool:
+        """Funding-related and (if `need_ai`) AI-related, from a single scan"""
+        if not text:
+            return False
+        funding = ai = False
+        for match in self._GATE_RE.finditer(text):
+            if match.lastgroup == "funding":
+                funding = True
+                # The alternation reports one gate per position; an AI keyword
+                # could start at the same offset.
+                if need_ai and not ai and self._AI_RE.match(text, match.start()):
+                    ai = True
+            else:
+                ai = True
+            if funding and (ai or not need_ai):
+                return True
+        return False
 
     def _looks_ai_related(self, text: str) -> bool:
-        t = (text or "").lower()
-        return any(k in t for k in self.AI_KEYWORDS)
+        return bool(text) and self._AI_RE.search(text) is not None
 
     def _entry_text(self, entry: Any) -> str:
         """Best-effort extract readable text from an RSS entry."""
@@ -81,13 +196,20 @@ class TechCrunchScraper(BaseScraper):
                 parts.append(str(value))
 
         raw = "\n".join(parts)
-        # RSS summary/content can contain HTML.
+        # RSS summary/content can contain HTML; fragments are small, skip the soup.
         try:
-            soup = self._parse_html(raw)
-            return self.clean_text(soup.get_text("\n"))
+            return self.clean_text(self._fragment_text(raw))
         except Exception:
             return self.clean_text(raw)
     
+    def _fetch_feed(self, feed_info: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        try:
+            rss_xml = self._fetch_url(feed_info["url"], use_cache=True)
+            return _feed_entries(rss_xml)
+        except Exception as e:
+            self.logger.warning(f"Error fetching TechCrunch feed {feed_info['name']}: {e}")
+            return None
+    
     def scrape(self, days_back: int = 7) -> List[Dict[str, Any]]:
         """
         Scrape TechCrunch AI news
@@ -105,16 +227,18 @@ class TechCrunchScraper(BaseScraper):
             cutoff_date = datetime.now() - timedelta(days=days_back)
 
             seen_urls = set()
+            # (url, pub_date, data) in feed order; data is None until the article is fetched
+            candidates: List[Tuple[str, datetime, Optional[Dict[str, Any]]]] = []
 
-            for feed_info in self.RSS_FEEDS:
-                try:
-                    rss_xml = self._fetch_url(feed_info["url"], use_cache=True)
-                    feed = feedparser.parse(rss_xml)
-                except Exception as e:
-                    self.logger.warning(f"Error fetching TechCrunch feed {feed_info['name']}: {e}")
+            # Feeds are independent requests; fetch them concurrently (order preserved).
+            with ThreadPoolExecutor(max_workers=len(self.RSS_FEEDS)) as ex:
+                feeds = list(ex.map(self._fetch_feed, self.RSS_FEEDS))
+
+            for feed_info, entries in zip(self.RSS_FEEDS, feeds):
+                if entries is None:
                     continue
 
-                for entry in getattr(feed, "entries", []) or []:
+                for entry in entries:
                     try:
                         pub_struct = getattr(entry, "published_parsed", None)
                         if not pub_struct:
@@ -130,10 +254,7 @@ class TechCrunchScraper(BaseScraper):
 
                         entry_text = self._entry_text(entry)
 
-                        if not self._looks_funding_related(entry_text):
-                            continue
-
-                        if feed_info.get("require_ai") and not self._looks_ai_related(entry_text):
+                        if not self._gate(entry_text, need_ai=bool(feed_info.get("require_ai"))):
                             continue
 
                         # Prefer extracting from RSS content first (faster, less brittle)
@@ -146,7 +267,8 @@ class TechCrunchScraper(BaseScraper):
                             article_data = {
                                 "title": title_text,
                                 "amount": amount,
-                                "raw_text": self.clean_text(entry_text[:1000]),
+                                # entry_text is already clean_text()'d
+                                "raw_text": entry_text[:1000].rstrip(),
                             }
 
                             investors = extract_investor_names(entry_text)
@@ -154,34 +276,37 @@ class TechCrunchScraper(BaseScraper):
                                 article_data["lead_investor"] = investors[0]
                                 article_data["investors"] = investors
 
-                            round_match = re.search(
-                                r"(seed|series [a-f]|series [a-f]\+|acquisition|ipo)",
-                                entry_text,
-                                re.IGNORECASE,
-                            )
+                            round_match = _ROUND_RE.search(entry_text)
                             if round_match:
                                 article_data["round"] = round_match.group(1)
 
                             # Evidence: first line mentioning money.
-                            for line in entry_text.splitlines():
-                                if "$" in line and any(k in line.lower() for k in ["million", "billion", "m", "b"]):
-                                    article_data["evidence_quote"] = self.clean_text(line)
-                                    break
-
-                        # Fallback: fetch full article if RSS content didn't contain an amount.
-                        if article_data is None:
-                            article_data = self._scrape_article(url)
-
-                        if article_data:
-                            article_data["source"] = "TechCrunch"
-                            article_data["url"] = url
-                            article_data["date"] = pub_date
-                            investments.append(article_data)
-                            seen_urls.add(url)
+                            evidence = _evidence_line(entry_text)
+                            if evidence:
+                                article_data["evidence_quote"] = self.clean_text(evidence)
+
+                        candidates.append((url, pub_date, article_data))
+                        seen_urls.add(url)
 
                     except Exception as e:
                         self.logger.warning(f"Error processing TechCrunch entry: {e}")
                         continue
+
+            # Fallback: fetch full articles where RSS content didn't contain an amount.
+            pending = [url for url, _, data in candidates if data is None]
+            fetched: Dict[str, Optional[Dict[str, Any]]] = {}
+            if pending:
+                with ThreadPoolExecutor(max_workers=ScraperConfig.MAX_WORKERS) as ex:
+                    fetched = dict(zip(pending, ex.map(self._scrape_article, pending)))
+
+            for url, pub_date, article_data in candidates:
+                if article_data is None:
+                    article_data = fetched.get(url)
+                if article_data:
+                    article_data["source"] = "TechCrunch"
+                    article_data["url"] = url
+                    article_data["date"] = pub_date
+                    investments.append(article_data)
         
         except Exception as e:
             self.logger.error(f"Error scraping TechCrunch: {e}")
@@ -193,20 +318,20 @@ class TechCrunchScraper(BaseScraper):
         """Scrape individual article for investment details"""
         try:
             html = self._fetch_url(url)
-            soup = self._parse_html(html)
+            # Only a container's text and the <h1> are read: plain lxml tree, no soup.
+            root = self._parse_tree(html)
 
             # TechCrunch markup changes over time; attempt several likely containers.
-            container = (
-                soup.find("div", class_="article-content")
-                or soup.find("div", class_="entry-content")
-                or soup.find("div", class_=re.compile(r"article__content|content"))
-                or soup.find("article")
-            )
+            container = None
+            for find in _TC_CONTAINER_XPATHS:
+                container = _first(find(root))
+                if container is not None:
+                    break
 
-            if not container:
+            if container is None:
                 return None
 
-            text = container.get_text("\n")
+            text = self._element_text(container)
             
             # Extract investment details using regex patterns
             data = {
@@ -214,9 +339,9 @@ class TechCrunchScraper(BaseScraper):
             }
             
             # Extract company name (usually in title or first paragraph)
-            title = soup.find('h1')
-            if title:
-                data['title'] = self.clean_text(title.get_text())
+            title = _first(_H1_XPATH(root))
+            if title is not None:
+                data['title'] = self.clean_text(self._element_text(title, ""))
             
             # Extract funding amount (USD millions)
             amount = parse_money_usd_millions(text)
@@ -224,7 +349,7 @@ class TechCrunchScraper(BaseScraper):
                 data['amount'] = amount
             
             # Extract funding round
-            round_match = re.search(r'(seed|series [a-f]|series [a-f]\+|acquisition|ipo)', text, re.IGNORECASE)
+            round_match = _ROUND_RE.search(text)
             if round_match:
                 data['round'] = round_match.group(1)
             
@@ -235,10 +360,9 @@ class TechCrunchScraper(BaseScraper):
                 data['investors'] = investors
 
             # Evidence quote: first line mentioning "$" (best-effort, used for grounding)
-            for line in text.splitlines():
-                if "$" in line and any(k in line.lower() for k in ["million", "billion", "m", "b"]):
-                    data['evidence_quote'] = self.clean_text(line)
-                    break
+            evidence = _evidence_line(text)
+            if evidence:
+                data['evidence_quote'] = self.clean_text(evidence)
             
             return data if data.get('amount') else None
         
@@ -250,6 +374,7 @@ class TechCrunchScraper(BaseScraper):
 class VentureBeatScraper(BaseScraper):
     """Scrape AI investment news from VentureBeat"""
     
+    CACHE_TTL = 1  # Funding news moves fast
     BASE_URL = "https://venturebeat.com"
     AI_NEWS_URL = "https://venturebeat.com/category/ai/"
     
@@ -263,7 +388,8 @@ class VentureBeatScraper(BaseScraper):
                 url = f"{self.AI_NEWS_URL}page/{page}/" if page > 1 else self.AI_NEWS_URL
                 
                 html = self._fetch_url(url)
-                soup = self._parse_html(html)
+                # Listing pages only need the <article> teasers.
+                soup = self._parse_html(html, parse_only=_ARTICLE_STRAINER)
                 
                 # Find article links
                 articles = soup.find_all('article')
@@ -278,8 +404,7 @@ class VentureBeatScraper(BaseScraper):
                         title = link_elem.get_text()
                         
                         # Check if funding-related
-                        if any(keyword in title.lower() 
-                               for keyword in ['raises', 'funding', 'investment', 'series']):
+                        if _LISTING_FUNDING_RE.search(title):
                             
                             article_data = self._scrape_article(article_url)
                             if article_data:
@@ -301,13 +426,13 @@ class VentureBeatScraper(BaseScraper):
         """Extract investment details from VentureBeat article"""
         try:
             html = self._fetch_url(url)
-            soup = self._parse_html(html)
+            root = self._parse_tree(html)
             
-            article = soup.find('article')
-            if not article:
+            article = _first(_ARTICLE_XPATH(root))
+            if article is None:
                 return None
             
-            text = article.get_text("\n")
+            text = self._element_text(article)
             
             data = {}
             
@@ -316,24 +441,23 @@ class VentureBeatScraper(BaseScraper):
                 data['amount'] = amount
             
             # Extract company and round
-            title = soup.find('h1')
-            if title:
-                data['title'] = self.clean_text(title.get_text())
+            title = _first(_H1_XPATH(root))
+            if title is not None:
+                data['title'] = self.clean_text(self._element_text(title, ""))
 
             investors = extract_investor_names(text)
             if investors:
                 data['lead_investor'] = investors[0]
                 data['investors'] = investors
 
-            for line in text.splitlines():
-                if "$" in line and any(k in line.lower() for k in ["million", "billion", "m", "b"]):
-                    data['evidence_quote'] = self.clean_text(line)
-                    break
+            evidence = _evidence_line(text)
+            if evidence:
+                data['evidence_quote'] = self.clean_text(evidence)
             
             # Date
-            time_elem = soup.find('time')
-            if time_elem and time_elem.get('datetime'):
-                data['date'] = self.parse_date(time_elem['datetime'])
+            time_elem = _first(_TIME_XPATH(root))
+            if time_elem is not None and time_elem.get('datetime'):
+                data['date'] = self.parse_date(time_elem.get('datetime'))
             
             return data if data.get('amount') else None
         
@@ -349,6 +473,7 @@ class CrunchbaseNewsScraper(BaseScraper):
     This scraper uses the public news feed
     """
     
+    CACHE_TTL = 1  # Funding news moves fast
     NEWS_URL = "https://news.crunchbase.com/feed/"
 
     AI_KEYWORDS = [
@@ -366,9 +491,10 @@ class CrunchbaseNewsScraper(BaseScraper):
         "agentic",
     ]
 
+    _AI_RE = keyword_re(AI_KEYWORDS)
+
     def _looks_ai_related(self, text: str) -> bool:
-        t = (text or "").lower()
-        return any(k in t for k in self.AI_KEYWORDS)
+        return bool(text) and self._AI_RE.search(text) is not None
     
     def scrape(self, days_back: int = 7) -> List[Dict[str, Any]]:
         """Scrape Crunchbase news RSS feed"""
@@ -376,17 +502,22 @@ class CrunchbaseNewsScraper(BaseScraper):
         investments = []
         
         try:
-            feed = feedparser.parse(self.NEWS_URL)
+            # Through _fetch_url (not feedparser's own fetch) for caching, rate limiting
+            # and ETag/Last-Modified revalidation.
+            entries = _feed_entries(self._fetch_url(self.NEWS_URL, use_cache=True))
             cutoff_date = datetime.now() - timedelta(days=days_back)
             
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     pub_date = datetime(*entry.published_parsed[:6])
                     
                     if pub_date < cutoff_date:
                         continue
                     
-                    title = entry.title.lower()
+                    # Cheap title check first; the AI check scans title + summary.
+                    if not _CRUNCHBASE_FUNDING_RE.search(entry.title):
+                        continue
+
                     summary = getattr(entry, "summary", "")
                     combined = f"{entry.title} {summary}"
 
@@ -394,24 +525,21 @@ class CrunchbaseNewsScraper(BaseScraper):
                     if not self._looks_ai_related(combined):
                         continue
                     
-                    if any(keyword in title 
-                           for keyword in ['funding', 'raises', 'investment', 'venture']):
-                        
-                        data = {
-                            'title': self.clean_text(entry.title),
-                            'summary': self.clean_text(entry.summary),
-                            'url': entry.link,
-                            'date': pub_date,
-                            'source': 'Crunchbase News'
-                        }
-                        
-                        # Try to extract amount from title/summary
-                        text = f"{entry.title} {entry.summary}"
-                        amount = parse_money_usd_millions(text)
-                        if amount is not None:
-                            data['amount'] = amount
-                            data['evidence_quote'] = self.clean_text(entry.title)
-                            investments.append(data)
+                    title = self.clean_text(entry.title)
+                    data = {
+                        'title': title,
+                        'summary': self.clean_text(summary),
+                        'url': entry.link,
+                        'date': pub_date,
+                        'source': 'Crunchbase News'
+                    }
+                    
+                    # Try to extract amount from title/summary
+                    amount = parse_money_usd_millions(combined)
+                    if amount is not None:
+                        data['amount'] = amount
+                        data['evidence_quote'] = title
+                        investments.append(data)
                 
                 except Exception as e:
                     self.logger.warning(f"Error processing Crunchbase entry: {e}")
@@ -430,11 +558,36 @@ class InvestmentDataAggregator:
     and converts to standardized Investment objects
     """
     
-    def __init__(self):
+    # Checked in priority order (first listed sector wins)
+    SECTOR_KEYWORDS = {
+        'LLM': ['language model', 'llm', 'gpt', 'chatbot', 'conversational ai'],
+        'Computer Vision': ['computer vision', 'image recognition', 'visual ai'],
+        'Robotics': ['robotics', 'autonomous', 'robot'],
+        'Developer Tools': ['developer', 'api', 'sdk', 'platform'],
+        'Healthcare AI': ['healthcare', 'medical', 'diagnosis', 'health'],
+        'AI Infrastructure': ['infrastructure', 'cloud', 'compute', 'gpu'],
+        'Enterprise AI': ['enterprise', 'b2b', 'business'],
+    }
+    _SECTOR_LABELS = list(SECTOR_KEYWORDS)
+    # Lookahead so overlapping keywords from different sectors are all seen.
+    _SECTOR_RE = re.compile(
+        "(?=" + "|".join(
+            f"(?P<s{i}>{'|'.join(map(re.escape, kws))})"
+            for i, kws in enumerate(SECTOR_KEYWORDS.values())
+        ) + ")",
+        re.IGNORECASE,
+    )
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: HTTP session shared by all scrapers (defaults to the
+                process-wide pooled session from `get_shared_session`)
+        """
         self.scrapers = [
-            TechCrunchScraper(),
-            VentureBeatScraper(),
-            CrunchbaseNewsScraper()
+            TechCrunchScraper(session=session),
+            VentureBeatScraper(session=session),
+            CrunchbaseNewsScraper(session=session)
         ]
     
     def fetch_recent_investments(self, days_back: int = 7) -> List[Investment]:
@@ -449,34 +602,34 @@ class InvestmentDataAggregator:
         """
         all_data = []
         
-        for scraper in self.scrapers:
-            try:
-                data = scraper.scrape(days_back=days_back)
-                all_data.extend(data)
-            except Exception as e:
-                scraper.logger.error(f"Scraper failed: {e}")
-                continue
+        # Scrapers hit independent hosts; run them concurrently and collect in order.
+        with ThreadPoolExecutor(max_workers=max(1, len(self.scrapers))) as ex:
+            futures = [ex.submit(s.scrape, days_back=days_back) for s in self.scrapers]
+            for scraper, future in zip(self.scrapers, futures):
+                try:
+                    all_data.extend(future.result())
+                except Exception as e:
+                    scraper.logger.error(f"Scraper failed: {e}")
+                    continue
         
-        # Convert to Investment objects
-        investments = []
-        for item in all_data:
-            try:
-                investment = self._convert_to_investment(item)
-                if investment:
-                    investments.append(investment)
-            except Exception as e:
-                print(f"Error converting item: {e}")
+        # Convert + validate each item once,
+        # then deduplicate on (company name, amount, date): the higher-confidence copy wins.
+        unique: Dict[Tuple[Any, ...], Investment] = {}
+        valid_ids = set()
+        for investment, ok, error in self._convert_and_validate_all(all_data, datetime.now()):
+            if error is not None:
+                print(f"Error converting item: {error}")
                 continue
-        
-        # Deduplicate based on company name and amount
-        investments = self._deduplicate(investments)
+            if investment:
+                self._keep_best(unique, investment)
+                if ok:
+                    valid_ids.add(id(investment))
 
         # Validate: drop anything ungrounded or inconsistent
         valid_investments: List[Investment] = []
         invalid_count = 0
-        for inv in investments:
-            res = validate_investment(inv)
-            if res.ok:
+        for inv in unique.values():
+            if id(inv) in valid_ids:
                 valid_investments.append(inv)
             else:
                 invalid_count += 1
@@ -492,8 +645,25 @@ class InvestmentDataAggregator:
         
         return investments
     
-    def _convert_to_investment(self, data: Dict[str, Any]) -> Optional[Investment]:
-        """Convert scraped data to Investment object"""
+    @staticmethod
+    def _convert_and_validate_all(
+        items: List[Dict[str, Any]], now: datetime
+    ) -> List[Tuple[Optional[Investment], bool, Optional[str]]]:
+        """Run `_convert_and_validate` over all items, in input order.
+
+        Stays in-process: results keep sharing `_UNDISCLOSED_INVESTORS` and the
+        interned company names, which pickled worker results would not.
+        """
+        return [_convert_and_validate(item, now) for item in items]
+
+    @classmethod
+    def _convert_to_investment(cls, data: Dict[str, Any],
+                               now: Optional[datetime] = None) -> Optional[Investment]:
+        """Convert scraped data to Investment object
+
+        `now` (retrieval time / missing-date default) can be passed in so a whole
+        batch shares one timestamp.
+        """
         
         if not data.get('amount'):
             return None
@@ -507,27 +677,33 @@ class InvestmentDataAggregator:
         investee = Company(
             name=company_name,
             description=data.get('summary', '')[:200],
-            sector=self._infer_sector(data),
+            sector=cls._infer_sector(data),
             # Keep company website unknown rather than storing an article URL here.
             website=None,
         )
         
         # Create investor (if known)
-        investor_name = data.get('lead_investor', 'Undisclosed Investors')
-        investor = Company(
-            name=investor_name,
-            description=f"Investor in {company_name}",
-            sector="VC Firm"
-        )
+        investor_name = data.get('lead_investor') or _UNDISCLOSED_INVESTORS.name
+        if investor_name == _UNDISCLOSED_INVESTORS.name:
+            investor = _UNDISCLOSED_INVESTORS
+        else:
+            investor = Company(
+                name=investor_name,
+                description=f"Investor in {company_name}",
+                sector="VC Firm"
+            )
         
         # Determine investment stage
         stage = infer_stage(data.get('round', '') or data.get('title', ''))
         
+        if now is None:
+            now = datetime.now()
+
         sources = [
             FactSource(
                 source_name=data.get('source', 'Unknown'),
                 url=data.get('url'),
-                retrieved_at=datetime.now(),
+                retrieved_at=now,
                 evidence_quote=data.get('evidence_quote') or data.get('summary'),
             )
         ]
@@ -542,7 +718,7 @@ class InvestmentDataAggregator:
             investee=investee,
             amount=float(data['amount']),
             stage=stage,
-            date=data.get('date', datetime.now()),
+            date=data['date'] if 'date' in data else now,
             details=data.get('summary', '')[:300],
             key_insights=[
                 f"Source: {data.get('source', 'Unknown')}",
@@ -554,36 +730,55 @@ class InvestmentDataAggregator:
         
         return investment
     
-    def _infer_sector(self, data: Dict[str, Any]) -> str:
+    @classmethod
+    def _infer_sector(cls, data: Dict[str, Any]) -> str:
         """Infer AI sector from article content"""
-        text = f"{data.get('title', '')} {data.get('summary', '')}".lower()
-        
-        sector_keywords = {
-            'LLM': ['language model', 'llm', 'gpt', 'chatbot', 'conversational ai'],
-            'Computer Vision': ['computer vision', 'image recognition', 'visual ai'],
-            'Robotics': ['robotics', 'autonomous', 'robot'],
-            'Developer Tools': ['developer', 'api', 'sdk', 'platform'],
-            'Healthcare AI': ['healthcare', 'medical', 'diagnosis', 'health'],
-            'AI Infrastructure': ['infrastructure', 'cloud', 'compute', 'gpu'],
-            'Enterprise AI': ['enterprise', 'b2b', 'business'],
-        }
-        
-        for sector, keywords in sector_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return sector
+        return cls._sector_for_text(f"{data.get('title', '')} {data.get('summary', '')}")
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _sector_for_text(cls, text: str) -> str:
+        # Memoized: overlapping days_back windows re-classify the same stories.
+        # One scan; the earliest-listed sector with any keyword hit wins.
+        best: Optional[int] = None
+        for match in cls._SECTOR_RE.finditer(text):
+            index = int(match.lastgroup[1:])
+            if index == 0:
+                return cls._SECTOR_LABELS[0]
+            if best is None or index < best:
+                best = index
+        if best is not None:
+            return cls._SECTOR_LABELS[best]
         
         return 'AI'  # Default
     
+    @staticmethod
+    def _dedup_key(inv: Investment) -> Tuple[Any, ...]:
+        date_key = inv.date.date() if getattr(inv, "date", None) else None
+        # Investor stays out of the key: sources disagree on (or omit) the lead.
+        return (_canonical_company(inv.investee.name), round(float(inv.amount), 1), date_key)
+
+    def _keep_best(self, unique: Dict[Tuple[Any, ...], Investment], inv: Investment) -> None:
+        key = self._dedup_key(inv)
+        current = unique.get(key)
+        if current is None or inv.confidence > current.confidence:
+            # Replacing keeps the first occurrence's position in the dict.
+            unique[key] = inv
+
     def _deduplicate(self, investments: List[Investment]) -> List[Investment]:
-        """Remove duplicate investments"""
-        seen = set()
-        unique = []
-        
+        """Remove duplicate investments (keeping the highest-confidence copy)"""
+        unique: Dict[Tuple[Any, ...], Investment] = {}
         for inv in investments:
-            date_key = inv.date.date().isoformat() if getattr(inv, "date", None) else "unknown"
-            key = (inv.investee.name.lower(), round(float(inv.amount), 1), date_key)
-            if key not in seen:
-                seen.add(key)
-                unique.append(inv)
-        
-        return unique
+            self._keep_best(unique, inv)
+        return list(unique.values())
+
+
+def _convert_and_validate(
+    item: Dict[str, Any], now: datetime
+) -> Tuple[Optional[Investment], bool, Optional[str]]:
+    """(investment or None, passed validation, conversion error) for one scraped item."""
+    try:
+        investment = InvestmentDataAggregator._convert_to_investment(item, now=now)
+        return investment, bool(investment and validate_investment(investment, now=now).ok), None
+    except Exception as e:
+        return None, False, str(e)
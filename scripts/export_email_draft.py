@@ -21,7 +21,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from example_real_data import create_newsletter_with_real_data
-from renderers.email_renderer import EmailRenderOptions, render_newsletter_email_html, export_eml_bytes
+from renderers.email_renderer import EmailRenderOptions, render_newsletter_email_html, write_eml
 
 
 def main() -> int:
@@ -47,9 +47,8 @@ def main() -> int:
     with open(html_path, "w", encoding="utf-8") as f:
         f.write(html)
 
-    eml_bytes = export_eml_bytes(newsletter_markdown=newsletter_md, options=options)
     with open(eml_path, "wb") as f:
-        f.write(eml_bytes)
+        write_eml(f, newsletter_markdown=newsletter_md, options=options)
 
     print(f"Wrote {md_path}")
     print(f"Wrote {html_path}")
@@ -20,6 +20,12 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Any
+
+try:  # Optional: C serializer, several times faster than stdlib json.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # Ensure the project root is on sys.path when executed as a file.
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -31,6 +37,14 @@ from scrapers.real_data_source import RealTimeDataSource
 from facts_store import FactsStore
 
 
+def _write_json(path: Path, data: Any) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Export investment knowledge graph")
     parser.add_argument("--days-back", type=int, default=7)
@@ -52,10 +66,10 @@ def main() -> int:
     store = FactsStore(args.db)
 
     if args.ingest:
-        from validation import validate_investment
+        from validation import filter_valid_investments
 
         scraped = RealTimeDataSource(use_cache=True).fetch_investments(days_back=args.days_back)
-        valid = [inv for inv in scraped if validate_investment(inv).ok]
+        valid, _ = filter_valid_investments(scraped)
         store.upsert_investments(valid)
 
     if args.from_db:
@@ -71,11 +85,10 @@ def main() -> int:
     dot_path = Path(args.dot_path)
     json_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(kg.to_json_dict(), f, indent=2)
+    _write_json(json_path, kg.to_json_dict())
 
     with open(dot_path, "w", encoding="utf-8") as f:
-        f.write(kg.to_dot())
+        f.writelines(kg.iter_dot())
 
     print(f"Wrote {json_path}")
     print(f"Wrote {dot_path}")
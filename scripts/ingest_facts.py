@@ -14,6 +14,8 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 # Ensure the project root is on sys.path when executed as a file.
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -23,7 +25,7 @@ if PROJECT_ROOT not in sys.path:
 from facts_store import FactsStore
 from scrapers.real_data_source import RealTimeDataSource
 from scrapers.event_scrapers import EventAggregator
-from validation import validate_investment, validate_event
+from validation import filter_valid_investments, validate_event
 
 
 def main() -> int:
@@ -35,14 +37,25 @@ def main() -> int:
 
     store = FactsStore(args.db)
 
-    investments = RealTimeDataSource(use_cache=True).fetch_investments(days_back=args.days_back)
-    investments_valid = [inv for inv in investments if validate_investment(inv).ok]
-
-    events = EventAggregator().fetch_upcoming_events(days_ahead=args.days_ahead)
-    events_valid = [ev for ev in events if validate_event(ev).ok]
-
-    inv_stats = store.upsert_investments(investments_valid)
-    ev_stats = store.upsert_events(events_valid)
+    # Investment and event sources are disjoint sites: fetch both at once.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        investments_future = ex.submit(
+            RealTimeDataSource(use_cache=True).fetch_investments, days_back=args.days_back
+        )
+        events_future = ex.submit(
+            EventAggregator().fetch_upcoming_events, days_ahead=args.days_ahead
+        )
+        investments = investments_future.result()
+        events = events_future.result()
+
+    investments_valid, _ = filter_valid_investments(investments)
+    now = datetime.now()
+    events_valid = [ev for ev in events if validate_event(ev, now=now).ok]
+
+    # One transaction for the whole ingest: a single commit, and no half-written run.
+    with store.transaction() as conn:
+        inv_stats = store.upsert_investments(investments_valid, conn=conn)
+        ev_stats = store.upsert_events(events_valid, conn=conn)
 
     print(f"DB: {args.db}")
     print(f"Investments fetched: {len(investments)} | stored new: {inv_stats['investments_inserted']} | sources new: {inv_stats['sources_inserted']}")
@@ -12,27 +12,39 @@ It does not generate a newsletter; it only previews the raw/normalized data.
 from __future__ import annotations
 
 import argparse
+import heapq
+import io
 import json
+import operator
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+try:  # Optional: C serializer, several times faster than stdlib json.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # Ensure the project root is on sys.path when executed as a file.
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from scrapers.investment_scrapers import InvestmentDataAggregator
-from scrapers.event_scrapers import EventAggregator, EventbriteScraper, AIConferenceTracker
-from validation import validate_investment, validate_event
+# Scraper modules (and their parser stacks) are imported inside the preview
+# functions, so `--investments`/`--events`/`--help` only load what they use.
+
+
+_WS_RE = re.compile(r"\s+")
 
 
 def _truncate(text: Optional[str], n: int = 180) -> Optional[str]:
     if text is None:
         return None
-    t = " ".join(text.split())
+    t = _WS_RE.sub(" ", text).strip()
     if len(t) <= n:
         return t
     return t[: n - 1] + "…"
@@ -49,55 +61,139 @@ def _fact_source_to_dict(src: Any) -> Dict[str, Any]:
             "evidence_quote": getattr(src, "evidence_quote", None),
         }
 
-    ra = d.get("retrieved_at")
-    if isinstance(ra, datetime):
-        d["retrieved_at"] = ra.isoformat()
-
     if d.get("evidence_quote"):
         d["evidence_quote"] = _truncate(d["evidence_quote"], 240)
 
     return d
 
 
+_BY_DATE = operator.attrgetter("date")
+
+_INV_FIELDS = ("investor.name", "investee.name", "amount", "stage.value", "date", "details", "confidence", "sources")
+_INV_ATTRS = operator.attrgetter(*_INV_FIELDS)
+
+_EVENT_FIELDS = (
+    "name",
+    "event_type",
+    "date",
+    "location",
+    "url",
+    "registration_url",
+    "organizer",
+    "topics",
+    "target_audience",
+    "cost",
+    "description",
+    "confidence",
+    "sources",
+)
+_EVENT_ATTRS = operator.attrgetter(*_EVENT_FIELDS)
+
+
+def _fetch_attrs(getter: "operator.attrgetter", fields: Tuple[str, ...], obj: Any) -> Tuple[Any, ...]:
+    """All `fields` of `obj` in one attrgetter call; missing ones (duck-typed objects) become None."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        values = []
+        for path in fields:
+            value = obj
+            for part in path.split("."):
+                value = getattr(value, part, None)
+            values.append(value)
+        return tuple(values)
+
+
 def _investment_to_dict(inv: Any) -> Dict[str, Any]:
+    investor, investee, amount, stage, date, details, confidence, sources = _fetch_attrs(
+        _INV_ATTRS, _INV_FIELDS, inv
+    )
     return {
-        "investor": getattr(getattr(inv, "investor", None), "name", None),
-        "investee": getattr(getattr(inv, "investee", None), "name", None),
-        "amount_m_usd": getattr(inv, "amount", None),
-        "stage": getattr(getattr(inv, "stage", None), "value", None),
-        "date": getattr(inv, "date", None).isoformat() if getattr(inv, "date", None) else None,
-        "details": _truncate(getattr(inv, "details", None), 220),
-        "confidence": getattr(inv, "confidence", None),
-        "sources": [_fact_source_to_dict(s) for s in (getattr(inv, "sources", []) or [])],
+        "investor": investor,
+        "investee": investee,
+        "amount_m_usd": amount,
+        "stage": stage,
+        "date": date.isoformat() if date else None,
+        "details": _truncate(details, 220),
+        "confidence": confidence,
+        "sources": [_fact_source_to_dict(s) for s in (sources or [])],
     }
 
 
 def _event_to_dict(ev: Any) -> Dict[str, Any]:
+    (
+        name,
+        event_type,
+        date,
+        location,
+        url,
+        registration_url,
+        organizer,
+        topics,
+        target_audience,
+        cost,
+        description,
+        confidence,
+        sources,
+    ) = _fetch_attrs(_EVENT_ATTRS, _EVENT_FIELDS, ev)
     return {
-        "name": getattr(ev, "name", None),
-        "event_type": getattr(ev, "event_type", None),
-        "date": getattr(ev, "date", None).isoformat() if getattr(ev, "date", None) else None,
-        "location": getattr(ev, "location", None),
-        "url": getattr(ev, "url", None),
-        "registration_url": getattr(ev, "registration_url", None),
-        "organizer": getattr(ev, "organizer", None),
-        "topics": list(getattr(ev, "topics", []) or []),
-        "target_audience": getattr(ev, "target_audience", None),
-        "cost": getattr(ev, "cost", None),
-        "description": _truncate(getattr(ev, "description", None), 240),
-        "confidence": getattr(ev, "confidence", None),
-        "sources": [_fact_source_to_dict(s) for s in (getattr(ev, "sources", []) or [])],
+        "name": name,
+        "event_type": event_type,
+        "date": date.isoformat() if date else None,
+        "location": location,
+        "url": url,
+        "registration_url": registration_url,
+        "organizer": organizer,
+        "topics": list(topics or []),
+        "target_audience": target_audience,
+        "cost": cost,
+        "description": _truncate(description, 240),
+        "confidence": confidence,
+        "sources": [_fact_source_to_dict(s) for s in (sources or [])],
     }
 
 
-def _print_header(title: str) -> None:
-    print("\n" + "=" * 80)
-    print(title)
-    print("=" * 80)
+def _scrape_all(scrapers: List[Any], **kwargs: Any) -> List[Tuple[str, List[Any], Optional[str]]]:
+    """Run every scraper's `scrape(**kwargs)` concurrently.
+
+    Scrapers are I/O-bound and hit different sites, so the wait is the slowest
+    source rather than the sum. Returns (name, items, error) in scraper order.
+    """
+    max_workers = max(1, int(os.environ.get("PREVIEW_PARALLEL", "8")))
+    results: List[Tuple[str, List[Any], Optional[str]]] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [(s.__class__.__name__, ex.submit(s.scrape, **kwargs)) for s in scrapers]
+        for name, future in futures:
+            try:
+                results.append((name, future.result(), None))
+            except Exception as e:
+                results.append((name, [], str(e)))
+    return results
+
+
+def _json_default(obj: Any) -> Any:
+    # stdlib fallback only; orjson writes datetimes (as ISO 8601) itself.
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
+def _dumps(preview: Dict[str, Any]) -> bytes:
+    """Preview as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(preview, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(preview, indent=2, default=_json_default).encode("utf-8")
 
-def _print_kv(key: str, value: Any) -> None:
-    print(f"- {key}: {value}")
+
+_RULE = "=" * 80
+
+
+def _write_header(buf: TextIO, title: str) -> None:
+    buf.write(f"\n{_RULE}\n{title}\n{_RULE}\n")
+
+
+def _write_kv(buf: TextIO, key: str, value: Any) -> None:
+    buf.write(f"- {key}: {value}\n")
 
 
 def _preview_investments(
@@ -106,27 +202,27 @@ def _preview_investments(
     max_items: int,
     show_invalid: bool,
 ) -> Dict[str, Any]:
+    from scrapers.investment_scrapers import InvestmentDataAggregator
+    from validation import validate_investment
+
     agg = InvestmentDataAggregator()
 
     per_source: List[Dict[str, Any]] = []
     all_valid: List[Any] = []
     all_invalid: List[Dict[str, Any]] = []
+    now = datetime.now()
 
-    for scraper in agg.scrapers:
-        source_name = scraper.__class__.__name__
-        raw_items: List[Dict[str, Any]] = []
+    for source_name, raw_items, error in _scrape_all(agg.scrapers, days_back=days_back):
         converted = 0
         valid = 0
         invalid = 0
         dropped = 0
 
-        try:
-            raw_items = scraper.scrape(days_back=days_back)  # type: ignore[arg-type]
-        except Exception as e:
+        if error is not None:
             per_source.append(
                 {
                     "source": source_name,
-                    "error": str(e),
+                    "error": error,
                     "raw": 0,
                     "converted": 0,
                     "valid": 0,
@@ -148,7 +244,7 @@ def _preview_investments(
                 continue
 
             converted += 1
-            res = validate_investment(inv)
+            res = validate_investment(inv, now=now)
             if res.ok:
                 valid += 1
                 all_valid.append(inv)
@@ -203,35 +299,42 @@ def _preview_events(
     max_items: int,
     show_invalid: bool,
 ) -> Dict[str, Any]:
+    from scrapers.event_scrapers import AIConferenceTracker, EventAggregator
+    from validation import validate_event
+
     agg = EventAggregator()
 
     sources: List[Tuple[str, List[Any]]] = []
     per_source: List[Dict[str, Any]] = []
 
     # Dynamic sources
-    for scraper in agg.scrapers:
-        name = scraper.__class__.__name__
-        try:
-            events = scraper.scrape(days_ahead=days_ahead)  # type: ignore[arg-type]
+    for name, events, error in _scrape_all(agg.scrapers, days_ahead=days_ahead):
+        if error is not None:
+            per_source.append({"source": name, "error": error, "raw": 0, "valid": 0, "invalid": 0})
+        else:
             sources.append((name, events))
-        except Exception as e:
-            per_source.append({"source": name, "error": str(e), "raw": 0, "valid": 0, "invalid": 0})
 
     # Curated sources
     curated = AIConferenceTracker.get_major_conferences(days_ahead)
     sources.append(("AIConferenceTracker", curated))
 
-    all_events: List[Any] = []
+    streams: List[List[Any]] = []
+    valid_total = 0
     all_invalid: List[Dict[str, Any]] = []
+    now = datetime.now()
 
     for name, events in sources:
         valid = 0
         invalid = 0
+        upcoming_here: List[Any] = []
         for ev in events:
-            res = validate_event(ev)
+            res = validate_event(ev, now=now)
             if res.ok:
                 valid += 1
-                all_events.append(ev)
+                # Upcoming filter (match EventAggregator behavior), before dedup so
+                # past events aren't deduplicated only to be thrown away.
+                if getattr(ev, "is_upcoming", lambda: True)():
+                    upcoming_here.append(ev)
             else:
                 invalid += 1
                 all_invalid.append(
@@ -244,19 +347,19 @@ def _preview_events(
                     }
                 )
 
+        valid_total += valid
+        # Sources hand back date-sorted events, so this is a linear check, not a sort.
+        streams.append(sorted(upcoming_here, key=_BY_DATE))
         per_source.append({"source": name, "raw": len(events), "valid": valid, "invalid": invalid})
 
-    deduped = agg._deduplicate(all_events)
-    deduped.sort(key=lambda x: x.date)
-
-    # Upcoming filter (match EventAggregator behavior)
-    upcoming = [e for e in deduped if getattr(e, "is_upcoming", lambda: True)()]
+    # k-way merge of the sorted streams: globally date-ordered without a full sort.
+    upcoming = agg._deduplicate(heapq.merge(*streams, key=_BY_DATE))
 
     result = {
         "summary": {
             "days_ahead": days_ahead,
             "raw_sources": per_source,
-            "valid_total": len(all_events),
+            "valid_total": valid_total,
             "valid_deduped_upcoming": len(upcoming),
             "invalid_total": len(all_invalid),
         },
@@ -269,78 +372,84 @@ def _preview_events(
     return result
 
 
-def _render_text(preview: Dict[str, Any]) -> None:
+def _render_text(preview: Dict[str, Any], out: Optional[TextIO] = None) -> None:
+    """Human-readable preview, written to `out` (stdout by default) in one write."""
+    buf = io.StringIO()
     if "investments" in preview:
-        _print_header("INVESTMENTS (preview)")
+        _write_header(buf, "INVESTMENTS (preview)")
         s = preview["investments"]["summary"]
-        _print_kv("days_back", s["days_back"])
-        _print_kv("valid_total", s["valid_total"])
-        _print_kv("valid_deduped", s["valid_deduped"])
-        _print_kv("invalid_total", s["invalid_total"])
-        print("\nPer source:")
+        _write_kv(buf, "days_back", s["days_back"])
+        _write_kv(buf, "valid_total", s["valid_total"])
+        _write_kv(buf, "valid_deduped", s["valid_deduped"])
+        _write_kv(buf, "invalid_total", s["invalid_total"])
+        buf.write("\nPer source:\n")
         for row in s["raw_sources"]:
             if row.get("error"):
-                print(f"- {row['source']}: ERROR: {row['error']}")
+                buf.write(f"- {row['source']}: ERROR: {row['error']}\n")
             else:
-                print(
+                buf.write(
                     f"- {row['source']}: raw={row['raw']}, converted={row['converted']}, "
-                    f"valid={row['valid']}, invalid={row['invalid']}, dropped={row['dropped']}"
+                    f"valid={row['valid']}, invalid={row['invalid']}, dropped={row['dropped']}\n"
                 )
 
-        print("\nTop valid items:")
+        buf.write("\nTop valid items:\n")
         for i, inv in enumerate(preview["investments"]["valid"], start=1):
             srcs = inv.get("sources") or []
             best = srcs[0] if srcs else {}
-            print(
+            buf.write(
                 f"{i}. {inv.get('investor')} → {inv.get('investee')} | ${inv.get('amount_m_usd')}M | "
-                f"{inv.get('stage')} | {inv.get('date')} | conf={inv.get('confidence')}"
+                f"{inv.get('stage')} | {inv.get('date')} | conf={inv.get('confidence')}\n"
             )
             if best.get("url"):
-                print(f"   url: {best.get('url')}")
+                buf.write(f"   url: {best.get('url')}\n")
             if best.get("evidence_quote"):
-                print(f"   evidence: {best.get('evidence_quote')}")
+                buf.write(f"   evidence: {best.get('evidence_quote')}\n")
 
         if "invalid" in preview["investments"]:
-            print("\nInvalid examples:")
+            buf.write("\nInvalid examples:\n")
             for row in preview["investments"]["invalid"]:
-                print(f"- {row.get('title') or '(no title)'}")
+                buf.write(f"- {row.get('title') or '(no title)'}\n")
                 if row.get("url"):
-                    print(f"  url: {row.get('url')}")
+                    buf.write(f"  url: {row.get('url')}\n")
                 if row.get("evidence_quote"):
-                    print(f"  evidence: {row.get('evidence_quote')}")
-                print(f"  reasons: {', '.join(row.get('reasons') or [])}")
+                    buf.write(f"  evidence: {row.get('evidence_quote')}\n")
+                buf.write(f"  reasons: {', '.join(row.get('reasons') or [])}\n")
 
     if "events" in preview:
-        _print_header("EVENTS (preview)")
+        _write_header(buf, "EVENTS (preview)")
         s = preview["events"]["summary"]
-        _print_kv("days_ahead", s["days_ahead"])
-        _print_kv("valid_total", s["valid_total"])
-        _print_kv("valid_deduped_upcoming", s["valid_deduped_upcoming"])
-        _print_kv("invalid_total", s["invalid_total"])
-        print("\nPer source:")
+        _write_kv(buf, "days_ahead", s["days_ahead"])
+        _write_kv(buf, "valid_total", s["valid_total"])
+        _write_kv(buf, "valid_deduped_upcoming", s["valid_deduped_upcoming"])
+        _write_kv(buf, "invalid_total", s["invalid_total"])
+        buf.write("\nPer source:\n")
         for row in s["raw_sources"]:
             if row.get("error"):
-                print(f"- {row['source']}: ERROR: {row['error']}")
+                buf.write(f"- {row['source']}: ERROR: {row['error']}\n")
             else:
-                print(f"- {row['source']}: raw={row['raw']}, valid={row['valid']}, invalid={row['invalid']}")
+                buf.write(f"- {row['source']}: raw={row['raw']}, valid={row['valid']}, invalid={row['invalid']}\n")
 
-        print("\nTop valid items:")
+        buf.write("\nTop valid items:\n")
         for i, ev in enumerate(preview["events"]["valid"], start=1):
             srcs = ev.get("sources") or []
             best = srcs[0] if srcs else {}
-            print(f"{i}. {ev.get('name')} | {ev.get('event_type')} | {ev.get('date')} | {ev.get('location')} | conf={ev.get('confidence')}")
+            buf.write(f"{i}. {ev.get('name')} | {ev.get('event_type')} | {ev.get('date')} | {ev.get('location')} | conf={ev.get('confidence')}\n")
             if ev.get("url"):
-                print(f"   url: {ev.get('url')}")
+                buf.write(f"   url: {ev.get('url')}\n")
             if best.get("evidence_quote"):
-                print(f"   evidence: {best.get('evidence_quote')}")
+                buf.write(f"   evidence: {best.get('evidence_quote')}\n")
 
         if "invalid" in preview["events"]:
-            print("\nInvalid examples:")
+            buf.write("\nInvalid examples:\n")
             for row in preview["events"]["invalid"]:
-                print(f"- {row.get('name') or '(no name)'} | {row.get('date')}")
+                buf.write(f"- {row.get('name') or '(no name)'} | {row.get('date')}\n")
                 if row.get("url"):
-                    print(f"  url: {row.get('url')}")
-                print(f"  reasons: {', '.join(row.get('reasons') or [])}")
+                    buf.write(f"  url: {row.get('url')}\n")
+                buf.write(f"  reasons: {', '.join(row.get('reasons') or [])}\n")
+
+    out = out if out is not None else sys.stdout
+    out.write(buf.getvalue())
+    out.flush()
 
 
 def main() -> int:
@@ -380,18 +489,18 @@ def main() -> int:
         )
 
     if args.format == "json":
-        out = json.dumps(preview, indent=2, sort_keys=False)
+        out = _dumps(preview)
         if args.out:
-            with open(args.out, "w", encoding="utf-8") as f:
+            with open(args.out, "wb") as f:
                 f.write(out)
             print(f"Wrote {args.out}")
         else:
-            print(out)
+            print(out.decode("utf-8"))
     else:
         if args.out:
             # render to a string by temporarily capturing print is overkill; just write JSON
-            with open(args.out, "w", encoding="utf-8") as f:
-                f.write(json.dumps(preview, indent=2, sort_keys=False))
+            with open(args.out, "wb") as f:
+                f.write(_dumps(preview))
             print(f"Wrote {args.out} (JSON)")
         _render_text(preview)
 
@@ -2,7 +2,10 @@
 Content sections for the newsletter
 """
 
-from typing import List
+import heapq
+import io
+from collections import defaultdict
+from typing import Dict, List
 from newsletter_factory import NewsletterSection
 from models import Investment, EntrepreneurTip, MarketTrend
 
@@ -11,47 +14,55 @@ class InvestmentHighlightsSection(NewsletterSection):
     """Section showcasing recent investment activities"""
     
     def __init__(self, investments: List[Investment], max_items: int = 10):
-        self.investments = sorted(
-            investments, 
-            key=lambda x: x.date, 
-            reverse=True
-        )[:max_items]
+        # Same result as sorted(..., reverse=True)[:max_items], without sorting everything.
+        self.investments = heapq.nlargest(max_items, investments, key=lambda x: x.date)
     
     def generate(self) -> str:
-        content = ["## 💰 Investment Highlights", ""]
-        content.append("*Recent funding rounds and acquisitions in the AI space*\n")
+        buf = io.StringIO()
+        buf.write(
+            "## 💰 Investment Highlights\n\n"
+            "*Recent funding rounds and acquisitions in the AI space*\n"
+        )
         
         for inv in self.investments:
-            content.append(f"### {inv.investee.name} - {inv.format_amount()}")
-            content.append(f"- **Investor:** {inv.investor.name}")
-            content.append(f"- **Stage:** {inv.stage.value}")
-            content.append(f"- **Sector:** {inv.investee.sector}")
-            content.append(f"- **Date:** {inv.date.strftime('%B %d, %Y')}")
+            amount = inv.format_amount()
+            date = inv.date.strftime('%B %d, %Y')
+            buf.write(
+                f"\n### {inv.investee.name} - {amount}"
+                f"\n- **Investor:** {inv.investor.name}"
+                f"\n- **Stage:** {inv.stage.value}"
+                f"\n- **Sector:** {inv.investee.sector}"
+                f"\n- **Date:** {date}"
+            )
             
             if inv.details:
-                content.append(f"- **Details:** {inv.details}")
+                buf.write(f"\n- **Details:** {inv.details}")
             
             if inv.key_insights:
-                content.append("- **Key Insights:**")
+                buf.write("\n- **Key Insights:**")
                 for insight in inv.key_insights:
-                    content.append(f"  - {insight}")
+                    buf.write(f"\n  - {insight}")
 
             # Evidence / grounding
-            sources = getattr(inv, "sources", [])
+            sources = inv.sources
             if sources:
                 src = sources[0]
-                if getattr(inv, "confidence", None) is not None:
-                    content.append(f"- **Confidence:** {inv.confidence:.2f}")
+                confidence = inv.confidence
+                if confidence is not None:
+                    buf.write(f"\n- **Confidence:** {confidence:.2f}")
                 if src.evidence_quote:
-                    content.append(f"- **Evidence:** \"{src.evidence_quote}\"")
+                    buf.write(f"\n- **Evidence:** \"{src.evidence_quote}\"")
                 if src.url:
-                    content.append(f"- **Source:** {src.source_name} — {src.url}")
+                    buf.write(f"\n- **Source:** {src.source_name} — {src.url}")
                 else:
-                    content.append(f"- **Source:** {src.source_name}")
+                    buf.write(f"\n- **Source:** {src.source_name}")
             
-            content.append("")
+            buf.write("\n")
         
-        return "\n".join(content)
+        return buf.getvalue()
+
+
+_IMPACT_EMOJI = {"High": "🔥", "Medium": "⚡", "Low": "💡"}
 
 
 class MarketTrendsSection(NewsletterSection):
@@ -61,40 +72,36 @@ class MarketTrendsSection(NewsletterSection):
         self.trends = trends
     
     def generate(self) -> str:
-        content = ["## 📈 Market Trends", ""]
-        content.append("*What's shaping the AI investment landscape*\n")
+        buf = io.StringIO()
+        buf.write("## 📈 Market Trends\n\n*What's shaping the AI investment landscape*\n")
         
         for trend in self.trends:
-            impact_emoji = {"High": "🔥", "Medium": "⚡", "Low": "💡"}.get(
-                trend.impact_level, "📊"
-            )
+            impact_emoji = _IMPACT_EMOJI.get(trend.impact_level, "📊")
             
-            content.append(f"### {impact_emoji} {trend.trend_name}")
-            content.append(f"{trend.description}\n")
+            buf.write(f"\n### {impact_emoji} {trend.trend_name}\n{trend.description}\n")
             
             if trend.relevant_sectors:
-                content.append("**Relevant Sectors:**")
-                content.append(", ".join(trend.relevant_sectors) + "\n")
+                buf.write(f"\n**Relevant Sectors:**\n{', '.join(trend.relevant_sectors)}\n")
             
             if trend.opportunity_areas:
-                content.append("**Opportunity Areas:**")
+                buf.write("\n**Opportunity Areas:**")
                 for area in trend.opportunity_areas:
-                    content.append(f"- {area}")
-                content.append("")
+                    buf.write(f"\n- {area}")
+                buf.write("\n")
 
             # Optional evidence/grounding
-            sources = getattr(trend, "sources", []) or []
+            sources = trend.sources
             if sources:
                 src = sources[0]
-                if getattr(src, "evidence_quote", None):
-                    content.append(f"- **Evidence:** \"{src.evidence_quote}\"")
-                if getattr(src, "url", None):
-                    content.append(f"- **Source:** {src.source_name} — {src.url}")
+                if src.evidence_quote:
+                    buf.write(f"\n- **Evidence:** \"{src.evidence_quote}\"")
+                if src.url:
+                    buf.write(f"\n- **Source:** {src.source_name} — {src.url}")
                 else:
-                    content.append(f"- **Source:** {src.source_name}")
-                content.append("")
+                    buf.write(f"\n- **Source:** {src.source_name}")
+                buf.write("\n")
         
-        return "\n".join(content)
+        return buf.getvalue()
 
 
 class EntrepreneurGuidanceSection(NewsletterSection):
@@ -104,49 +111,48 @@ class EntrepreneurGuidanceSection(NewsletterSection):
         self.tips = tips
     
     def generate(self) -> str:
-        content = ["## 🚀 How to Get Involved: Entrepreneur's Playbook", ""]
-        content.append("*Actionable insights for aspiring AI entrepreneurs*\n")
+        buf = io.StringIO()
+        buf.write(
+            "## 🚀 How to Get Involved: Entrepreneur's Playbook\n\n"
+            "*Actionable insights for aspiring AI entrepreneurs*\n"
+        )
         
         # Group tips by category
-        categories = {}
+        categories: Dict[str, List[EntrepreneurTip]] = defaultdict(list)
         for tip in self.tips:
-            if tip.category not in categories:
-                categories[tip.category] = []
             categories[tip.category].append(tip)
         
         for category, tips in categories.items():
-            content.append(f"### {category}")
-            content.append("")
+            buf.write(f"\n### {category}\n")
             
             for tip in tips:
-                content.append(f"**{tip.title}**")
-                content.append(f"{tip.description}\n")
+                buf.write(f"\n**{tip.title}**\n{tip.description}\n")
                 
                 if tip.action_items:
-                    content.append("*Action Items:*")
+                    buf.write("\n*Action Items:*")
                     for item in tip.action_items:
-                        content.append(f"- [ ] {item}")
-                    content.append("")
+                        buf.write(f"\n- [ ] {item}")
+                    buf.write("\n")
                 
                 if tip.resources:
-                    content.append("*Resources:*")
+                    buf.write("\n*Resources:*")
                     for resource in tip.resources:
-                        content.append(f"- {resource}")
-                    content.append("")
+                        buf.write(f"\n- {resource}")
+                    buf.write("\n")
 
-                sources = getattr(tip, "sources", []) or []
+                sources = tip.sources
                 if sources:
                     src = sources[0]
-                    content.append("*Evidence:*" )
-                    if getattr(src, "evidence_quote", None):
-                        content.append(f"- \"{src.evidence_quote}\"")
-                    if getattr(src, "url", None):
-                        content.append(f"- {src.source_name} — {src.url}")
+                    buf.write("\n*Evidence:*")
+                    if src.evidence_quote:
+                        buf.write(f"\n- \"{src.evidence_quote}\"")
+                    if src.url:
+                        buf.write(f"\n- {src.source_name} — {src.url}")
                     else:
-                        content.append(f"- {src.source_name}")
-                    content.append("")
+                        buf.write(f"\n- {src.source_name}")
+                    buf.write("\n")
         
-        return "\n".join(content)
+        return buf.getvalue()
 
 
 class ExecutiveSummarySection(NewsletterSection):
@@ -157,15 +163,14 @@ class ExecutiveSummarySection(NewsletterSection):
         self.key_takeaways = key_takeaways
     
     def generate(self) -> str:
-        content = ["## 📋 Executive Summary", ""]
-        content.append(self.summary)
-        content.append("\n**Key Takeaways:**")
+        buf = io.StringIO()
+        buf.write(f"## 📋 Executive Summary\n\n{self.summary}\n\n**Key Takeaways:**")
         
         for takeaway in self.key_takeaways:
-            content.append(f"- {takeaway}")
+            buf.write(f"\n- {takeaway}")
         
-        content.append("")
-        return "\n".join(content)
+        buf.write("\n")
+        return buf.getvalue()
 
 
 class InvestorSpotlightSection(NewsletterSection):
@@ -175,19 +180,21 @@ class InvestorSpotlightSection(NewsletterSection):
         self.investor_data = investor_data
     
     def generate(self) -> str:
-        content = ["## 🎯 Investor Spotlight", ""]
-        content.append("*Most active investors in AI this period*\n")
+        buf = io.StringIO()
+        buf.write("## 🎯 Investor Spotlight\n\n*Most active investors in AI this period*\n")
         
         for investor in self.investor_data:
-            content.append(f"### {investor['name']}")
-            content.append(f"{investor['description']}\n")
-            content.append(f"- **Focus Areas:** {', '.join(investor['focus_areas'])}")
-            content.append(f"- **Recent Investments:** {investor['recent_count']}")
-            content.append(f"- **Average Check Size:** {investor['avg_check_size']}")
+            buf.write(
+                f"\n### {investor['name']}"
+                f"\n{investor['description']}\n"
+                f"\n- **Focus Areas:** {', '.join(investor['focus_areas'])}"
+                f"\n- **Recent Investments:** {investor['recent_count']}"
+                f"\n- **Average Check Size:** {investor['avg_check_size']}"
+            )
             
             if investor.get('contact_info'):
-                content.append(f"- **How to Reach:** {investor['contact_info']}")
+                buf.write(f"\n- **How to Reach:** {investor['contact_info']}")
             
-            content.append("")
+            buf.write("\n")
         
-        return "\n".join(content)
+        return buf.getvalue()
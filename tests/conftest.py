@@ -7,6 +7,41 @@ def _set_test_env(tmp_path, monkeypatch):
     # Keep tests deterministic and avoid polluting real cache.
     monkeypatch.setenv("NEWSLETTER_FACTORY_TESTING", "1")
     monkeypatch.setenv("NEWSLETTER_FACTORY_CACHE_DIR", str(tmp_path / "cache"))
+    # FactsStore() without a path: in-memory, nothing touches disk.
+    monkeypatch.setenv("NEWSLETTER_FACTORY_DB", ":memory:")
+
+
+@pytest.fixture
+def facts_store():
+    """Empty in-memory FactsStore."""
+    from facts_store import FactsStore
+
+    return FactsStore(FactsStore.MEMORY)
+
+
+@pytest.fixture(scope="session")
+def _session_env(tmp_path_factory):
+    # Session fixtures are built before the per-test env above: give them their own.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("NEWSLETTER_FACTORY_TESTING", "1")
+        mp.setenv("NEWSLETTER_FACTORY_CACHE_DIR", str(tmp_path_factory.mktemp("session") / "cache"))
+        yield
+
+
+@pytest.fixture(scope="session")
+def real_data_source(_session_env):
+    """RealTimeDataSource shared by the whole run (patch it per test with monkeypatch)."""
+    from scrapers.real_data_source import RealTimeDataSource
+
+    return RealTimeDataSource(use_cache=True)
+
+
+@pytest.fixture(scope="session")
+def event_aggregator(_session_env):
+    """EventAggregator shared by the whole run."""
+    from scrapers.event_scrapers import EventAggregator
+
+    return EventAggregator()
 
 
 @pytest.fixture
@@ -1,18 +1,18 @@
 import re
 
-from scrapers.real_data_source import RealTimeDataSource
-from scrapers.event_scrapers import EventAggregator
 from newsletter_factory import NewsletterFactory
 from sections import ExecutiveSummarySection, InvestmentHighlightsSection
 from event_sections import UpcomingEventsSection
 
 
-def test_negative_e2e_generation_without_network_uses_fallback(disable_network):
+def test_negative_e2e_generation_without_network_uses_fallback(
+    disable_network, real_data_source, event_aggregator
+):
     # RealTimeDataSource should fall back to mock data if scraping fails.
-    invs = RealTimeDataSource(use_cache=True).fetch_investments(days_back=7)
+    invs = real_data_source.fetch_investments(days_back=7)
 
     # Event aggregator may return only curated conferences if network is blocked.
-    events = EventAggregator().fetch_upcoming_events(days_ahead=90)
+    events = event_aggregator.fetch_upcoming_events(days_ahead=90)
 
     out = (
         NewsletterFactory(title="E2E")
@@ -6,6 +6,7 @@ def test_real_data_source_falls_back_to_mock_on_failure(monkeypatch):
     def boom(*args, **kwargs):
         raise RuntimeError("scrape failed")
 
+    # Own instance rather than the session-wide `real_data_source`: this test breaks it.
     ds = RealTimeDataSource(use_cache=True)
     monkeypatch.setattr(ds.aggregator, "fetch_recent_investments", boom, raising=True)
 
@@ -1,3 +1,5 @@
+import time
+
 from scrapers.base_scraper import CacheManager
 
 
@@ -40,3 +42,410 @@ def test_cache_manager_redacts_google_api_key(tmp_path, monkeypatch):
 
     assert out["google_maps_api_key"] == "[REDACTED]"
     assert leaked not in out["nested"]["html"]
+
+
+def test_cache_clear_expired_deletes_stale_entries(tmp_path):
+    cache = CacheManager(tmp_path)
+    cache.set("https://example.com/a", "a")
+    cache.set("https://example.com/b", "b")
+
+    assert cache.clear_expired(max_age_hours=999) == 0
+    assert cache.clear_expired(max_age_hours=0) == 2
+    assert cache.get("https://example.com/a", max_age_hours=999) is None
+
+
+def test_cache_per_entry_ttl_overrides_reader_max_age(tmp_path, monkeypatch):
+    cache = CacheManager(tmp_path)
+    cache.set("https://example.com/news", "news", ttl_hours=1)
+    cache.set("https://example.com/confs", "confs", ttl_hours=168)
+    cache.set("https://example.com/plain", "plain")
+
+    # Two hours later: the 1h entry is stale whatever the reader asks for.
+    real_time = time.time
+    monkeypatch.setattr("scrapers.base_scraper.time.time", lambda: real_time() + 2 * 3600)
+
+    assert cache.get("https://example.com/news", max_age_hours=999) is None
+    assert cache.get("https://example.com/confs", max_age_hours=0) == "confs"
+    assert cache.get("https://example.com/plain", max_age_hours=6) == "plain"
+    assert cache.get("https://example.com/plain", max_age_hours=1) is None
+
+    # Default sweep honours each entry's TTL.
+    assert cache.clear_expired() == 1
+    assert cache.get("https://example.com/confs", max_age_hours=0) == "confs"
+
+
+def test_rate_limiter_allows_burst_then_waits(monkeypatch):
+    from scrapers.base_scraper import RateLimiter
+
+    clock = {"t": 100.0}
+    sleeps = []
+
+    def fake_sleep(s):
+        sleeps.append(s)
+        clock["t"] += s
+
+    monkeypatch.setattr("scrapers.base_scraper.time.monotonic", lambda: clock["t"])
+    monkeypatch.setattr("scrapers.base_scraper.time.sleep", fake_sleep)
+
+    limiter = RateLimiter(requests_per_minute=60, capacity=2)
+    limiter.wait_if_needed()
+    limiter.wait_if_needed()
+    assert sleeps == []
+
+    limiter.wait_if_needed()
+    assert sleeps == [1.0]
+
+
+def test_rate_limiter_backs_off_per_host():
+    from scrapers.base_scraper import RateLimiter
+
+    limiter = RateLimiter(requests_per_minute=60)
+    limiter.record_response("https://slow.example.com/x", 429)
+
+    assert limiter.bucket("https://slow.example.com/y").rate == 0.5
+    assert limiter.bucket("https://fast.example.com/").rate == 1.0
+
+
+def test_cache_round_trips_large_compressed_payload(tmp_path):
+    cache = CacheManager(tmp_path)
+    html = "<html>" + "<p>funding round</p>" * 5000 + "</html>"
+
+    cache.set("https://example.com/big", html)
+    stored = cache._conn.execute("SELECT data FROM cache").fetchone()[0]
+
+    assert len(stored) < len(html) // 10
+    assert cache.get("https://example.com/big", max_age_hours=999) == html
+
+
+def test_parse_date_fast_formats_and_fallback():
+    from datetime import datetime
+
+    from scrapers.event_scrapers import EventbriteScraper
+
+    scraper = EventbriteScraper(use_cache=False)
+    assert scraper.parse_date("2026-03-03T19:00:00") == datetime(2026, 3, 3, 19, 0)
+    assert scraper.parse_date(" March 3, 2026\n") == datetime(2026, 3, 3)
+    assert scraper.parse_date("Tue, Mar 3, 2026 7:00 PM") == datetime(2026, 3, 3, 19, 0)
+    # Not in the fast list: handled by dateutil.
+    assert scraper.parse_date("3rd of March 2026") == datetime(2026, 3, 3)
+    assert scraper.parse_date("not a date") is None
+
+
+def test_clean_text_collapses_whitespace_and_artifacts():
+    from scrapers.event_scrapers import EventbriteScraper
+
+    scraper = EventbriteScraper(use_cache=False)
+    assert scraper.clean_text("  AI\xa0\xa0Summit \u200b 2026\n\t") == "AI Summit 2026"
+    assert scraper.clean_text("") == ""
+
+
+def test_cache_key_is_stable_16_byte_digest(tmp_path):
+    cache = CacheManager(cache_dir=tmp_path)
+
+    key = cache._get_cache_key("https://example.com", {"b": 1, "a": 2})
+    assert isinstance(key, bytes) and len(key) == 16
+    assert key == cache._get_cache_key("https://example.com", {"a": 2, "b": 1})
+    assert key != cache._get_cache_key("https://example.com")
+
+
+def test_redact_secrets_copies_only_when_needed(tmp_path):
+    cache = CacheManager(cache_dir=tmp_path)
+
+    clean = {"items": [{"title": "AI Summit"}, "plain"], "n": 3}
+    assert cache._redact_secrets(clean) is clean
+
+    key = "AIza" + "B" * 30
+    dirty = {"items": ["ok", f"k={key}"], "api_key": "abc", "n": 3}
+    out = cache._redact_secrets(dirty)
+    assert out == {"items": ["ok", "k=[REDACTED]"], "api_key": "[REDACTED]", "n": 3}
+    assert dirty["items"][1].endswith(key)
+
+
+def test_cache_manager_concurrent_writers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = CacheManager(cache_dir=tmp_path)
+    other = CacheManager(cache_dir=tmp_path)
+
+    def work(i):
+        target = cache if i % 2 else other
+        url = f"https://example.com/{i}"
+        target.set(url, {"i": i, "body": "x" * 2000})
+        return target.get(url)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(work, range(40)))
+
+    assert [r["i"] for r in results] == list(range(40))
+
+
+def test_fetch_url_revalidates_expired_entry_with_etag(monkeypatch):
+    import time
+    from datetime import timedelta
+
+    from scrapers.event_scrapers import EventbriteScraper
+
+    class FakeResponse:
+        def __init__(self, status_code, text="", headers=None):
+            self.status_code = status_code
+            self.text = text
+            self.headers = headers or {}
+            self.elapsed = timedelta(milliseconds=5)
+
+        def raise_for_status(self):
+            assert self.status_code < 400
+
+    class FakeSession:
+        def __init__(self):
+            self.sent = []
+            self.responses = [
+                FakeResponse(200, "<html>v1</html>", {"ETag": '"abc"'}),
+                FakeResponse(304),
+            ]
+
+        def get(self, url, **kwargs):
+            self.sent.append(kwargs["headers"])
+            return self.responses.pop(0)
+
+    session = FakeSession()
+    scraper = EventbriteScraper(use_cache=True, session=session)
+    monkeypatch.setattr(scraper.rate_limiter, "wait_if_needed", lambda url=None: None)
+    url = "https://example.com/revalidate"
+
+    assert scraper._fetch_url(url) == "<html>v1</html>"
+    assert "If-None-Match" not in session.sent[0]
+
+    # Age the entry past expiry; the refetch must be conditional and reuse the body.
+    key = scraper.cache._get_cache_key(url)
+    scraper.cache._conn.execute("UPDATE cache SET ts = ? WHERE key = ?", (time.time() - 10**6, key))
+    assert scraper._fetch_url(url) == "<html>v1</html>"
+    assert session.sent[1]["If-None-Match"] == '"abc"'
+
+    # 304 refreshed the timestamp: next call is a plain cache hit.
+    assert scraper._fetch_url(url) == "<html>v1</html>"
+    assert len(session.sent) == 2
+
+
+def test_user_agent_falls_back_when_fake_useragent_fails(monkeypatch):
+    import scrapers.base_scraper as base_scraper
+
+    monkeypatch.setattr(base_scraper, "_UA_SOURCE", False)
+    assert base_scraper._random_user_agent() == base_scraper.ScraperConfig.DEFAULT_USER_AGENT
+
+
+def test_fragment_text_matches_soup_text():
+    from scrapers.investment_scrapers import TechCrunchScraper
+
+    scraper = TechCrunchScraper(use_cache=False)
+    markup = "Acme <b>raises</b> $5M<!-- note --><p>Led by X &amp; Y</p><script>track()</script>"
+
+    fast = scraper.clean_text(scraper._fragment_text(markup))
+    slow = scraper.clean_text(scraper._parse_html(markup).get_text("\n"))
+    assert fast == slow == "Acme raises $5M Led by X & Y"
+    assert scraper._fragment_text("") == ""
+    assert scraper._fragment_text("plain text") == "plain text"
+
+
+def test_keyword_re_matches_substring_any():
+    from scrapers.base_scraper import keyword_re
+
+    keywords = ["agent", "agentic", "ai", "gen", "generative ai", "series ", "c++"]
+    pattern = keyword_re(keywords)
+    samples = ["AGENTS", "a gent", "Generation", "SERIES B", "series", "C++ tools", "ml", ""]
+    for text in samples:
+        expected = any(k in text.lower() for k in keywords)
+        assert (pattern.search(text) is not None) == expected, text
+
+    assert keyword_re([]).search("anything") is None
+
+
+def test_parse_date_memoizes_repeated_strings():
+    from scrapers.base_scraper import _parse_date_text
+    from scrapers.event_scrapers import EventbriteScraper
+
+    scraper = EventbriteScraper(use_cache=False)
+    _parse_date_text.cache_clear()
+    for _ in range(3):
+        scraper.parse_date("  Tue, Mar 3, 2026 7:00 PM ")
+    info = _parse_date_text.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_cache_payload_json_matches_stdlib_semantics(tmp_path):
+    from datetime import datetime
+
+    cache = CacheManager(cache_dir=tmp_path)
+    payload = {"when": datetime(2026, 3, 3, 19, 0), 7: "int key", "html": "<p>é — ok</p>"}
+
+    cache.set("https://example.com/json", payload)
+    assert cache.get("https://example.com/json", max_age_hours=999) == {
+        "when": "2026-03-03 19:00:00",
+        "7": "int key",
+        "html": "<p>é — ok</p>",
+    }
+    # Entries written by the stdlib encoder (NaN tokens included) still decode.
+    assert CacheManager._decode(b'{"score": NaN, "n": 1}')["n"] == 1
+
+
+def test_expired_entry_is_not_decoded_unless_server_says_not_modified(monkeypatch):
+    import time
+    from datetime import timedelta
+
+    from scrapers.event_scrapers import EventbriteScraper
+
+    class FakeResponse:
+        def __init__(self, text):
+            self.status_code = 200
+            self.text = text
+            self.headers = {"ETag": f'"{text}"'}
+            self.elapsed = timedelta(milliseconds=5)
+
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        def __init__(self):
+            self.sent = []
+
+        def get(self, url, **kwargs):
+            self.sent.append(kwargs["headers"])
+            return FakeResponse(f"v{len(self.sent)}")
+
+    session = FakeSession()
+    scraper = EventbriteScraper(use_cache=True, session=session)
+    monkeypatch.setattr(scraper.rate_limiter, "wait_if_needed", lambda url=None: None)
+    url = "https://example.com/changed"
+    assert scraper._fetch_url(url) == "v1"
+
+    key = scraper.cache._get_cache_key(url)
+    scraper.cache._conn.execute("UPDATE cache SET ts = ? WHERE key = ?", (time.time() - 10**6, key))
+    decoded = []
+    real_decode = CacheManager._decode
+    monkeypatch.setattr(CacheManager, "_decode", staticmethod(lambda blob: decoded.append(blob) or real_decode(blob)))
+
+    # The page changed (200, not 304): the stale body is never decoded.
+    assert scraper._fetch_url(url) == "v2"
+    assert session.sent[1]["If-None-Match"] == '"v1"'
+    assert decoded == []
+
+
+def _stub_requests_cache(monkeypatch, responses):
+    """Install a minimal `requests_cache` whose CachedSession serves `responses`."""
+    import contextlib
+    import sys
+    import types
+    from datetime import timedelta
+
+    import requests
+
+    import scrapers.base_scraper as base
+
+    class FakeResponse:
+        def __init__(self, text, status_code=200, from_cache=False):
+            self.text = text
+            self.status_code = status_code
+            self.from_cache = from_cache
+            self.headers = {}
+            self.elapsed = timedelta(milliseconds=5)
+
+        def raise_for_status(self):
+            pass
+
+    class CachedSession(requests.Session):
+        def __init__(self, cache_name, **kwargs):
+            super().__init__()
+            self.cache_name = cache_name
+            self.cache = responses
+            self.sent = []
+
+        def get(self, url, only_if_cached=False, **kwargs):
+            if url in responses:
+                return FakeResponse(responses[url], from_cache=True)
+            if only_if_cached:
+                return FakeResponse("", status_code=504, from_cache=True)
+            self.sent.append(url)
+            responses[url] = f"body of {url}"
+            return FakeResponse(responses[url])
+
+        @contextlib.contextmanager
+        def cache_disabled(self):
+            yield
+
+    module = types.ModuleType("requests_cache")
+    module.CachedSession = CachedSession
+    monkeypatch.setitem(sys.modules, "requests_cache", module)
+    monkeypatch.setattr(base, "_SHARED_SESSIONS", {})
+    return CachedSession
+
+
+def test_http_cache_hit_does_not_spend_rate_limit_token(monkeypatch):
+    from scrapers.event_scrapers import EventbriteScraper
+
+    _stub_requests_cache(monkeypatch, {})
+    scraper = EventbriteScraper(use_cache=True)
+    assert scraper.http_cached
+    waits = []
+    monkeypatch.setattr(scraper.rate_limiter, "wait_if_needed", lambda url=None: waits.append(url))
+
+    url = "https://example.com/http-cached"
+    assert scraper._fetch_url(url) == f"body of {url}"
+    assert scraper._fetch_url(url) == f"body of {url}"
+
+    assert scraper.session.sent == [url]
+    assert waits == [url]
+
+
+def test_shared_cached_session_follows_cache_dir(tmp_path, monkeypatch):
+    from scrapers.base_scraper import get_shared_session
+
+    _stub_requests_cache(monkeypatch, {})
+    monkeypatch.setenv("NEWSLETTER_FACTORY_CACHE_DIR", str(tmp_path / "a"))
+    first = get_shared_session(use_cache=True)
+    assert get_shared_session(use_cache=True) is first
+
+    monkeypatch.setenv("NEWSLETTER_FACTORY_CACHE_DIR", str(tmp_path / "b"))
+    second = get_shared_session(use_cache=True)
+    assert second is not first
+    assert second.cache_name == str(tmp_path / "b" / "http")
+    assert get_shared_session(use_cache=False) is get_shared_session(use_cache=False)
+
+
+def test_refetch_after_304_for_vanished_entry_is_paced_and_recorded(monkeypatch):
+    import time
+    from datetime import timedelta
+
+    from scrapers.event_scrapers import EventbriteScraper
+
+    class FakeResponse:
+        def __init__(self, status_code, text="", headers=None):
+            self.status_code = status_code
+            self.text = text
+            self.headers = headers or {}
+            self.elapsed = timedelta(milliseconds=5)
+
+        def raise_for_status(self):
+            assert self.status_code < 400
+
+    responses = [
+        FakeResponse(200, "v1", {"ETag": '"abc"'}),
+        FakeResponse(304),
+        FakeResponse(200, "v2"),
+    ]
+    session = type("FakeSession", (), {"get": lambda self, url, **kw: responses.pop(0)})()
+    scraper = EventbriteScraper(use_cache=True, session=session)
+    waits, recorded = [], []
+    monkeypatch.setattr(scraper.rate_limiter, "wait_if_needed", lambda url=None: waits.append(url))
+    monkeypatch.setattr(
+        scraper.rate_limiter, "record_response", lambda url, status, latency=None: recorded.append(status)
+    )
+    url = "https://example.com/vanishing"
+    assert scraper._fetch_url(url) == "v1"
+
+    key = scraper.cache._get_cache_key(url)
+    scraper.cache._conn.execute("UPDATE cache SET ts = ? WHERE key = ?", (time.time() - 10**6, key))
+    # The entry disappears between reading its validators and the 304 arriving.
+    monkeypatch.setattr(type(scraper.cache), "touch", lambda self, url, params=None: None)
+
+    assert scraper._fetch_url(url) == "v2"
+    assert waits == [url, url, url]
+    assert recorded == [200, 304, 200]
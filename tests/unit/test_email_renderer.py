@@ -1,3 +1,5 @@
+import pytest
+
 from renderers.email_renderer import EmailRenderOptions, render_newsletter_email_html, export_eml_bytes
 
 
@@ -16,3 +18,44 @@ def test_export_eml_bytes_non_empty():
     data = export_eml_bytes(newsletter_markdown=md, options=options)
     assert isinstance(data, (bytes, bytearray))
     assert len(data) > 100
+
+
+def test_shared_markdown_converter_does_not_leak_state_between_renders():
+    pytest.importorskip("markdown")
+    from renderers.email_renderer import _markdown_to_html
+
+    first = _markdown_to_html("AI funding[^1]\n\n*[AI]: Artificial Intelligence\n\n[^1]: Example source\n")
+    assert "<abbr" in first and "footnote" in first
+
+    second = _markdown_to_html("AI events\n")
+    assert second == "<p>AI events</p>"
+
+
+def test_preview_and_eml_export_share_one_markdown_conversion():
+    from renderers.email_renderer import _markdown_to_html
+
+    md = "# Weekly\n\n- Acme raised $12M\n"
+    options = EmailRenderOptions(subject="Weekly")
+    _markdown_to_html.cache_clear()
+
+    html = render_newsletter_email_html(newsletter_markdown=md, options=options)
+    data = export_eml_bytes(newsletter_markdown=md, options=options)
+
+    assert "Acme raised $12M" in html and data
+    info = _markdown_to_html.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_write_eml_streams_a_parseable_message(tmp_path):
+    from email import message_from_bytes, policy
+
+    from renderers.email_renderer import write_eml
+
+    path = tmp_path / "draft.eml"
+    with open(path, "wb") as f:
+        write_eml(f, newsletter_markdown="# Hi\n\nFunding news\n", options=EmailRenderOptions(subject="Hi"))
+
+    msg = message_from_bytes(path.read_bytes(), policy=policy.default)
+    assert msg["Subject"] == "Hi"
+    assert msg.get_body(("html",)).get_content().count("Funding news") == 1
+    assert msg.get_body(("plain",)).get_content().startswith("# Hi")
@@ -30,3 +30,41 @@ def test_validate_event_accepts_ai_topic_even_if_name_generic():
     ev = DummyEvent(name="Foundations", description="", topics=["GenAI"])
     res = validate_event(ev)
     assert res.ok
+
+
+def test_validate_event_memoizes_ai_relevance_per_text():
+    from validation import _looks_ai_related
+
+    _looks_ai_related.cache_clear()
+    for _ in range(3):
+        assert validate_event(DummyEvent(name="LLM Night", description="Demos", topics=["NLP"])).ok
+
+    info = _looks_ai_related.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_validate_event_ai_gate_matches_inside_words_and_ignores_case():
+    assert validate_event(DummyEvent(name="OpenAI DevDay", description="")).ok
+    assert validate_event(DummyEvent(name="Build with ChatGPT", description="")).ok
+    assert validate_event(DummyEvent(name="Foundations", description="", topics=["Computer Vision"])).ok
+    assert not validate_event(DummyEvent(name="Pottery night", description="Bring clay", topics=["Crafts"])).ok
+
+
+def test_validate_event_memo_serves_slotted_events():
+    from scrapers.event_scrapers import AIEvent
+    from validation import _looks_ai_related
+
+    ev = AIEvent(
+        name="Agents Hack Night",
+        event_type="Hackathon",
+        date=datetime.now() + timedelta(days=5),
+        location="SF",
+        description="Build things",
+        topics=["GenAI"],
+        sources=[type("S", (), {"source_name": "X", "url": "https://example.com", "evidence_quote": None})()],
+    )
+    assert not hasattr(ev, "__dict__")
+
+    _looks_ai_related.cache_clear()
+    assert validate_event(ev).ok and validate_event(ev).ok
+    assert _looks_ai_related.cache_info().hits == 1
@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta
+
+from scrapers import event_scrapers
+from scrapers.event_scrapers import AIConferenceTracker, invalidate_curated_cache
+
+
+def test_major_conferences_memoized_per_cutoff_day(monkeypatch):
+    far = {**AIConferenceTracker.MAJOR_CONFERENCES[0], "name": "Far Future Conf", "date": datetime.now() + timedelta(days=400)}
+    monkeypatch.setattr(AIConferenceTracker, "MAJOR_CONFERENCES", AIConferenceTracker.MAJOR_CONFERENCES + [far])
+    invalidate_curated_cache()
+    try:
+        first = AIConferenceTracker.get_major_conferences(365)
+        second = AIConferenceTracker.get_major_conferences(365)
+        assert first == second and first is not second  # callers get their own list
+        assert event_scrapers._conferences_until.cache_info().hits == 1
+
+        assert "Far Future Conf" not in {e.name for e in first}
+        assert "Far Future Conf" in {e.name for e in AIConferenceTracker.get_major_conferences(500)}
+    finally:
+        monkeypatch.undo()
+        invalidate_curated_cache()
+
+    assert "Far Future Conf" not in {e.name for e in AIConferenceTracker.get_major_conferences(500)}
+
+
+def test_major_conferences_are_soonest_first():
+    dates = [e.date for e in AIConferenceTracker.get_major_conferences(3650)]
+    assert dates and dates == sorted(dates)
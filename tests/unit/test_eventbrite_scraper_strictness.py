@@ -1,11 +1,8 @@
-from bs4 import BeautifulSoup
-
-from scrapers.event_scrapers import EventbriteScraper
+from scrapers.event_scrapers import EventbriteScraper, parse_card_fragment
 
 
 def _card(html: str):
-    soup = BeautifulSoup(html, "lxml")
-    return soup.find("div")
+    return parse_card_fragment(html.strip())
 
 
 def test_eventbrite_does_not_invent_date_if_missing():
@@ -53,3 +50,52 @@ def test_eventbrite_accepts_ai_event_with_parseable_date():
     assert ev is not None
     assert ev.name == "Intro to AI for Beginners"
     assert ev.url == "https://example.com/event"
+
+
+def test_eventbrite_extract_topics_reports_overlapping_keywords():
+    scraper = EventbriteScraper(use_cache=False)
+    topics = scraper._extract_topics("Generative AI Safety Summit", "For ML startups")
+    assert topics == ["Machine Learning", "GenAI", "AI Safety", "Entrepreneurship"]
+
+
+def test_eventbrite_scrape_parses_only_cards(monkeypatch):
+    from datetime import datetime, timedelta
+
+    scraper = EventbriteScraper(use_cache=False)
+    when = (datetime.now() + timedelta(days=10)).strftime("%B %d, %Y")
+    page = f"""
+    <html><head><script>var big = 1;</script></head><body>
+      <nav><h3>Not an event</h3></nav>
+      <div class='discover-search-desktop-card'>
+        <h3>LLM Builders Meetup</h3>
+        <a href='https://example.com/e1'>link</a>
+        <time>{when}</time>
+        <p class='description'>Agents and AI</p>
+      </div>
+    </body></html>
+    """
+    monkeypatch.setattr(scraper, "_fetch_url", lambda *a, **k: page)
+
+    events = scraper.scrape(days_ahead=30)
+    assert [e.name for e in events] == ["LLM Builders Meetup"]
+
+
+def test_eventbrite_parse_event_card_accepts_bs4_tag():
+    from bs4 import BeautifulSoup
+
+    scraper = EventbriteScraper(use_cache=False)
+    html = """
+    <div class='discover-search-desktop-card'>
+      <h2>Fallback heading</h2><h3>AI Agents <b>Night</b></h3>
+      <a>no href</a><a href='https://example.com/e2'>link</a>
+      <p class='event-date'>March 3, 2026</p>
+      <p class='description'>Hands-on LLM demos</p>
+    </div>
+    """
+    from_tag = scraper._parse_event_card(BeautifulSoup(html, "lxml").find("div"))
+    from_tree = scraper._parse_event_card(_card(html))
+    assert from_tag is not None and from_tree is not None
+    assert from_tag.name == from_tree.name == "AI Agents Night"
+    assert from_tag.url == from_tree.url == "https://example.com/e2"
+    assert from_tag.date == from_tree.date
+    assert from_tag.description == "Hands-on LLM demos"
@@ -32,9 +32,8 @@ def test_facts_store_round_trip_investments(tmp_path):
     assert back.sources[0].url == "https://example.com"
 
 
-def test_facts_store_dedupes_investment(tmp_path):
-    db = tmp_path / "facts.sqlite"
-    store = FactsStore(db)
+def test_facts_store_dedupes_investment(facts_store):
+    store = facts_store
 
     inv = Investment(
         investor=Company("Sequoia", "d", "VC Firm"),
@@ -51,3 +50,166 @@ def test_facts_store_dedupes_investment(tmp_path):
 
     assert s1["investments_inserted"] == 1
     assert s2["investments_inserted"] == 0
+
+
+def test_facts_store_batches_upserts_in_one_transaction(facts_store):
+    import dataclasses
+
+    import pytest
+
+    from scrapers.event_scrapers import AIEvent
+
+    store = facts_store
+    invs = [
+        Investment(
+            investor=Company("Sequoia", "d", "VC Firm"),
+            investee=Company(f"Acme {i}", "d", "LLM"),
+            amount=10.0 + i,
+            stage=InvestmentStage.SEED,
+            date=datetime(2026, 2, 1),
+            sources=[FactSource(source_name="Example", url=f"https://example.com/{i}", evidence_quote="raised")],
+        )
+        for i in range(3)
+    ]
+    ev = AIEvent(
+        name="AI Summit",
+        event_type="Conference",
+        date=datetime(2026, 5, 1),
+        location="SF",
+        description="d",
+        url="https://example.com/summit",
+        sources=[FactSource(source_name="Example", url="https://example.com/summit")],
+    )
+
+    with store.transaction() as conn:
+        inv_stats = store.upsert_investments(invs + invs[:1], conn=conn)
+        ev_stats = store.upsert_events([ev], conn=conn)
+
+    assert inv_stats == {"investments_inserted": 3, "sources_inserted": 3}
+    assert ev_stats == {"events_inserted": 1, "sources_inserted": 1}
+
+    # A failure rolls back everything written in the transaction.
+    with pytest.raises(RuntimeError):
+        with store.transaction() as conn:
+            store.upsert_events([ev, dataclasses.replace(ev, name="Other")], conn=conn)
+            raise RuntimeError("boom")
+    assert [e.name for e in store.load_events(days_ahead=3650)] == ["AI Summit"]
+
+
+def test_in_memory_store_persists_and_backs_up_to_disk(tmp_path):
+    store = FactsStore()  # tests default to ":memory:"
+    assert store._memory_conn is not None
+
+    inv = Investment(
+        investor=Company("Sequoia", "d", "VC Firm"),
+        investee=Company("Acme AI", "d", "LLM"),
+        amount=12.0,
+        stage=InvestmentStage.SEED,
+        date=datetime(2026, 2, 1),
+        sources=[FactSource(source_name="Example", url="https://example.com", evidence_quote="Acme raised $12M")],
+    )
+    store.upsert_investments([inv])
+    assert [i.investee.name for i in store.load_investments(days_back=3650)] == ["Acme AI"]
+
+    store.backup_to(tmp_path / "out" / "facts.sqlite")
+    on_disk = FactsStore(tmp_path / "out" / "facts.sqlite")
+    loaded = on_disk.load_investments(days_back=3650)
+    assert [i.investee.name for i in loaded] == ["Acme AI"]
+    assert loaded[0].sources[0].url == "https://example.com"
+
+
+def test_fetch_recent_investments_is_newest_first_and_index_ordered(facts_store):
+    invs = [
+        Investment(
+            investor=Company("Sequoia", "d", "VC Firm"),
+            investee=Company(f"Acme {day}", "d", "LLM"),
+            amount=10.0,
+            stage=InvestmentStage.SEED,
+            date=datetime(2026, 2, day),
+            sources=[FactSource(source_name="Example", url=f"https://example.com/{day}")],
+        )
+        for day in (3, 9, 1, 7)
+    ]
+    facts_store.upsert_investments(invs)
+
+    recent = facts_store.fetch_recent_investments(2)
+    assert [i.investee.name for i in recent] == ["Acme 9", "Acme 7"]
+    assert recent[0].sources[0].url == "https://example.com/9"
+
+    plan = " ".join(
+        row[-1]
+        for row in facts_store._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM investments ORDER BY date DESC LIMIT 2"
+        )
+    )
+    assert "idx_investments_date" in plan and "TEMP B-TREE" not in plan
+
+
+def test_sources_without_url_are_not_duplicated(tmp_path):
+    import sqlite3
+
+    db = tmp_path / "facts.sqlite"
+    # Pre-index database that already holds duplicate URL-less sources.
+    legacy = sqlite3.connect(db)
+    legacy.executescript(
+        """
+        CREATE TABLE sources (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          parent_type TEXT NOT NULL, parent_id TEXT NOT NULL, source_name TEXT NOT NULL,
+          url TEXT, retrieved_at TEXT, evidence_quote TEXT,
+          UNIQUE(parent_type, parent_id, source_name, url, evidence_quote)
+        );
+        INSERT INTO sources(parent_type, parent_id, source_name) VALUES ('investment', 'inv:x', 'Feed');
+        INSERT INTO sources(parent_type, parent_id, source_name) VALUES ('investment', 'inv:x', 'Feed');
+        """
+    )
+    legacy.commit()
+    legacy.close()
+
+    store = FactsStore(db)
+    inv = Investment(
+        investor=Company("Sequoia", "d", "VC Firm"),
+        investee=Company("Acme AI", "d", "LLM"),
+        amount=12.0,
+        stage=InvestmentStage.SEED,
+        date=datetime(2026, 2, 1),
+        sources=[FactSource(source_name="Feed")],
+    )
+
+    assert store.upsert_investments([inv])["sources_inserted"] == 1
+    assert store.upsert_investments([inv])["sources_inserted"] == 0
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 2
+
+
+def test_upsert_skips_known_investments_but_keeps_new_evidence(tmp_path):
+    import dataclasses
+
+    import pytest
+
+    db = tmp_path / "facts.sqlite"
+    inv = Investment(
+        investor=Company("Sequoia", "d", "VC Firm"),
+        investee=Company("Acme AI", "d", "LLM"),
+        amount=12.0,
+        stage=InvestmentStage.SEED,
+        date=datetime(2026, 2, 1),
+        sources=[FactSource(source_name="Example", url="https://example.com/a")],
+    )
+    store = FactsStore(db)
+
+    # A rolled-back write must not be remembered as stored.
+    with pytest.raises(RuntimeError):
+        with store.transaction() as conn:
+            store.upsert_investments([inv], conn=conn)
+            raise RuntimeError("boom")
+    assert store.upsert_investments([inv, inv]) == {"investments_inserted": 1, "sources_inserted": 1}
+    assert store.upsert_investments([inv]) == {"investments_inserted": 0, "sources_inserted": 0}
+
+    # Same fact, new evidence: only the source is written.
+    more = dataclasses.replace(inv, sources=[FactSource(source_name="Other", url="https://example.com/b")])
+    assert store.upsert_investments([more]) == {"investments_inserted": 0, "sources_inserted": 1}
+
+    # A second store on the same file learns what is already there.
+    assert FactsStore(db).upsert_investments([inv, more]) == {"investments_inserted": 0, "sources_inserted": 0}
+    assert len(store.load_investments(days_back=3650)) == 1
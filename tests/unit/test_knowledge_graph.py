@@ -72,3 +72,110 @@ def test_derive_co_investments_creates_pair_edge_with_provenance():
     assert e.kind.value == "co_invested_with"
     assert e.derived_from
     assert e.sources
+
+
+def test_derive_co_investments_merges_many_investees_into_one_edge():
+    invs = []
+    for i in range(70):
+        invs.append(_inv("Sequoia", f"Startup {i}", url=f"https://example.com/s{i}"))
+        invs.append(_inv("a16z", f"Startup {i}", url=f"https://example.com/a{i}"))
+    kg = KnowledgeGraph().build_from_investments(invs)
+    assert kg.derive_co_investments() == 1
+
+    (_, _, e), = kg.top_co_investor_pairs(limit=5)
+    invested = [x for x in kg.edges.values() if x.kind.value == "invested_in"]
+    assert e.attrs["shared_count"] == 70
+    assert e.derived_from == [x.id for x in invested]
+    assert len(e.sources) == 140
+    # Sources are the investment edges' own objects, not copies.
+    assert all(a is b for a, b in zip(e.sources, (x.sources[0] for x in invested)))
+
+
+def test_to_json_dict_omits_internal_attrs():
+    import json
+
+    kg = KnowledgeGraph().build_from_investments(
+        [_inv("Sequoia", "Acme AI"), _inv("a16z", "Acme AI")]
+    )
+    kg.derive_co_investments()
+
+    d = kg.to_json_dict()
+    json.dumps(d)  # sets would not serialize
+    co = [e for e in d["edges"] if e["kind"] == "co_invested_with"]
+    assert co and co[0]["attrs"]["shared_investees"] == ["Acme AI"]
+    assert not any(k.startswith("_") for e in d["edges"] for k in e["attrs"])
+
+
+def test_iter_dot_streams_same_text_as_to_dot():
+    kg = KnowledgeGraph().build_from_investments(
+        [_inv("VC A", "Startup 1", 12.5), _inv("VC B", "Startup 1"), _inv("VC A", "Startup 2")]
+    )
+    kg.derive_co_investments()
+
+    chunks = list(kg.iter_dot())
+    assert len(chunks) == len(kg.nodes) + len(kg.edges) + 2
+    assert "".join(chunks) == kg.to_dot()
+
+
+def test_to_json_dict_shared_sources_serialize_independently():
+    kg = KnowledgeGraph().build_from_investments(
+        [
+            _inv("Sequoia", "Acme AI", 12.0, url="https://example.com/a"),
+            _inv("a16z", "Acme AI", 8.0, url="https://example.com/b"),
+        ]
+    )
+    kg.derive_co_investments()
+
+    edges = kg.to_json_dict()["edges"]
+    by_url = {}
+    for e in edges:
+        for s in e["sources"]:
+            by_url.setdefault(s["url"], []).append(s)
+
+    # The co-invest edge reuses the investment edges' sources.
+    shared = by_url["https://example.com/a"]
+    assert len(shared) == 2 and shared[0] == shared[1]
+    shared[0]["url"] = "changed"
+    assert shared[1]["url"] == "https://example.com/a"
+
+
+def test_upsert_company_reuses_node_for_name_variants():
+    kg = KnowledgeGraph()
+    first = kg.upsert_company(Company("Sequoia", "d", "VC Firm"))
+
+    assert kg.upsert_company(Company("Sequoia", "d", "VC Firm")) == first
+    assert kg.upsert_company(Company("  sequoia ", "d", "VC Firm")) == first
+    assert kg.upsert_company(Company("  sequoia ", "d", "VC Firm")) == first
+    assert len(kg.nodes) == 1
+
+
+def test_company_lookups_use_indexes_in_edge_order():
+    kg = KnowledgeGraph().build_from_investments(
+        [
+            _inv("Sequoia", "Acme AI", 12.0),
+            _inv("Acme AI", "Tiny Labs", 1.0),  # Acme is also an investor
+            _inv("a16z", "Acme AI", 8.0),
+            _inv("Sequoia", "Beta AI", 5.0),
+        ]
+    )
+    kg.derive_co_investments()
+    edges = list(kg.edges.values())
+
+    assert [n for n, _e in kg.portfolio_of("sequoia")] == ["Acme AI", "Beta AI"]
+    assert [n for n, _e in kg.investors_of("Acme AI")] == ["Sequoia", "a16z"]
+    assert kg.investments_for_company("Acme AI") == [edges[0], edges[1], edges[2]]
+    assert kg.investments_for_company("Tiny Labs") == [edges[1]]
+    assert kg.portfolio_of("Nobody") == []
+
+
+def test_derive_co_investments_reruns_only_after_graph_changes():
+    kg = KnowledgeGraph().build_from_investments(
+        [_inv("Sequoia", "Acme AI", 12.0), _inv("a16z", "Acme AI", 8.0)]
+    )
+    assert kg.derive_co_investments() == 1
+    assert kg.derive_co_investments() == 0
+
+    kg.add_investment(_inv("Benchmark", "Acme AI", 3.0))
+    assert kg.derive_co_investments() == 2
+    pair = kg.top_co_investor_pairs(limit=1)[0][2]
+    assert pair.attrs["shared_count"] == 1
@@ -29,3 +29,28 @@ def test_investment_format_amount_billions():
         date=datetime(2026, 2, 1),
     )
     assert inv.format_amount() == "$2.5B"
+
+
+def test_models_are_slotted():
+    import dataclasses
+
+    from models import FactSource
+
+    inv = Investment(
+        investor=Company("VC", "d", "VC Firm"),
+        investee=Company("Startup", "d", "LLM"),
+        amount=1.0,
+        stage=InvestmentStage.SEED,
+        date=datetime(2026, 2, 1),
+        sources=[FactSource(source_name="Example")],
+    )
+    assert not hasattr(inv, "__dict__")
+    assert not hasattr(inv.investee, "__dict__")
+    assert not hasattr(inv.sources[0], "__dict__")
+    assert dataclasses.replace(inv, amount=2.0).format_amount() == "$2.0M"
+
+
+def test_company_names_are_interned():
+    a = Company("".join(["Sequoia", " Capital"]), "d", "VC Firm")
+    b = Company("".join(["Sequoia ", "Capital"]), "d", "VC Firm")
+    assert a.name is b.name
@@ -1,5 +1,6 @@
 from parsing.extractors import (
     parse_money_usd_millions,
+    parse_money_usd_millions_many,
     infer_stage,
     extract_company_name_from_title,
     extract_investor_names,
@@ -27,6 +28,13 @@ def test_parse_money_none():
     assert parse_money_usd_millions("No funding amount here") is None
 
 
+def test_parse_money_many_matches_scalar():
+    texts = ["Startup raises $12M", "$1.2B round", "$10,000M", "No funding amount here", None]
+    out = parse_money_usd_millions_many(texts)
+    assert out.tolist()[:3] == [12.0, 1200.0, 10000.0]
+    assert out[3] != out[3] and out[4] != out[4]  # NaN
+
+
 def test_infer_stage_seed():
     assert infer_stage("seed round") == InvestmentStage.SEED
 
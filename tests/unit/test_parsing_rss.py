@@ -0,0 +1,44 @@
+import feedparser
+
+from parsing.rss import parse_rss_entries
+
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Feed</title>
+<item>
+  <title>Acme AI raises $20M &amp; more</title>
+  <link>https://example.com/acme</link>
+  <description><![CDATA[<p>Acme AI raised <b>$20 million</b>.</p>]]></description>
+  <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>
+  <pubDate>Tue, 03 Mar 2026 15:30:00 -0500</pubDate>
+</item>
+<item>
+  <title>No date</title>
+  <link>https://example.com/nodate</link>
+</item>
+</channel></rss>"""
+
+
+def test_parse_rss_entries_matches_feedparser_fields():
+    fast = parse_rss_entries(RSS)
+    slow = feedparser.parse(RSS).entries
+
+    assert len(fast) == len(slow) == 2
+    for a, b in zip(fast, slow):
+        assert a.title == b.title
+        assert a.link == b.link
+    assert fast[0].published_parsed[:6] == slow[0].published_parsed[:6] == (2026, 3, 3, 20, 30, 0)
+    assert fast[0].content == [{"value": "<p>Full body</p>"}]
+    assert "$20 million" in fast[0].summary
+    assert fast[1].published_parsed is None and fast[1].content == []
+
+
+def test_parse_rss_entries_falls_back_to_feedparser_for_atom():
+    atom = (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>x</title>'
+        "<entry><title>Atom entry</title><link href=\"https://example.com/a\"/>"
+        "<updated>2026-03-03T00:00:00Z</updated></entry></feed>"
+    )
+    entries = parse_rss_entries(atom)
+    assert [e.title for e in entries] == ["Atom entry"]
@@ -28,3 +28,27 @@ def test_entrepreneur_guidance_section_renders_evidence_when_present():
     out = EntrepreneurGuidanceSection([tip]).generate()
     assert "*Evidence:*" in out
     assert "https://example.com" in out
+
+
+def test_investment_highlights_section_layout():
+    from models import Company, Investment
+    from newsletter_factory import InvestmentStage
+    from sections import InvestmentHighlightsSection
+
+    inv = Investment(
+        investor=Company("Sequoia", "d", "VC Firm"),
+        investee=Company("Acme AI", "d", "LLM"),
+        amount=12.0,
+        stage=InvestmentStage.SEED,
+        date=datetime(2026, 2, 1),
+        key_insights=["Fast growth"],
+        sources=[FactSource(source_name="Example", url="https://example.com", evidence_quote="Acme raised $12M")],
+        confidence=0.7,
+    )
+
+    out = InvestmentHighlightsSection([inv]).generate()
+    assert out.endswith(
+        "\n### Acme AI - $12.0M\n- **Investor:** Sequoia\n- **Stage:** Seed\n- **Sector:** LLM\n"
+        "- **Date:** February 01, 2026\n- **Key Insights:**\n  - Fast growth\n- **Confidence:** 0.70\n"
+        "- **Evidence:** \"Acme raised $12M\"\n- **Source:** Example — https://example.com\n"
+    )
@@ -102,3 +102,39 @@ def test_validate_event_rejects_past_events(days_past: int):
     res = validate_event(ev, now=now)
     assert res.ok is False
     assert any("past" in r for r in res.reasons)
+
+
+def test_filter_valid_investments_fast_path_agrees_with_validator():
+    from validation import filter_valid_investments
+
+    src = [FactSource(source_name="Example", url="https://example.com/story")]
+
+    def inv(**kw):
+        base = dict(
+            investor=Company("VC", "d", "VC Firm"),
+            investee=Company("Startup", "d", "LLM"),
+            amount=10.0,
+            stage=InvestmentStage.SEED,
+            date=datetime.now() - timedelta(days=1),
+            sources=src,
+            confidence=0.7,
+        )
+        base.update(kw)
+        return Investment(**base)
+
+    items = [
+        inv(),
+        inv(amount=0.0),
+        inv(amount="n/a"),
+        inv(sources=[]),
+        inv(date=datetime.now() + timedelta(days=30)),
+        inv(confidence=1.5),
+        inv(investor=Company("", "d", "VC Firm")),
+    ]
+
+    valid, invalid = filter_valid_investments(items)
+
+    assert valid == [items[0]]
+    assert [i for i, _ in invalid] == items[1:]
+    assert all(validate_investment(i).ok is False for i, _ in invalid)
+    assert any("amount is not numeric" in r.reasons for _, r in invalid)
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from models import Investment, FactSource
@@ -31,6 +32,40 @@ def _has_grounding(sources: List[FactSource]) -> bool:
     return False
 
 
+_EVENT_AI_KEYWORDS = (
+    "ai",
+    "artificial intelligence",
+    "machine learning",
+    "ml",
+    "deep learning",
+    "llm",
+    "large language model",
+    "generative ai",
+    "genai",
+    "gpt",
+    "agents",
+    "agentic",
+)
+_EVENT_AI_TOPICS = ("ai", "genai", "llm", "nlp", "computer vision", "robotics", "ai safety")
+
+
+def _contains_any(text: str, keywords: Tuple[str, ...]) -> bool:
+    # Substring semantics on purpose (no word boundaries): "OpenAI" and "ChatGPT"
+    # must still count. One lower() plus C-level `in` scans beats an IGNORECASE
+    # alternation regex by ~10x here.
+    text = text.lower()
+    return any(k in text for k in keywords)
+
+
+@lru_cache(maxsize=20000)
+def _looks_ai_related(name: str, description: str, topics: Tuple[str, ...]) -> bool:
+    # Memoized: the same event is re-validated by the aggregator, preview and ingest.
+    # Topics first: a few short labels, and usually decisive for scraped AI events.
+    if topics and _contains_any(" ".join(topics), _EVENT_AI_TOPICS):
+        return True
+    return _contains_any(f"{name} {description}", _EVENT_AI_KEYWORDS)
+
+
 def validate_investment(inv: Investment, *, now: Optional[datetime] = None) -> ValidationResult:
     """Validate a scraped Investment.
 
@@ -91,27 +126,12 @@ def validate_event(event: object, *, now: Optional[datetime] = None) -> Validati
     if not name:
         reasons.append("missing event name")
 
-    # AI relevance gate: avoid publishing unrelated events.
-    ai_keywords = [
-        "ai",
-        "artificial intelligence",
-        "machine learning",
-        "ml",
-        "deep learning",
-        "llm",
-        "large language model",
-        "generative ai",
-        "genai",
-        "gpt",
-        "agents",
-        "agentic",
-    ]
-
+    # AI relevance gate: avoid publishing unrelated events. The search text is
+    # memoized on the event's text (not its identity), so slotted AIEvents and
+    # duck-typed objects hit the same cache.
     topics = getattr(event, "topics", []) or []
     description = getattr(event, "description", "") or ""
-    combined = f"{name or ''} {description}".lower()
-    topic_text = " ".join([str(t).lower() for t in topics])
-    if not any(k in combined for k in ai_keywords) and not any(k in topic_text for k in ["ai", "genai", "llm", "nlp", "computer vision", "robotics", "ai safety"]):
+    if not _looks_ai_related(name or "", description, tuple(map(str, topics))):
         reasons.append("event does not appear AI-related")
 
     date = getattr(event, "date", None)
@@ -133,13 +153,45 @@ def validate_event(event: object, *, now: Optional[datetime] = None) -> Validati
     return ValidationResult(ok=len(reasons) == 0, reasons=reasons)
 
 
+def _passes_investment_gates(inv: Investment, future_cutoff: datetime) -> bool:
+    """Conservative inline form of validate_investment's checks (no reasons list).
+
+    True only when validate_investment would accept `inv`; anything unusual
+    returns False and is left to the full validator.
+    """
+    try:
+        return bool(
+            inv.investee
+            and inv.investee.name
+            and inv.investor
+            and inv.investor.name
+            and float(inv.amount) > 0
+            and inv.date
+            and inv.date <= future_cutoff
+            and _has_grounding(inv.sources)
+            and 0 <= inv.confidence <= 1
+        )
+    except Exception:
+        return False
+
+
 def filter_valid_investments(investments: List[Investment]) -> Tuple[List[Investment], List[Tuple[Investment, ValidationResult]]]:
-    """Return (valid, invalid_with_reasons)."""
+    """Return (valid, invalid_with_reasons).
+
+    Items passing the inline gate skip building a ValidationResult; only the
+    rest go through validate_investment (which also collects the reasons).
+    """
     valid: List[Investment] = []
     invalid: List[Tuple[Investment, ValidationResult]] = []
 
+    now = datetime.now()
+    future_cutoff = now + timedelta(days=2)
+
     for inv in investments:
-        res = validate_investment(inv)
+        if _passes_investment_gates(inv, future_cutoff):
+            valid.append(inv)
+            continue
+        res = validate_investment(inv, now=now)
         if res.ok:
             valid.append(inv)
         else: